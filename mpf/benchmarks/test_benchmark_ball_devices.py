@@ -0,0 +1,110 @@
+import random
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkBallDevices(MpfTestCase):
+
+    """Simulate a machine with 10 ball devices and 6 balls."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/ball_devices/'
+
+    def get_platform(self):
+        return 'smart_virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+        self._edges = 0
+        self.machine.switch_controller.add_monitor(self._count_edge)
+
+    def _count_edge(self, change):
+        del change
+        self._edges += 1
+
+    def _output(self, name, start, end, edges):
+        print("{}: {} switch edges {:.2f}us per edge. Total: {:.3f}s".format(
+            name, edges, (1000000 * (end - start)) / edges, end - start))
+
+    def _hit(self, switch, state):
+        self.machine.switch_controller.process_switch(switch, state)
+
+    def _simulate(self, hit):
+        """Run the simulation and return the time it took.
+
+        Without hit the same time steps run without any switch edges.
+        """
+        random.seed(1)
+        start = time.time()
+        for _ in range(200):
+            # a ball bounces around the playfield
+            for _ in range(20):
+                switch = "s_pf{}".format(random.randint(1, 3))
+                hit(switch, 1)
+                self.advance_time_and_run(.01)
+                hit(switch, 0)
+                self.advance_time_and_run(.01)
+
+            # and rattles in a lock before it settles and is ejected
+            lock = random.randint(1, 8)
+            for _ in range(5):
+                hit("s_lock{}_1".format(lock), 1)
+                self.advance_time_and_run(.05)
+                hit("s_lock{}_1".format(lock), 0)
+                self.advance_time_and_run(.05)
+            hit("s_lock{}_1".format(lock), 1)
+            self.advance_time_and_run(3)
+        return time.time() - start
+
+    def testSimulation(self):
+        self.assertEqual(6, self.machine.ball_devices["bd_trough"].balls)
+        self.machine.playfield.add_ball(4)
+        self.advance_time_and_run(10)
+        self.machine.playfield.ball_search.enable()
+
+        # the time the loop needs to advance the clock is not caused by switches
+        idle = self._simulate(lambda switch, state: None)
+        self._edges = 0
+        total = self._simulate(self._hit)
+        print("Simulation: {} switch edges {:.2f}us per edge. Total: {:.3f}s Idle: {:.3f}s".format(
+            self._edges, (1000000 * (total - idle)) / self._edges, total, idle))
+
+    def testBallSwitchBounce(self):
+        self.advance_time_and_run(10)
+        start = time.time()
+        self._edges = 0
+        for _ in range(10000):
+            self._hit("s_lock1_1", 1)
+            self._hit("s_lock1_1", 0)
+        self.advance_time_and_run(1)
+        end = time.time()
+        self._output("Ball switch bounce", start, end, self._edges)
+
+    def testPlayfieldHitsWithBallSearch(self):
+        self.machine.playfield.add_ball(1)
+        self.advance_time_and_run(10)
+        self.machine.playfield.ball_search.enable()
+        start = time.time()
+        self._edges = 0
+        for _ in range(10000):
+            self._hit("s_pf1", 1)
+            self._hit("s_pf1", 0)
+        self.advance_time_and_run(1)
+        end = time.time()
+        self._output("Playfield hits with ball search", start, end, self._edges)
+
+    def testCountBalls(self):
+        self.advance_time_and_run(10)
+        num = 10000
+        start = time.time()
+        for _ in range(num):
+            self.machine.ball_controller._count_balls()
+        end = time.time()
+        print("Count balls in all devices: {:.2f}us".format((1000000 * (end - start)) / num))
@@ -0,0 +1,44 @@
+import time
+import unittest
+
+from mpf.platforms.fast.fast_led import FASTDirectLED, FASTLedEncoder
+from mpf.platforms.led_output_stage import LedFrameBuffer
+from mpf.platforms.openpixel import OpenPixelClient
+
+
+class BenchmarkLedOutput(unittest.TestCase):
+
+    num_leds = 1024
+
+    def _output(self, name, start, end, num):
+        print("Encode {} LEDs {}: {:.5f}ms per frame".format(self.num_leds, name, (1000 * (end - start)) / num))
+
+    def _benchmark(self, name, frame, encoder, num=1000):
+        callbacks = [lambda max_fade, value=value: (value / 255, 0) for value in range(256)]
+        start = time.time()
+        for i in range(num):
+            # change every third led
+            for channel in range(i % 3, len(frame), 9):
+                frame.set_fade(channel, callbacks[(channel + i) % 256])
+            frame.render()
+            dirty_range = frame.get_dirty_range()
+            if dirty_range:
+                encoder(frame, dirty_range[0], dirty_range[1])
+                frame.commit(dirty_range[0], dirty_range[1])
+        end = time.time()
+        self._output(name, start, end, num)
+
+    def testFast(self):
+        frame = LedFrameBuffer(hardware_fade_ms=0)
+        encoder = FASTLedEncoder()
+        for number in range(self.num_leds):
+            encoder.add_led(FASTDirectLED(hex(number)[2:].zfill(2), frame, len(frame)))
+            frame.resize(len(frame) + 3)
+
+        self._benchmark("FAST", frame, encoder)
+
+    def testOpenPixel(self):
+        client = OpenPixelClient(None, {})
+        client.add_pixel(0, self.num_leds * 3 - 1)
+
+        self._benchmark("OpenPixel", client.frames[0], lambda frame, start, end: client._encode(0, frame, start, end))
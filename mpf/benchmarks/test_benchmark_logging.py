@@ -0,0 +1,75 @@
+import logging
+import os
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+
+from mpf.core.logging import LogMixin, AsyncLogHandler
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkLogging(MpfTestCase):
+
+    """Pulse a coil from a switch with verbose logging to a file."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/logging/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        # log info in all modules
+        LogMixin.unit_test = True
+        super().setUp()
+        LogMixin.unit_test = False
+        self.root_logger = logging.getLogger()
+        self.addCleanup(self.root_logger.setLevel, self.root_logger.level)
+        self.addCleanup(setattr, logging, "_srcfile", logging._srcfile)
+        # only log to the handlers of the benchmark
+        self.addCleanup(setattr, self.root_logger, "handlers", self.root_logger.handlers)
+        self.root_logger.handlers = []
+
+    def _file_handler(self):
+        file_log = logging.FileHandler(os.devnull)
+        file_log.setFormatter(logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s'))
+        self.addCleanup(file_log.close)
+        return file_log
+
+    def _run(self, name, handler, level=logging.DEBUG):
+        self.root_logger.addHandler(handler)
+        self.root_logger.setLevel(level)
+
+        num = 10000
+        start = time.time()
+        for _ in range(num // 10):
+            for _ in range(10):
+                self.hit_and_release_switch("s_hit")
+            self.advance_time_and_run(.01)
+        end = time.time()
+
+        self.root_logger.removeHandler(handler)
+        print("{}: {:.2f}us per switch hit and coil pulse".format(name, 1000000 * (end - start) / num))
+
+    def testSwitchToCoil(self):
+        self._run("Logging off", logging.NullHandler(), 99)
+
+        queue = Queue()
+        listener = QueueListener(queue, self._file_handler())
+        listener.start()
+        self._run("QueueHandler", QueueHandler(queue))
+        listener.stop()
+
+        logging._srcfile = None
+        handler = AsyncLogHandler([self._file_handler()])
+        LogMixin.async_log_handler = handler
+        try:
+            handler.start()
+            self._run("AsyncLogHandler", handler)
+        finally:
+            LogMixin.async_log_handler = None
+            handler.stop()
@@ -0,0 +1,50 @@
+import time
+import tracemalloc
+import unittest
+
+from mpf.core.rgb_color import RGBColor, RGBColorCorrectionProfile
+
+
+class BenchmarkRGBColor(unittest.TestCase):
+
+    def _output(self, name, start, end, blocks, num):
+        print("{}: {:.5f}us per call {:.3f} new blocks per call".format(
+            name, (1000000 * (end - start)) / num, blocks / num))
+
+    def _benchmark(self, name, function, num=100000):
+        function()
+        start = time.time()
+        for _ in range(num):
+            function()
+        end = time.time()
+
+        # keep all results alive so every allocated result shows up in the snapshot
+        results = [None] * num
+        tracemalloc.start()
+        snapshot_start = tracemalloc.take_snapshot()
+        for i in range(num):
+            results[i] = function()
+        snapshot_end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        blocks = sum(stat.count_diff for stat in snapshot_end.compare_to(snapshot_start, "filename")
+                     if stat.count_diff > 0)
+        self._output(name, start, end, blocks, num)
+
+    def testParse(self):
+        self._benchmark("Parse name", lambda: RGBColor("red"))
+        self._benchmark("Parse hex", lambda: RGBColor("ff0000"))
+        self._benchmark("Parse brightness", lambda: RGBColor("red%50"))
+
+    def testCompare(self):
+        color = RGBColor("red")
+        other = RGBColor((255, 0, 0))
+        self._benchmark("Compare color", lambda: color == other)
+        self._benchmark("Compare string", lambda: color == "ff0000")
+
+    def testBlendAndCorrect(self):
+        color1 = RGBColor((128, 64, 0))
+        color2 = RGBColor((0, 32, 64))
+        profile = RGBColorCorrectionProfile.default()
+        self._benchmark("Blend", lambda: RGBColor.blend(color1, color2, 0.25))
+        self._benchmark("Correct", lambda: profile.apply(color1))
+        self._benchmark("Multiply", lambda: color1 * 0.5)
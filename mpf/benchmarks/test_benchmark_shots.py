@@ -0,0 +1,56 @@
+import time
+from unittest.mock import MagicMock
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkShots(MpfTestCase):
+
+    """Hit 10 shots which count in a counter 10,000 times."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/shots/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+        self.machine.playfield.add_ball = MagicMock()
+        self.machine.events.post('game_start')
+        self.advance_time_and_run(1)
+        self.machine.game.balls_in_play = 1
+        self.assertModeRunning("base")
+
+    def _run(self, name):
+        shots = [self.machine.shots["shot{}".format(i)] for i in range(1, 11)]
+        counter = self.machine.counters["counter_hits"]
+        num = 10000
+        start = time.time()
+        for i in range(num // 10):
+            for shot in shots:
+                shot.hit()
+                counter.count()
+            self.advance_time_and_run(.01)
+            if not i % 100:
+                # reset shots from lit to unlit
+                for shot in shots:
+                    shot.reset()
+        end = time.time()
+        print("{}: {:.2f}us per shot hit and count".format(name, 1000000 * (end - start) / num))
+
+    def testHits(self):
+        self._run("No handlers")
+        self.assertEqual(10000, self.machine.counters["counter_hits"].value)
+
+        for shot in self.machine.shots.values():
+            self.machine.events.add_handler("{}_hit".format(shot.name), lambda **kwargs: None)
+        self.machine.events.add_handler("logicblock_counter_hits_updated", lambda **kwargs: None)
+        self._run("With handlers")
+        self.assertEqual(20000, self.machine.counters["counter_hits"].value)
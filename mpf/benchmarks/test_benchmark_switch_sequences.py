@@ -0,0 +1,59 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkSwitchSequences(MpfTestCase):
+
+    """Drive orbits through two sequence shots and press flippers on a combo and timed switch."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/switch_sequences/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _print(self, name, start, end, edges):
+        print("{}: {:.2f}us per switch edge".format(name, 1000000 * (end - start) / edges))
+
+    def testOrbits(self):
+        self.mock_event("orbit_left_hit")
+        process_switch = self.machine.switch_controller.process_switch
+        num = 1000
+        start = time.time()
+        for _ in range(num):
+            # start many sequences which time out and complete one of them
+            for _ in range(50):
+                process_switch("s_orbit_left", 1, True)
+                process_switch("s_orbit_left", 0, True)
+            for switch in ("s_orbit_top", "s_orbit_right"):
+                process_switch(switch, 1, True)
+                process_switch(switch, 0, True)
+            self.advance_time_and_run(.1)
+        end = time.time()
+        self._print("Orbits", start, end, num * 52 * 2)
+        self.assertEventCalled("orbit_left_hit", num)
+
+    def testFlippers(self):
+        self.mock_event("flippers_both")
+        self.mock_event("flipper_hold_active")
+        num = 2000
+        start = time.time()
+        for _ in range(num):
+            self.hit_switch_and_run("s_flipper_left", .02)
+            self.hit_switch_and_run("s_flipper_right", .1)
+            self.release_switch_and_run("s_flipper_left", 0)
+            self.release_switch_and_run("s_flipper_right", .05)
+        end = time.time()
+        self._print("Flippers", start, end, num * 4)
+        self.assertEventCalled("flippers_both", num)
+        self.assertEventCalled("flipper_hold_active", num)
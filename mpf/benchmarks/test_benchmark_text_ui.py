@@ -0,0 +1,95 @@
+import time
+from unittest.mock import patch
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class NullScreen:
+
+    """Screen which counts drawn cells instead of writing to a terminal."""
+
+    width = 160
+    height = 50
+    dimensions = (50, 160)
+
+    def __init__(self):
+        self.cells = 0
+        self.refreshes = 0
+
+    @classmethod
+    def open(cls):
+        return cls()
+
+    def print_at(self, text, x, y, colour=7, attr=0, bg=0, transparent=False):
+        del x, y, colour, attr, bg, transparent
+        self.cells += len(text)
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def has_resized(self):
+        return False
+
+    def close(self, restore=True):
+        pass
+
+
+class BenchmarkTextUi(MpfTestCase):
+
+    """Process switch edges on a machine with 128 switches without text ui (-t)."""
+
+    text_ui = False
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/text_ui/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def getOptions(self):
+        options = super().getOptions()
+        options['text_ui'] = self.text_ui
+        return options
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        patcher = patch("mpf.core.text_ui.Screen", NullScreen)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def testSwitchEdges(self):
+        num = 20000
+        switches = ["s_switch{}".format(i % 128 + 1) for i in range(num)]
+        cells = refreshes = 0
+        if self.text_ui:
+            cells = self.machine.text_ui.screen.cells
+            refreshes = self.machine.text_ui.screen.refreshes
+
+        start = time.time()
+        # a busy playfield: 20 edges per 10ms
+        for i in range(0, num, 20):
+            for switch in switches[i:i + 20]:
+                self.hit_and_release_switch(switch)
+            self.advance_time_and_run(.01)
+        end = time.time()
+
+        print("{} text ui: {} switch edges {:.2f}us per edge. Loop time per 10ms: {:.3f}ms.".format(
+            "With" if self.text_ui else "Without", num * 2, 1000000 * (end - start) / (num * 2),
+            1000 * (end - start) / (num / 20)))
+        if self.text_ui:
+            print("Cells drawn per edge: {:.2f}. Refreshes: {}".format(
+                (self.machine.text_ui.screen.cells - cells) / (num * 2), self.machine.text_ui.screen.refreshes - refreshes))
+        self.machine.stop()
+
+
+class BenchmarkTextUiEnabled(BenchmarkTextUi):
+
+    """Process switch edges on a machine with 128 switches with text ui."""
+
+    text_ui = True
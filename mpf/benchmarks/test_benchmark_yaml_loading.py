@@ -0,0 +1,42 @@
+import fnmatch
+import os
+import time
+import unittest
+
+import ruamel.yaml as yaml
+
+from mpf.file_interfaces.yaml_interface import MpfLoader, MpfCLoader
+
+
+class BenchmarkYamlLoading(unittest.TestCase):
+
+    def setUp(self):
+        mpf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+        self.documents = []
+        for path, _, file_names in os.walk(mpf_path):
+            for file_name in fnmatch.filter(file_names, "*.yaml"):
+                with open(os.path.join(path, file_name), encoding='utf8') as f:
+                    self.documents.append(f.read())
+
+    def _benchmark(self, name, loader, iterations=5):
+        total = 0
+        for _ in range(iterations):
+            start = time.time()
+            for document in self.documents:
+                try:
+                    yaml.load(document, Loader=loader)
+                except Exception:   # pylint: disable-msg=broad-except
+                    # some test configs are broken on purpose
+                    pass
+            total += time.time() - start
+
+        print("Load {} files with {}: {:.5f}ms".format(len(self.documents), name, 1000 * total / iterations))
+        return total / iterations
+
+    def testBenchmark(self):
+        python_time = self._benchmark("MpfLoader", MpfLoader)
+        if MpfCLoader is None:
+            print("ruamel.yaml without libyaml. Cannot compare.")
+            return
+        c_time = self._benchmark("MpfCLoader", MpfCLoader)
+        print("Speedup: {:.2f}x".format(python_time / c_time))
@@ -8,11 +8,11 @@ import socket
 import sys
 from datetime import datetime
 import logging
-from logging.handlers import QueueHandler, SysLogHandler
-from queue import Queue
+from logging.handlers import SysLogHandler
 
 from asciimatics.screen import Screen
 
+from mpf.core.logging import AsyncLogHandler, LogMixin
 from mpf.core.machine import MachineController
 from mpf.core.utility_functions import Util
 from mpf.commands.logging_formatters import JSONFormatter
@@ -25,6 +25,7 @@ class Command(object):
     # pylint: disable-msg=too-many-locals,too-many-statements
     def __init__(self, mpf_path, machine_path, args):
         """Run mpf game."""
+        self.mode_timing_report = None
         signal.signal(signal.SIGINT, self.exit)
 
         parser = argparse.ArgumentParser(
@@ -147,6 +148,10 @@ class Command(object):
         parser.add_argument("--no-sound",
                             action="store_true", dest="no_sound", default=False)
 
+        parser.add_argument("--mode-timings",
+                            action="store_true", dest="mode_timings", default=False,
+                            help="Print how long modes took to start and stop when MPF exits")
+
         self.args = parser.parse_args(args)
         self.args.configfile = Util.string_to_list(self.args.configfile)
 
@@ -178,13 +183,6 @@ class Command(object):
         console_log.setFormatter(logging.Formatter(
             '%(levelname)s : %(name)s : %(message)s'))
 
-        # initialise async handler for console
-        console_log_queue = Queue()
-        console_queue_handler = QueueHandler(console_log_queue)
-        self.console_queue_listener = logging.handlers.QueueListener(
-            console_log_queue, console_log)
-        self.console_queue_listener.start()
-
         # initialise file log
         file_log = logging.FileHandler(full_logfile_path)
         if self.args.jsonlogging:
@@ -192,19 +190,7 @@ class Command(object):
         else:
             formatter = logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s')
         file_log.setFormatter(formatter)
-
-        # initialise async handler for file log
-        file_log_queue = Queue()
-        file_queue_handler = QueueHandler(file_log_queue)
-        self.file_queue_listener = logging.handlers.QueueListener(
-            file_log_queue, file_log)
-        self.file_queue_listener.start()
-
-        # add loggers
-        logger = logging.getLogger()
-        logger.addHandler(console_queue_handler)
-        logger.addHandler(file_queue_handler)
-        logger.setLevel(self.args.loglevel)
+        handlers = [console_log, file_log]
 
         if self.args.syslog_address:
             try:
@@ -214,11 +200,30 @@ class Command(object):
             else:
                 syslog_logger = SysLogHandler((host, int(port)))
 
-            logger.addHandler(syslog_logger)
+            handlers.append(syslog_logger)
+
+        # log entries are only enqueued in the calling thread. records are created, formatted and written to
+        # console, file and syslog in a background thread
+        self.log_handler = AsyncLogHandler(handlers)
+        self.log_handler.start()
+        LogMixin.async_log_handler = self.log_handler
+
+        # none of the formatters use the caller or thread of a record. skip looking them up for every record
+        logging._srcfile = None     # pylint: disable-msg=protected-access
+        logging.logThreads = 0
+        logging.logProcesses = 0
+
+        # add loggers
+        logger = logging.getLogger()
+        logger.addHandler(self.log_handler)
+        logger.setLevel(self.args.loglevel)
 
         try:
-            MachineController(mpf_path, machine_path, vars(self.args)).run()
+            machine = MachineController(mpf_path, machine_path, vars(self.args))
+            machine.run()
             logging.info("MPF run loop ended.")
+            if self.args.mode_timings:
+                self.mode_timing_report = machine.mode_controller.get_mode_timing_report()
             self.exit()
 
         # pylint: disable-msg=broad-except
@@ -241,14 +246,20 @@ class Command(object):
             logger = logging.getLogger()
 
             if self.args.text_ui:
+                # the console did not show any logs. print the last records before the crash
+                sys.stderr.write("Last log entries before the crash:\n")
+                self.log_handler.dump_ring(sys.stderr)
                 # Re-enable console logging to show the exception
                 logger.addHandler(logging.StreamHandler())
 
             logging.exception(exception)
 
+        if self.mode_timing_report:
+            print(self.mode_timing_report)
+
+        LogMixin.async_log_handler = None
+        self.log_handler.stop()
         logging.shutdown()
-        self.console_queue_listener.stop()
-        self.file_queue_listener.stop()
 
         if self.args.pause:
             input('Press ENTER to continue...')     # nosec
@@ -1,16 +1,18 @@
 import argparse
+import os
 import unittest
 import sys
 
 from mpf.commands import MpfCommandLineParser
 from mpf.tests.MpfDocTestCase import MpfDocTestCase
+from mpf.tests.parallel_runner import ParallelTestRunner
 
 subcommand = True
 
 
 class Command(MpfCommandLineParser):
 
-    """Run a text unit test from cli."""
+    """Run a text unit test or all tests in a folder from cli."""
 
     def __init__(self, args, path):
         """Parse args."""
@@ -21,8 +23,17 @@ class Command(MpfCommandLineParser):
 
         parser.add_argument("-v", help="verbose",
                             default=False, action="store_true", dest="verbose")
+        parser.add_argument("-j", help="number of processes to run tests in a folder (defaults to the number of cpus)",
+                            default=None, type=int, dest="jobs")
+        parser.add_argument("-p", help="pattern of test files in a folder",
+                            default="test*.py", dest="pattern")
+        parser.add_argument("--slowest", help="number of slowest tests to report",
+                            default=10, type=int, dest="slowest")
         args = parser.parse_args(self.argv[1:])
 
+        if os.path.isdir(test_file):
+            self._run_folder(test_file, args)
+
         with open(test_file) as f:
             test_string = f.read()
 
@@ -32,3 +43,12 @@ class Command(MpfCommandLineParser):
         result = unittest.TextTestRunner(verbosity=1 if not args.verbose else 99).run(suite)
 
         sys.exit(not result.wasSuccessful())
+
+    @staticmethod
+    def _run_folder(folder, args):
+        """Run all tests in folder in parallel and report boot and run times."""
+        suite = unittest.defaultTestLoader.discover(folder, pattern=args.pattern)
+        runner = ParallelTestRunner(jobs=args.jobs)
+        success = runner.run(suite)
+        runner.print_report(args.slowest)
+        sys.exit(not success)
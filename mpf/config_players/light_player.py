@@ -1,9 +1,18 @@
 """Light config player."""
-from copy import deepcopy
+from collections import namedtuple
+
 from mpf.config_players.device_config_player import DeviceConfigPlayer
 from mpf.core.rgb_color import RGBColor
 from mpf.core.utility_functions import Util
 
+LightPlayerEntry = namedtuple("LightPlayerEntry", ["light", "color", "fade_ms", "priority_offset"])
+"""One light of a light_player/show step with its settings resolved.
+
+color is an RGBColor, "on" or "stop".
+"""
+
+LightPlayerPlan = namedtuple("LightPlayerPlan", ["settings", "entries", "missing_lights"])
+
 
 class LightPlayer(DeviceConfigPlayer):
 
@@ -14,7 +23,17 @@ class LightPlayer(DeviceConfigPlayer):
     machine_collection_name = 'lights'
     allow_placeholders_in_keys = True
 
-    __slots__ = []
+    __slots__ = ["_plans"]
+
+    # limit the number of cached plans per context. this only matters for
+    # callers which play new settings dicts forever in a context which never
+    # clears (e.g. _global)
+    MAX_PLANS_PER_CONTEXT = 1000
+
+    def __init__(self, machine):
+        """Initialise light player."""
+        super().__init__(machine)
+        self._plans = {}
 
     def play(self, settings, context, calling_context, priority=0, **kwargs):
         """Set light color based on config."""
@@ -22,48 +41,97 @@ class LightPlayer(DeviceConfigPlayer):
         full_context = self._get_full_context(context)
         del kwargs
 
-        for light, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
-            if isinstance(light, str):
-                light_names = Util.string_to_list(light)
-                for light_name in light_names:
-                    # skip non-replaces placeholders
-                    if not light_name or light_name[0:1] == "(" and light_name[-1:] == ")":
-                        continue
-                    self._light_named_color(light_name, instance_dict, full_context, s['color'], s["fade"],
-                                            s['priority'])
+        plan = self._get_plan(settings, context)
+        if plan.missing_lights:
+            raise AssertionError("Could not find light or tag {} in {}".format(plan.missing_lights[0],
+                                                                               full_context))
+
+        for light, color, fade_ms, priority_offset in plan.entries:
+            if isinstance(color, str) and color == "stop":
+                self._light_remove(light, instance_dict, full_context, fade_ms)
             else:
-                self._light_color(light, instance_dict, full_context, s['color'], s["fade"], s['priority'])
+                light.color(color, key=full_context, fade_ms=fade_ms, priority=priority + priority_offset)
+                instance_dict[light.name] = light
 
     def _remove(self, settings, context, priority):
+        del priority
         instance_dict = self._get_instance_dict(context)
         full_context = self._get_full_context(context)
 
+        for light, _, fade_ms, _ in self._get_plan(settings, context).entries:
+            self._light_remove(light, instance_dict, full_context, fade_ms)
+
+    def _get_plan(self, settings, context) -> LightPlayerPlan:
+        """Return the resolved plan for settings.
+
+        Plans are cached per context until the context is cleared. Settings
+        must not be changed after they have been played. Shows replace their
+        tokens in a fresh copy of their steps for every show instance (which
+        uses its own context).
+        """
+        plans = self._plans.get(context)
+        if plans is None:
+            plans = self._plans[context] = {}
+
+        plan = plans.get(id(settings))
+        # the plan keeps a reference to settings. if it is the same object the id cannot have been reused
+        if plan is not None and plan.settings is settings:
+            return plan
+
+        if len(plans) >= self.MAX_PLANS_PER_CONTEXT:
+            plans.clear()
+
+        plan = self._compile_plan(settings)
+        plans[id(settings)] = plan
+        return plan
+
+    def _compile_plan(self, settings) -> LightPlayerPlan:
+        """Resolve light names/tags and colors in settings."""
+        entries = []
+        missing_lights = []
         for light, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
             if isinstance(light, str):
-                light_names = Util.string_to_list(light)
-                for light_name in light_names:
-                    self._light_remove_named(light_name, instance_dict, full_context, s['fade'])
+                lights = []
+                for light_name in Util.string_to_list(light):
+                    # skip non-replaces placeholders
+                    if not light_name or light_name[0:1] == "(" and light_name[-1:] == ")":
+                        continue
+                    lights_for_name = self._get_lights_by_name(light_name)
+                    if not lights_for_name:
+                        missing_lights.append(light_name)
+                    lights.extend(lights_for_name)
             else:
-                self._light_remove(light, instance_dict, full_context, s['fade'])
+                lights = [light]
+
+            if not lights:
+                continue
+
+            color = self._parse_color(s['color'])
+            priority_offset = s.get('priority', 0)
+            for light_obj in lights:
+                entries.append(LightPlayerEntry(light_obj, color, s['fade'], priority_offset))
+
+        return LightPlayerPlan(settings, entries, missing_lights)
 
-    def _light_remove_named(self, light_name, instance_dict, full_context, fade_ms):
+    def _get_lights_by_name(self, light_name):
         try:
-            lights = [self.machine.lights[light_name]]
+            return [self.machine.lights[light_name]]
         except KeyError:
-            lights = self.machine.lights.items_tagged(light_name)
+            return self.machine.lights.items_tagged(light_name)
 
-        for light in lights:
-            self._light_remove(light, instance_dict, full_context, fade_ms)
+    @staticmethod
+    def _parse_color(color):
+        """Return RGBColor for color or keep "on" and "stop"."""
+        if isinstance(color, RGBColor) or color in ("stop", "on"):
+            return color
+
+        # hack to keep compatibility for matrix_light values
+        if len(color) == 1:
+            color = "0" + color + "0" + color + "0" + color
+        elif len(color) == 2:
+            color = color + color + color
+
+        return RGBColor(color)
 
     @staticmethod
     def _light_remove(light, instance_dict, full_context, fade_ms):
@@ -80,36 +148,6 @@ class LightPlayer(DeviceConfigPlayer):
         else:
             self._remove(settings, context, priority)
 
-    # pylint: disable-msg=too-many-arguments
-    def _light_named_color(self, light_name, instance_dict,
-                           full_context, color, fade_ms, priority):
-        try:
-            lights = [self.machine.lights[light_name]]
-        except KeyError:
-            lights = self.machine.lights.items_tagged(light_name)
-
-        if not lights:
-            raise AssertionError("Could not find light or tag {} in {}".format(light_name, full_context))
-
-        for light in lights:
-            self._light_color(light, instance_dict, full_context, color, fade_ms, priority)
-
-    # pylint: disable-msg=too-many-arguments
-    def _light_color(self, light, instance_dict, full_context, color, fade_ms, priority):
-        if color == "stop":
-            self._light_remove(light, instance_dict, full_context, fade_ms)
-            return
-        if color != "on":
-            # hack to keep compatibility for matrix_light values
-            if len(color) == 1:
-                color = "0" + color + "0" + color + "0" + color
-            elif len(color) == 2:
-                color = color + color + color
-
-            color = RGBColor(color)
-        light.color(color, key=full_context, fade_ms=fade_ms, priority=priority)
-        instance_dict[light.name] = light
-
     def clear_context(self, context):
         """Remove all colors which were set in context."""
         full_context = self._get_full_context(context)
@@ -117,6 +155,7 @@ class LightPlayer(DeviceConfigPlayer):
             light.remove_from_stack_by_key(full_context)
 
         self._reset_instance_dict(context)
+        self._plans.pop(context, None)
 
     def get_express_config(self, value):
         """Parse express config."""
@@ -25,7 +25,7 @@ class RandomEventPlayer(ConfigPlayer):
         key = "random_{}.{}".format(context, calling_context)
         if settings['scope'] == "player":
             if not self.machine.game.player[key]:
-                self.machine.game.player[key] = Randomizer(settings['events'])
+                self.machine.game.player[key] = Randomizer(settings['events'], seed=settings['seed'])
                 r'''player_var: random_(x).(y)
 
                 desc: Holds references to Randomizer settings that need to be
@@ -44,7 +44,7 @@ class RandomEventPlayer(ConfigPlayer):
 
         else:
             if key not in self._machine_wide_dict:
-                self._machine_wide_dict[key] = Randomizer(settings['events'])
+                self._machine_wide_dict[key] = Randomizer(settings['events'], seed=settings['seed'])
 
             if settings['force_all']:
                 self._machine_wide_dict[key].force_all = True
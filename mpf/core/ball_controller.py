@@ -154,16 +154,9 @@ class BallController(MpfController):
             # special handling for troughs (needed for gottlieb)
             elif not device.config['ball_switches'] and 'trough' in device.tags:
                 balls += device.balls
-            else:
-                for switch in device.config['ball_switches']:
-                    if self.machine.switch_controller.is_active(
-                            switch.name, ms=device.config['entrance_count_delay']):
-                        balls += 1
-                    elif self.machine.switch_controller.is_inactive(
-                            switch.name, ms=device.config['exit_count_delay']):
-                        continue
-                    else:
-                        raise ValueError("switches not stable")
+            elif device.config['ball_switches']:
+                # the counter keeps the count of active switches up to date
+                balls += device.ball_count_handler.counter.count_balls_sync()
 
         return balls
 
@@ -45,6 +45,10 @@ class BallSearch(MpfController):
         """If True, ball search will be blocked and will not start."""
         self.callbacks = []     # type: List[BallSearchCallback]
 
+        # playfield switches only move the start time. the timer checks it when it fires
+        self._start_time = None
+        self._start_timer = None
+
         self.iteration = False
         """Current iteration of the ball search, or ``False`` if ball search
         is not started."""
@@ -144,7 +148,7 @@ class BallSearch(MpfController):
 
         self.debug_log("Disabling Ball Search")
         self.enabled = False
-        self.delay.remove('start')
+        self._cancel_start_timer()
 
     def block(self, **kwargs):
         """Block ball search for this playfield.
@@ -183,9 +187,23 @@ class BallSearch(MpfController):
             self.stop()
 
         if self.enabled:
-            self.debug_log("Resetting ball search timer")
-            self.delay.reset(name='start', callback=self.start,
-                             ms=self.playfield.config['ball_search_timeout'])
+            self._start_time = self.machine.clock.get_time() + self.playfield.config['ball_search_timeout'] / 1000.0
+            if not self._start_timer:
+                self._start_timer = self.machine.clock.schedule_at(self._check_start_time, self._start_time)
+
+    def _check_start_time(self):
+        """Start ball search if no playfield switch was hit since the timer was scheduled."""
+        self._start_timer = None
+        if self.machine.clock.get_time() < self._start_time:
+            self._start_timer = self.machine.clock.schedule_at(self._check_start_time, self._start_time)
+            return
+
+        self.start()
+
+    def _cancel_start_timer(self):
+        if self._start_timer:
+            self.machine.clock.unschedule(self._start_timer)
+            self._start_timer = None
 
     def start(self):
         """Start ball search the ball search process."""
@@ -1,33 +1,184 @@
 """MPF clock and main loop."""
 import asyncio
+import math
 from functools import partial
 
-from typing import Tuple, Generator
+from typing import Tuple, Generator, Dict, List
 
 from serial_asyncio import create_serial_connection
 
 from mpf.core.logging import LogMixin
 
 
+class WheelTimer:
+
+    """One callback in the timer wheel.
+
+    It can be canceled like an asyncio handle.
+    """
+
+    __slots__ = ["_callback", "_slot", "_wheel", "_canceled"]
+
+    def __init__(self, callback, slot: "TimerSlot", wheel: "TimerWheel") -> None:
+        """Initialise timer."""
+        self._callback = callback
+        self._slot = slot
+        self._wheel = wheel
+        self._canceled = False
+
+    def cancel(self):
+        """Cancel timer if it did not run yet."""
+        if self._slot is None:
+            return
+        self._canceled = True
+        self._wheel.remove_timer(self._slot)
+        self._slot = None
+
+    def cancelled(self) -> bool:
+        """Return true if the timer has been canceled."""
+        return self._canceled
+
+
+class TimerSlot:
+
+    """All timers which are due at the same slot in the wheel."""
+
+    __slots__ = ["key", "timers", "live", "handle"]
+
+    def __init__(self, key) -> None:
+        """Initialise slot."""
+        self.key = key
+        self.timers = []    # type: List[WheelTimer]
+        self.live = 0
+        self.handle = None  # type: asyncio.TimerHandle
+
+
+class TimerWheel:
+
+    """Hashed timer wheel which groups timers by their due time.
+
+    Timers which are due in the same slot share one loop callback. With a
+    resolution of 0 only timers with exactly the same due time share a slot
+    and no timer runs later than it would with loop.call_at. With a resolution
+    timers are rounded up to the next multiple of it.
+
+    Canceling a timer is O(1). When the last timer of a slot is canceled the
+    loop callback of the slot is canceled as well.
+    """
+
+    __slots__ = ["loop", "resolution", "_slots", "active_timers", "ticks", "callbacks_run", "last_tick_callbacks",
+                 "max_tick_callbacks"]
+
+    def __init__(self, loop, resolution: float = 0) -> None:
+        """Initialise timer wheel."""
+        self.loop = loop
+        self.resolution = resolution
+        self._slots = {}                # type: Dict[float, TimerSlot]
+        self.active_timers = 0
+        self.ticks = 0
+        self.callbacks_run = 0
+        self.last_tick_callbacks = 0
+        self.max_tick_callbacks = 0
+
+    def call_at(self, when: float, callback) -> WheelTimer:
+        """Call callback at when (or at the end of its slot)."""
+        if self.resolution:
+            key = math.ceil(when / self.resolution)
+            due_time = key * self.resolution
+        else:
+            key = due_time = when
+
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = TimerSlot(key)
+            slot.handle = self.loop.call_at(due_time, self._run_slot, slot)
+            self._slots[key] = slot
+
+        timer = WheelTimer(callback, slot, self)
+        slot.timers.append(timer)
+        slot.live += 1
+        self.active_timers += 1
+        return timer
+
+    def call_later(self, delay: float, callback) -> WheelTimer:
+        """Call callback in delay seconds."""
+        return self.call_at(self.loop.time() + delay, callback)
+
+    def remove_timer(self, slot: TimerSlot):
+        """Account a canceled timer in slot."""
+        slot.live -= 1
+        self.active_timers -= 1
+        if not slot.live:
+            slot.handle.cancel()
+            if self._slots.get(slot.key) is slot:
+                del self._slots[slot.key]
+
+    # pylint: disable-msg=protected-access
+    def _run_slot(self, slot: TimerSlot):
+        """Run all timers in slot which have not been canceled."""
+        if self._slots.get(slot.key) is slot:
+            del self._slots[slot.key]
+
+        count = 0
+        for timer in slot.timers:
+            if timer._slot is None:
+                continue
+            timer._slot = None
+            self.active_timers -= 1
+            count += 1
+            try:
+                timer._callback()
+            except Exception as exc:     # pylint: disable-msg=broad-except
+                # same as asyncio does for failing callbacks. the other timers in this slot still run
+                self.loop.call_exception_handler({
+                    'message': 'Exception in timer callback {}'.format(timer._callback),
+                    'exception': exc,
+                })
+
+        self.ticks += 1
+        self.callbacks_run += count
+        self.last_tick_callbacks = count
+        self.max_tick_callbacks = max(self.max_tick_callbacks, count)
+
+    @property
+    def pending_slots(self) -> int:
+        """Return number of slots with a loop callback."""
+        return len(self._slots)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return counters of the wheel."""
+        return {
+            "active_timers": self.active_timers,
+            "pending_slots": len(self._slots),
+            "ticks": self.ticks,
+            "callbacks_run": self.callbacks_run,
+            "avg_tick_callbacks": self.callbacks_run / self.ticks if self.ticks else 0.0,
+            "last_tick_callbacks": self.last_tick_callbacks,
+            "max_tick_callbacks": self.max_tick_callbacks,
+        }
+
+
 class PeriodicTask:
 
-    """A periodic asyncio task."""
+    """A periodic task in the timer wheel."""
 
-    __slots__ = ["_canceled", "_interval", "_callback", "_loop", "_last_call"]
+    __slots__ = ["_canceled", "_interval", "_callback", "_loop", "_last_call", "_wheel", "_timer"]
 
-    def __init__(self, interval, loop, callback):
+    def __init__(self, interval, loop, callback, wheel: TimerWheel = None):
         """Initialise periodic task."""
         self._canceled = False
         self._interval = interval
         self._callback = callback
         self._loop = loop
+        self._wheel = wheel if wheel else TimerWheel(loop)
+        self._timer = None      # type: WheelTimer
         self._last_call = self._loop.time()
         self._schedule()
 
     def _schedule(self):
         if self._canceled:
             return
-        self._loop.call_at(self._last_call + self._interval, self._run)
+        self._timer = self._wheel.call_at(self._last_call + self._interval, self._run)
 
     def get_next_call_time(self):
         """Return time of next call."""
@@ -43,13 +194,16 @@ class PeriodicTask:
     def cancel(self):
         """Cancel periodic task."""
         self._canceled = True
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
 
 
 class ClockBase(LogMixin):
 
     """A clock object with event support."""
 
-    __slots__ = ["machine", "loop"]
+    __slots__ = ["machine", "loop", "timer_wheel"]
 
     def __init__(self, machine=None, loop=None):
         """Initialise clock."""
@@ -71,6 +225,12 @@ class ClockBase(LogMixin):
         else:
             self.loop = loop                        # type: asyncio.BaseEventLoop
 
+        self.timer_wheel = TimerWheel(self.loop)
+
+    def set_timer_resolution(self, resolution: float):
+        """Set resolution of the timer wheel in seconds. Only affects timers scheduled later."""
+        self.timer_wheel.resolution = resolution
+
     # pylint: disable-msg=no-self-use
     def _create_event_loop(self):
         try:
@@ -162,12 +322,12 @@ class ClockBase(LogMixin):
             timeout: seconds to wait
 
         Returns:
-            A :class:`ClockEvent` instance.
+            A :class:`WheelTimer` instance.
         """
         if not callable(callback):
             raise AssertionError('callback must be a callable, got %s' % callback)
 
-        event = self.loop.call_later(delay=timeout, callback=callback)
+        event = self.timer_wheel.call_later(timeout, callback)
 
         if self._debug_to_console or self._debug_to_file:
             self.debug_log("Scheduled a one-time clock callback (callback=%s, timeout=%s)",
@@ -175,6 +335,21 @@ class ClockBase(LogMixin):
 
         return event
 
+    def schedule_at(self, callback, when):
+        """Schedule an event at clock time <when>.
+
+        Args:
+            callback: callback to call
+            when: clock time (see get_time) to call callback at
+
+        Returns:
+            A :class:`WheelTimer` instance.
+        """
+        if not callable(callback):
+            raise AssertionError('callback must be a callable, got %s' % callback)
+
+        return self.timer_wheel.call_at(when, callback)
+
     def schedule_interval(self, callback, timeout):
         """Schedule an event to be called every <timeout> seconds.
 
@@ -188,7 +363,7 @@ class ClockBase(LogMixin):
         if not callable(callback):
             raise AssertionError('callback must be a callable, got {}'.format(callback))
 
-        periodic_task = PeriodicTask(timeout, self.loop, callback)
+        periodic_task = PeriodicTask(timeout, self.loop, callback, self.timer_wheel)
 
         if self._debug_to_console or self._debug_to_file:
             self.debug_log("Scheduled a recurring clock callback (callback=%s, timeout=%s)",
@@ -115,9 +115,12 @@ class ConfigProcessor(object):
 
         # Step 5: Store to cache
         if store_to_cache:
-            with open(cache_file, 'wb') as f:
+            # write to a temporary file first. other processes might load the cache at the same time
+            tmp_file = "{}.{}".format(cache_file, os.getpid())
+            with open(tmp_file, 'wb') as f:
                 pickle.dump((config, loaded_files), f, protocol=4)
-                self.log.info('Config file cache created: %s', cache_file)
+            os.replace(tmp_file, cache_file)
+            self.log.info('Config file cache created: %s', cache_file)
 
         return config
 
@@ -125,11 +125,14 @@ class ConfigValidator(object):
         config = YamlInterface.process(config_str)
         config = self._process_config_spec(config, "root")
 
-        with open(cache_file, 'wb') as f:
+        # write to a temporary file first. other processes might load the cache at the same time
+        tmp_file = "{}.{}".format(cache_file, os.getpid())
+        with open(tmp_file, 'wb') as f:
             pickle.dump(config, f, protocol=4)
-            self.log.info('Config spec file cache created: %s', cache_file)
+        os.replace(tmp_file, cache_file)
+        self.log.info('Config spec file cache created: %s', cache_file)
 
-        ConfigValidator.class_cache = deepcopy(self.config_spec)
+        ConfigValidator.class_cache = deepcopy(config)
         self.config_spec = config
 
     def _process_config_spec(self, spec, path):
@@ -17,7 +17,7 @@ class DataManager(MpfController):
 
     config_name = "data_manager"
 
-    __slots_ = ["name", "min_wait_secs", "filename", "data", "_dirty"]
+    __slots_ = ["name", "min_wait_secs", "filename", "data", "_dirty", "_snapshot", "_snapshot_pending"]
 
     def __init__(self, machine, name, min_wait_secs=1):
         """Initialise data manger.
@@ -49,6 +49,8 @@ class DataManager(MpfController):
 
         self.data = dict()
         self._dirty = threading.Event()
+        self._snapshot = None
+        self._snapshot_pending = False
 
         if self.filename:
             self._setup_file()
@@ -103,8 +105,25 @@ class DataManager(MpfController):
             return dict()
 
     def _trigger_save(self):
-        """Trigger a write of this DataManager's data to the disk."""
+        """Trigger a write of this DataManager's data to the disk.
+
+        Callers may keep changing the dict they passed in. It is copied once
+        after the current callbacks in the event loop so a burst of saves
+        (e.g. audits for every player at the end of a game) results in one
+        copy and one write. The writing thread never touches live data.
+        """
+        if self._snapshot_pending or not self.filename:
+            return
         self.debug_log("Will write %s to disk", self.name)
+        self._snapshot_pending = True
+        self.machine.clock.loop.call_soon(self._take_snapshot)
+
+    def _take_snapshot(self):
+        """Copy data for the writing thread."""
+        if not self._snapshot_pending:
+            return
+        self._snapshot_pending = False
+        self._snapshot = copy.deepcopy(self.data)
         self._dirty.set()
 
     def save_all(self, data):
@@ -112,6 +131,21 @@ class DataManager(MpfController):
         self.data = data
         self._trigger_save()
 
+    def save_keys(self, changed, removed=None):
+        """Update or add the keys in changed and remove all keys in removed."""
+        # replace data instead of changing it because the writing thread may copy it at the same time
+        data = dict(self.data)
+        data.update(changed)
+        for key in removed or []:
+            data.pop(key, None)
+        self.data = data
+        self._trigger_save()
+
+    def _write(self):
+        self.debug_log("Writing %s to: %s", self.name, self.filename)
+        # writes to a temp file which replaces the old file after it is on disk
+        FileManager.save(self.filename, self._snapshot)
+
     def _writing_thread(self):  # pragma: no cover
         # prevent early writes at start-up
         time.sleep(self.min_wait_secs)
@@ -119,14 +153,14 @@ class DataManager(MpfController):
             if not self._dirty.wait(1):
                 continue
             self._dirty.clear()
-
-            data = copy.deepcopy(self.data)
-            self.debug_log("Writing %s to: %s", self.name, self.filename)
-            # save data
-            FileManager.save(self.filename, data)
+            self._write()
             # prevent too many writes
             time.sleep(self.min_wait_secs)
 
+        # the loop will no longer take a snapshot during shutdown
+        if self._snapshot_pending:
+            self._take_snapshot()
+
         # if dirty write data one last time during shutdown
         if self._dirty.is_set():
-            FileManager.save(self.filename, data)
+            self._write()
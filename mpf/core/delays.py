@@ -83,9 +83,9 @@ class DelayManager(MpfController):
         self.debug_log("Adding delay. Name: '%s' ms: %s, callback: %s, "
                        "kwargs: %s", name, ms, callback, kwargs)
 
-        if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
-            del self.delays[name]
+        old_delay = self.delays.pop(name, None)
+        if old_delay is not None:
+            old_delay.cancel()
 
         self.delays[name] = self.machine.clock.schedule_once(
             partial(self._process_delay_callback, name, callback, **kwargs),
@@ -104,12 +104,9 @@ class DelayManager(MpfController):
                 delay with this name, that's ok. Nothing happens.
         """
         self.debug_log("Removing delay: '%s'", name)
-        if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
-            try:
-                del self.delays[name]
-            except KeyError:
-                pass
+        delay = self.delays.pop(name, None)
+        if delay is not None:
+            delay.cancel()
 
     def add_if_doesnt_exist(self, ms: int, callback: Callable[..., None],
                             name: str, **kwargs) -> str:
@@ -167,18 +164,15 @@ class DelayManager(MpfController):
             String name or UUID4 of the delay which you can use to remove it
             later.
         """
-        if name in self.delays:
-            self.remove(name)
-
+        # add cancels the old delay with this name
         return self.add(ms, callback, name, **kwargs)
 
     def clear(self) -> None:
         """Remove (clear) all the delays associated with this DelayManager."""
-        for name in list(self.delays.keys()):
-            self.machine.clock.unschedule(self.delays[name])
-            self.remove(name)
-
+        delays = self.delays
         self.delays = {}
+        for delay in delays.values():
+            delay.cancel()
 
     def run_now(self, name: str):
         """Run a delay callback now instead of waiting until its time comes.
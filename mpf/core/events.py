@@ -1,5 +1,6 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
+import time
 from collections import deque, namedtuple
 import uuid
 
@@ -20,6 +21,8 @@ if MYPY:   # pragma: no cover
 EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
                                                      "blocking_facility"])
+PreparedHandler = namedtuple("PreparedHandler", ["event", "callback", "priority", "kwargs", "condition",
+                                                 "blocking_facility"])
 PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
 
 
@@ -29,7 +32,8 @@ class EventManager(MpfController):
 
     config_name = "event_manager"
 
-    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks"]
+    __slots__ = ["registered_handlers", "event_queue", "callback_queue", "monitor_events", "_queue_tasks",
+                 "_family_cache", "handler_timings"]
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize EventManager."""
@@ -40,6 +44,10 @@ class EventManager(MpfController):
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
         self._queue_tasks = []              # type: List[asyncio.Task]
+        # (prefix, suffix) -> true if any event of that family has handlers. cleared when events are added/removed
+        self._family_cache = {}             # type: Dict[Tuple[str, str], bool]
+        # event -> [calls, total secs, max secs] spent in handlers. only recorded when set to a dict
+        self.handler_timings = None         # type: Dict[str, List[float]]
 
         self.add_handler("debug_dump_stats", self._debug_dump_events)
 
@@ -138,6 +146,18 @@ class EventManager(MpfController):
         for handler in handler_list:
         ``events.remove_handler(my_handler)``
         """
+        prepared_handler = self.prepare_handler(event, handler, priority, blocking_facility, **kwargs)
+        return self.add_prepared_handlers([prepared_handler])[0]
+
+    def prepare_handler(self, event: str, handler: Any, priority: int = 1, blocking_facility: Any = None,
+                        **kwargs) -> PreparedHandler:
+        """Validate a handler and return it ready to be added via ``add_prepared_handlers``.
+
+        This does all the expensive work of ``add_handler`` (signature
+        inspection and condition parsing) once. Callers which add the same
+        handlers over and over again (e.g. modes) can keep the result and add
+        it in bulk later.
+        """
         if not callable(handler):
             raise ValueError('Cannot add handler "{}" for event "{}". Did you '
                              'accidentally add parenthesis to the end of the '
@@ -158,37 +178,62 @@ class EventManager(MpfController):
 
         event, condition = self.get_event_and_condition_from_string(event)
 
-        # Add an entry for this event if it's not there already
-        if event not in self.registered_handlers:
-            self.registered_handlers[event] = []
-
-        key = uuid.uuid4()
-
-        # An event 'handler' in our case is a tuple with 4 elements:
-        # the handler method, priority, dict of kwargs, & uuid key
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
-                                                                 blocking_facility))
+        return PreparedHandler(event, handler, priority, kwargs, condition, blocking_facility)
 
-        if self._debug:
-            try:
-                self.debug_log("Registered %s as a handler for '%s', priority: %s, "
-                               "kwargs: %s",
-                               (str(handler).split(' '))[2], event, priority, kwargs)
-            except IndexError:
-                pass
+    def add_prepared_handlers(self, prepared_handlers: List[PreparedHandler],
+                              priority_offset: int = 0) -> List[EventHandlerKey]:
+        """Add multiple handlers returned by ``prepare_handler``.
+
+        Every affected event is sorted only once.
+
+        Args:
+            prepared_handlers: List of handlers returned by ``prepare_handler``.
+            priority_offset: Added to the priority of every handler.
+
+        Returns a list with one key per handler (in the same order).
+        """
+        keys = []
+        events = []
+        for prepared_handler in prepared_handlers:
+            event = prepared_handler.event
+            # Add an entry for this event if it's not there already
+            if event not in self.registered_handlers:
+                self.registered_handlers[event] = []
+                self._family_cache.clear()
+
+            key = uuid.uuid4()
+            priority = prepared_handler.priority + priority_offset
+
+            self.registered_handlers[event].append(RegisteredHandler(
+                prepared_handler.callback, priority, prepared_handler.kwargs, key, prepared_handler.condition,
+                prepared_handler.blocking_facility))
+
+            if self._debug:
+                try:
+                    self.debug_log("Registered %s as a handler for '%s', priority: %s, "
+                                   "kwargs: %s",
+                                   (str(prepared_handler.callback).split(' '))[2], event, priority,
+                                   prepared_handler.kwargs)
+                except IndexError:
+                    pass
+
+            keys.append(EventHandlerKey(key, event))
+            if event not in events:
+                events.append(event)
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+        for event in events:
+            # Sort the handlers for this event based on priority. We do it now
+            # so the list is pre-sorted so we don't have to do that with each
+            # event post.
+            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
 
-        if self._info:
-            self._verify_handlers(event, self.registered_handlers[event])
+            if self._info:
+                self._verify_handlers(event, self.registered_handlers[event])
 
-        return EventHandlerKey(key, event)
+        return keys
 
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
@@ -270,6 +315,7 @@ class EventManager(MpfController):
         """
         if event in self.registered_handlers:
             del self.registered_handlers[event]
+            self._family_cache.clear()
 
     def remove_handler(self, method: Any) -> None:
         """Remove an event handler from all events a method is registered to handle.
@@ -338,8 +384,22 @@ class EventManager(MpfController):
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
+        keys_by_event = {}     # type: Dict[str, set]
         for key in key_list:
-            self.remove_handler_by_key(key)
+            keys_by_event.setdefault(key.event, set()).add(key.key)
+
+        # filter every event only once instead of scanning it per key
+        for event, keys in keys_by_event.items():
+            if event not in self.registered_handlers:
+                continue
+            handlers = self.registered_handlers[event]
+            if self._debug:
+                for handler_tup in handlers:
+                    if handler_tup.key in keys:
+                        self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2],
+                                       event)
+            handlers[:] = [handler_tup for handler_tup in handlers if handler_tup.key not in keys]
+            self._remove_event_if_empty(event)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -350,6 +410,7 @@ class EventManager(MpfController):
 
         if not self.registered_handlers[event]:  # if value is empty list
             del self.registered_handlers[event]
+            self._family_cache.clear()
             if self._debug:
                 self.debug_log("Removing event %s since there are no more"
                                " handlers registered for it", event)
@@ -388,6 +449,25 @@ class EventManager(MpfController):
         """
         return event_name in self.registered_handlers
 
+    def has_handlers_for_family(self, prefix: str, suffix: str = "") -> bool:
+        """Return true if any event which starts with prefix and ends with suffix would be handled.
+
+        Devices which post a family of events with formatted names (e.g.
+        ``(shot)_(profile)_(state)_hit``) on every change can check this first
+        and skip formatting and posting them when nobody listens. Events are
+        also handled when they are monitored via BCP.
+        """
+        if self.monitor_events:
+            return True
+        try:
+            return self._family_cache[(prefix, suffix)]
+        except KeyError:
+            pass
+
+        result = any(event.startswith(prefix) and event.endswith(suffix) for event in self.registered_handlers)
+        self._family_cache[(prefix, suffix)] = result
+        return result
+
     @staticmethod
     def _set_result(_future, **kwargs):
         if not _future.done():
@@ -700,7 +780,12 @@ class EventManager(MpfController):
 
         # Now let's call the handlers one-by-one, including any kwargs
         if event in self.registered_handlers:
-            result = self._run_handlers(event, ev_type, kwargs)
+            if self.handler_timings is None:
+                result = self._run_handlers(event, ev_type, kwargs)
+            else:
+                start = time.perf_counter()
+                result = self._run_handlers(event, ev_type, kwargs)
+                self._add_handler_timing(event, time.perf_counter() - start)
 
         if self._debug:
             self.debug_log("vvvv Finished event '%s'. Type: %s. Callback: %s. "
@@ -717,6 +802,16 @@ class EventManager(MpfController):
 
             self.callback_queue.append((callback, kwargs))
 
+    def _add_handler_timing(self, event: str, duration: float):
+        timing = self.handler_timings.get(event)
+        if timing is None:
+            self.handler_timings[event] = [1, duration, duration]
+        else:
+            timing[0] += 1
+            timing[1] += duration
+            if duration > timing[2]:
+                timing[2] = duration
+
     def process_event_queue(self) -> None:
         """Check if there are any other events that need to be processed, and then process them."""
         while self.event_queue or self.callback_queue:
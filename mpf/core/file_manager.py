@@ -101,15 +101,30 @@ class FileManager(object):
     @staticmethod
     def save(filename, data):
         """Save data to file."""
+        if not FileManager.initialized:
+            FileManager.init()
+
         ext = os.path.splitext(filename)[1]
 
         # save to temp file and move afterwards. prevents broken files
-        temp_file = os.path.dirname(filename) + os.sep + "_" + os.path.basename(filename)
+        temp_file = os.path.join(os.path.dirname(filename), "_" + os.path.basename(filename))
 
         try:
             FileManager.file_interfaces[ext].save(temp_file, data)
         except KeyError:
             raise AssertionError("No config file processor available for file type {}".format(ext))
 
-        # move temp file
+        # move temp file. the interface synced it to disk so the new file is complete when it replaces the old one
         os.replace(temp_file, filename)
+        FileManager._sync_directory(os.path.dirname(filename))
+
+    @staticmethod
+    def _sync_directory(path):
+        """Flush a rename in path to disk (not possible on Windows)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(path or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -1,11 +1,119 @@
-"""Contains the LogMixin class."""
+"""Contains the LogMixin class and the handler used to log in a background thread."""
 import logging
+import threading
+import time
+from collections import deque
 
 from mpf.exceptions.ConfigFileError import ConfigFileError
 
 MYPY = False
 if MYPY:   # pragma: no cover
     from logging import Logger
+    from typing import TextIO, List, Union, Tuple, Any
+
+
+class AsyncLogHandler(logging.Handler):
+
+    """Handler which creates, formats and writes records in a background thread.
+
+    ``QueueHandler`` formats every record before it enqueues it and wakes up
+    the listener for every record. This handler only appends to a deque. A
+    worker thread wakes up every ``interval`` seconds and passes all pending
+    records to its handlers (respecting their level).
+
+    ``LogMixin`` does not even create a ``LogRecord`` when this handler is
+    installed. It enqueues logger name, level, message, args and time and the
+    record is created in the worker. The last entries are also kept in a
+    bounded ring which can be dumped after a crash.
+    """
+
+    def __init__(self, handlers: "List[logging.Handler]", ring_size: int = 1000, interval: float = .1) -> None:
+        """Initialise handler."""
+        super().__init__()
+        self.handlers = handlers
+        self.interval = interval
+        self.ring = deque(maxlen=ring_size)
+        self._pending = deque()
+        self._stop = threading.Event()
+        self._thread = None     # type: threading.Thread
+
+    def start(self):
+        """Start worker thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mpf_log", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write all pending records and stop worker thread."""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def close(self):
+        """Stop worker thread and close handler."""
+        self.stop()
+        super().close()
+
+    def emit(self, record):
+        """Enqueue record from the standard logging API without formatting it."""
+        record.args = self._copy_args(record.args)
+        self._pending.append(record)
+        self.ring.append(record)
+
+    def enqueue(self, name: str, level: int, msg: str, args: tuple):
+        """Enqueue a log entry for the logger with name. The record is created in the worker."""
+        entry = (name, level, msg, self._copy_args(args), time.time())
+        self._pending.append(entry)
+        self.ring.append(entry)
+
+    @staticmethod
+    def _copy_args(args):
+        """Copy containers in args because the caller might change them before they are formatted."""
+        if not args:
+            return args
+        if isinstance(args, dict):
+            return dict(args)
+        return tuple(arg.copy() if isinstance(arg, (dict, list, set)) else arg for arg in args)
+
+    @staticmethod
+    def to_record(entry: "Union[logging.LogRecord, Tuple[str, int, str, Any, float]]") -> logging.LogRecord:
+        """Return the record for an entry in the queue."""
+        if isinstance(entry, logging.LogRecord):
+            return entry
+        name, level, msg, args, created = entry
+        record = logging.getLogger(name).makeRecord(name, level, "(unknown file)", 0, msg, args, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        record.relativeCreated = (created - logging._startTime) * 1000     # pylint: disable-msg=protected-access
+        return record
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._write_pending()
+        self._write_pending()
+
+    def _write_pending(self):
+        """Pass all pending records to the handlers."""
+        pending = self._pending
+        while pending:
+            record = self.to_record(pending.popleft())
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def dump_ring(self, stream: "TextIO", formatter: logging.Formatter = None):
+        """Format and write all records in the ring to stream."""
+        if not formatter:
+            formatter = logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s')
+        for entry in list(self.ring):
+            try:
+                stream.write(formatter.format(self.to_record(entry)) + "\n")
+            # one broken record should not prevent the others from being dumped
+            # pylint: disable-msg=broad-except
+            except Exception:
+                stream.write("Could not format record: {}\n".format(entry))
 
 
 class LogMixin(object):
@@ -14,6 +122,9 @@ class LogMixin(object):
 
     unit_test = False
 
+    # set by mpf game. log entries are enqueued to this handler without creating a record
+    async_log_handler = None    # type: AsyncLogHandler
+
     __slots__ = ["log", "_info_to_console", "_debug_to_console", "_info_to_file", "_debug_to_file"]
 
     def __init__(self) -> None:
@@ -82,9 +193,9 @@ class LogMixin(object):
             self._logging_not_configured()
 
         if self._debug_to_console:
-            self.log.log(12, msg, *args, **kwargs)
+            self._log(12, msg, args, kwargs)
         elif self._debug_to_file:
-            self.log.log(11, msg, *args, **kwargs)
+            self._log(11, msg, args, kwargs)
 
     def info_log(self, msg: str, *args, context=None, **kwargs) -> None:
         """Log a message at the info level.
@@ -104,9 +215,9 @@ class LogMixin(object):
             return
 
         if context:
-            self.log.log(code, msg + " context: " + context, *args, **kwargs)
+            self._log(code, msg + " context: " + context, args, kwargs)
         else:
-            self.log.log(code, msg, *args, **kwargs)
+            self._log(code, msg, args, kwargs)
 
     def warning_log(self, msg: str, *args, context=None, **kwargs) -> None:
         """Log a message at the warning level.
@@ -134,6 +245,14 @@ class LogMixin(object):
         else:
             self.log.log(40, 'ERROR: {}'.format(msg), *args, **kwargs)
 
+    def _log(self, level: int, msg: str, args: tuple, kwargs: dict) -> None:
+        """Enqueue entry to the async log handler or log it right away."""
+        if self.async_log_handler and not kwargs:
+            if self.log.isEnabledFor(level):
+                self.async_log_handler.enqueue(self.log.name, level, msg, args)
+        else:
+            self.log.log(level, msg, *args, **kwargs)
+
     def raise_config_error(self, msg, error_no, *, context=None):
         """Raise a ConfigFileError exception."""
         raise ConfigFileError(msg, error_no, self.log.name, context)
@@ -4,6 +4,7 @@ import os
 
 import sys
 import threading
+import time
 import traceback
 from platform import platform, python_version, system, release, version, system_alias, machine
 
@@ -24,6 +25,10 @@ from mpf.core.device_manager import DeviceCollection
 from mpf.core.utility_functions import Util
 from mpf.core.logging import LogMixin
 
+# Expiring machine vars are written this often so that their expire time on
+# disk only counts the time the machine is off (within this precision).
+MACHINE_VARS_EXPIRE_REFRESH_SECS = 60
+
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.modes.game.code.game import Game
@@ -79,7 +84,9 @@ class MachineController(LogMixin):
 
     __slots__ = ["log", "options", "config_processor", "mpf_path", "machine_path", "_exception", "_boot_holds",
                  "is_init_done", "_done", "monitors", "plugins", "custom_code", "modes", "game", "machine_vars",
-                 "machine_var_monitor", "machine_var_data_manager", "thread_stopper", "config", "config_validator",
+                 "machine_var_monitor", "machine_var_data_manager", "_machine_vars_dirty", "_machine_vars_full_write",
+                 "_machine_vars_write_timer", "_machine_var_change_handlers",
+                 "thread_stopper", "config", "config_validator",
                  "machine_config", "delayRegistry", "delay", "hardware_platforms", "default_platform", "clock",
                  "stop_future", "events", "switch_controller", "mode_controller", "settings", "asset_manager",
                  "bcp", "ball_controller", "show_controller", "placeholder_manager", "device_manager", "auditor",
@@ -118,6 +125,10 @@ class MachineController(LogMixin):
         self.machine_vars = dict()
         self.machine_var_monitor = False
         self.machine_var_data_manager = None    # type: DataManager
+        self._machine_vars_dirty = set()        # type: Set[str]
+        self._machine_vars_full_write = True
+        self._machine_vars_write_timer = None
+        self._machine_var_change_handlers = {}     # type: Dict[str, List[Callable[[str], None]]]
         self.thread_stopper = threading.Event()
 
         self.config = None      # type: Any
@@ -324,6 +335,7 @@ class MachineController(LogMixin):
         self.validate_machine_config_section('machine')
         self.validate_machine_config_section('game')
         self.validate_machine_config_section('mpf')
+        self.clock.set_timer_resolution(self.config['mpf']['timer_wheel_resolution'])
 
     def validate_machine_config_section(self, section: str) -> None:
         """Validate a config section."""
@@ -373,7 +385,8 @@ class MachineController(LogMixin):
         """Load machine vars from data manager."""
         self.machine_var_data_manager = self.create_data_manager('machine_vars')
 
-        current_time = self.clock.get_time()
+        # expire is stored as wall clock time and only checked at boot
+        current_time = time.time()
 
         for name, settings in (
                 iter(self.machine_var_data_manager.get_data().items())):
@@ -381,13 +394,15 @@ class MachineController(LogMixin):
             if not isinstance(settings, dict) or "value" not in settings:
                 continue
 
-            if ('expire' in settings and settings['expire'] and
-                    settings['expire'] < current_time):
-
+            if settings.get('expire') and settings['expire'] < current_time:
                 continue
 
             self.set_machine_var(name=name, value=settings['value'])
 
+        if self.config['mpf']['save_machine_vars_to_disk']:
+            # expire counts the time the machine is off. move it forward while we run
+            self.clock.schedule_interval(self._refresh_machine_vars_expire, MACHINE_VARS_EXPIRE_REFRESH_SECS)
+
         self._load_initial_machine_vars()
 
         # Create basic system information machine variables
@@ -701,6 +716,9 @@ class MachineController(LogMixin):
 
     def shutdown(self) -> None:
         """Shutdown the machine."""
+        if self._machine_vars_write_timer:
+            self._machine_vars_write_timer.cancel()
+            self._write_machine_vars_to_disk()
         self.thread_stopper.set()
         if hasattr(self, "device_manager"):
             self.device_manager.stop_devices()
@@ -731,16 +749,65 @@ class MachineController(LogMixin):
         for hardware_platform in list(self.hardware_platforms.values()):
             hardware_platform.stop()
 
-    def _write_machine_var_to_disk(self, name: str) -> None:
-        """Write value to disk."""
-        if self.machine_vars[name]['persist'] and self.config['mpf']['save_machine_vars_to_disk']:
+    def _mark_machine_var_dirty(self, name: str) -> None:
+        """Schedule a write of a machine var to disk."""
+        if not self.config['mpf']['save_machine_vars_to_disk']:
+            return
+
+        self._machine_vars_dirty.add(name)
+        if self._machine_vars_write_timer:
+            return
+
+        interval = self.config['mpf']['machine_vars_write_interval']
+        if interval:
+            self._machine_vars_write_timer = self.clock.schedule_once(self._write_machine_vars_to_disk, interval)
+        else:
             self._write_machine_vars_to_disk()
 
-    def _write_machine_vars_to_disk(self):
-        """Update machine vars on disk."""
-        self.machine_var_data_manager.save_all(
-            {name: {"value": var["value"], "expire": var['expire_secs']}
-             for name, var in self.machine_vars.items() if var["persist"]})
+    def _write_machine_vars_to_disk(self) -> None:
+        """Write all dirty machine vars to disk.
+
+        The first write replaces all data on disk (to drop vars which were not
+        configured to persist in this run). Afterwards, only dirty vars are
+        updated.
+        """
+        self._machine_vars_write_timer = None
+        current_time = time.time()
+
+        if self._machine_vars_full_write:
+            self._machine_vars_full_write = False
+            self._machine_vars_dirty.clear()
+            self.machine_var_data_manager.save_all(
+                {name: self._get_machine_var_disk_data(var, current_time)
+                 for name, var in self.machine_vars.items() if var['persist']})
+            return
+
+        if not self._machine_vars_dirty:
+            return
+
+        changed = {}
+        removed = []
+        for name in self._machine_vars_dirty:
+            var = self.machine_vars.get(name)
+            if var and var['persist']:
+                changed[name] = self._get_machine_var_disk_data(var, current_time)
+            else:
+                removed.append(name)
+
+        self._machine_vars_dirty.clear()
+        self.machine_var_data_manager.save_keys(changed, removed)
+
+    @staticmethod
+    def _get_machine_var_disk_data(var: dict, current_time: float) -> dict:
+        """Return value and expire time of a var as it is stored on disk."""
+        return {"value": var["value"],
+                "expire": current_time + var['expire_secs'] if var['expire_secs'] else None}
+
+    def _refresh_machine_vars_expire(self) -> None:
+        """Write expiring vars again so that their expire time on disk starts when the machine goes off."""
+        for name, var in self.machine_vars.items():
+            if var['persist'] and var['expire_secs']:
+                self._mark_machine_var_dirty(name)
 
     def get_machine_var(self, name: str) -> Any:
         """Return the value of a machine variable.
@@ -762,6 +829,24 @@ class MachineController(LogMixin):
         """Return true if machine variable exists."""
         return name in self.machine_vars
 
+    def add_machine_var_change_handler(self, name: str, callback: Callable[[str], None]) -> None:
+        """Call callback with the name of a machine variable when it is added, changed or removed.
+
+        Unlike the machine_var_(name) event the callback is called
+        synchronously so callers can safely cache the value.
+        """
+        self._machine_var_change_handlers.setdefault(name, []).append(callback)
+
+    def remove_machine_var_change_handler(self, name: str, callback: Callable[[str], None]) -> None:
+        """Remove a handler added by add_machine_var_change_handler."""
+        handlers = self._machine_var_change_handlers.get(name)
+        if handlers and callback in handlers:
+            handlers.remove(callback)
+
+    def _notify_machine_var_change(self, name: str) -> None:
+        for callback in self._machine_var_change_handlers.get(name, ()):
+            callback(name)
+
     def configure_machine_var(self, name: str, persist: bool, expire_secs: int = None) -> None:
         """Create a new machine variable.
 
@@ -775,12 +860,19 @@ class MachineController(LogMixin):
                 For example, this lets you write the number of credits on
                 the machine to disk to persist even during power off, but you
                 could set it so that those only stay persisted for an hour.
+                Only the time the machine is off counts. Vars never expire
+                while MPF is running.
         """
-        if name not in self.machine_vars:
+        var = self.machine_vars.get(name)
+        if var is None:
             self.machine_vars[name] = {'value': None, 'persist': persist, 'expire_secs': expire_secs}
-        else:
-            self.machine_vars[name]['persist'] = persist
-            self.machine_vars[name]['expire_secs'] = expire_secs
+            self._notify_machine_var_change(name)
+        elif var['persist'] != persist or var['expire_secs'] != expire_secs:
+            # write it or remove it from disk
+            if persist or var['persist']:
+                self._mark_machine_var_dirty(name)
+            var['persist'] = persist
+            var['expire_secs'] = expire_secs
 
     def set_machine_var(self, name: str, value: Any) -> None:
         """Set the value of a machine variable.
@@ -803,8 +895,11 @@ class MachineController(LogMixin):
         # set value
         self.machine_vars[name]['value'] = value
 
+        if change and self.machine_vars[name]['persist']:
+            self._mark_machine_var_dirty(name)
+
         if change:
-            self._write_machine_var_to_disk(name)
+            self._notify_machine_var_change(name)
 
             self.debug_log("Setting machine_var '%s' to: %s, (prior: %s, "
                            "change: %s)", name, value, prev_value,
@@ -848,10 +943,11 @@ class MachineController(LogMixin):
         try:
             prev_value = self.machine_vars[name]
             del self.machine_vars[name]
-            self._write_machine_vars_to_disk()
+            self._mark_machine_var_dirty(name)
         except KeyError:
             pass
         else:
+            self._notify_machine_var_change(name)
             if self.machine_var_monitor:
                 for callback in self.monitors['machine_vars']:
                     callback(name=name, value=None,
@@ -870,8 +966,8 @@ class MachineController(LogMixin):
         for var in list(self.machine_vars.keys()):
             if var.startswith(startswith) and var.endswith(endswith):
                 del self.machine_vars[var]
-
-        self._write_machine_vars_to_disk()
+                self._mark_machine_var_dirty(var)
+                self._notify_machine_var_change(var)
 
     def get_platform_sections(self, platform_section: str, overwrite: str) -> "SmartVirtualHardwarePlatform":
         """Return platform section."""
@@ -1,6 +1,7 @@
 """Contains the Mode base class."""
 import asyncio
 import copy
+import time
 
 from typing import Any
 from typing import Callable
@@ -18,11 +19,33 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.events import QueuedEvent
     from mpf.core.mode_device import ModeDevice
-    from mpf.core.events import EventHandlerKey
+    from mpf.core.events import EventHandlerKey, PreparedHandler
     from mpf.core.player import Player
     from mpf.core.machine import MachineController
 
 
+class ModeActivationPlan(object):
+
+    """Everything a mode needs to do on start which only depends on its config.
+
+    Modes compile this once and reuse it on every start. Handlers are
+    prepared without the mode priority which is added when they are
+    registered.
+    """
+
+    __slots__ = ["start_methods_version", "devices", "stop_handlers", "start_methods", "control_handlers",
+                 "control_devices"]
+
+    def __init__(self, start_methods_version: int) -> None:
+        """Initialise empty plan."""
+        self.start_methods_version = start_methods_version
+        self.devices = []           # type: List[ModeDevice]
+        self.stop_handlers = []     # type: List[PreparedHandler]
+        self.start_methods = []     # type: List[Tuple[Callable[..., Any], Any, dict]]
+        self.control_handlers = []  # type: List[PreparedHandler]
+        self.control_devices = []   # type: List[ModeDevice]
+
+
 # pylint: disable-msg=too-many-instance-attributes
 class Mode(LogMixin):
 
@@ -31,7 +54,7 @@ class Mode(LogMixin):
     __slots__ = ["machine", "config", "name", "path", "priority", "_active", "_starting", "_mode_start_wait_queue",
                  "stop_methods", "start_callback", "stop_callbacks", "event_handlers", "switch_handlers",
                  "mode_stop_kwargs", "mode_devices", "start_event_kwargs", "stopping", "delay", "player",
-                 "auto_stop_on_ball_end", "restart_on_next_ball"]
+                 "auto_stop_on_ball_end", "restart_on_next_ball", "_activation_plan", "_phase_duration"]
 
     def __init__(self, machine: "MachineController", config, name: str, path) -> None:
         """Initialise mode.
@@ -63,6 +86,8 @@ class Mode(LogMixin):
         self.mode_devices = set()               # type: Set[ModeDevice]
         self.start_event_kwargs = None          # type: Dict[str, Any]
         self.stopping = False
+        self._activation_plan = None            # type: ModeActivationPlan
+        self._phase_duration = 0.0
 
         self.delay = DelayManager(self.machine.delayRegistry)
         '''DelayManager instance for delays in this mode. Note that all delays
@@ -171,6 +196,7 @@ class Mode(LogMixin):
             return
 
         self._starting = True
+        start_time = time.perf_counter()
 
         self.machine.events.post('mode_{}_will_start'.format(self.name), **kwargs)
         '''event: mode_(name)_will_start
@@ -196,34 +222,24 @@ class Mode(LogMixin):
 
         self.start_event_kwargs = kwargs
 
-        self._add_mode_devices()
+        plan = self._get_activation_plan()
+
+        self._add_mode_devices(plan)
 
         self.debug_log("Registering mode_stop handlers")
 
-        # register mode stop events
-        if 'stop_events' in self.config['mode']:
-
-            for event in self.config['mode']['stop_events']:
-                # stop priority is +1 so if two modes of the same priority
-                # start and stop on the same event, the one will stop before
-                # the other starts
-                self.add_mode_event_handler(event=event, handler=self.stop,
-                                            priority=self.config['mode']['stop_priority'] + 1)
+        self.event_handlers.update(self.machine.events.add_prepared_handlers(plan.stop_handlers, self.priority))
 
         self.start_callback = callback
 
         self.debug_log("Calling mode_start handlers")
 
-        for item in self.machine.mode_controller.start_methods:
-            if item.config_section in self.config or not item.config_section:
-                self.stop_methods.append(
-                    item.method(config=self.config.get(item.config_section,
-                                                       self.config),
-                                priority=self.priority,
-                                mode=self,
-                                **item.kwargs))
+        for method, config, method_kwargs in plan.start_methods:
+            self.stop_methods.append(method(config=config, priority=self.priority, mode=self, **method_kwargs))
+
+        self._setup_device_control_events(plan)
 
-        self._setup_device_control_events()
+        self._phase_duration = time.perf_counter() - start_time
 
         self.machine.events.post_queue(event='mode_{}_starting'.format(self.name),
                                        callback=self._started, **kwargs)
@@ -238,6 +254,7 @@ class Mode(LogMixin):
     def _started(self, **kwargs) -> None:
         """Handle result of mode_<name>_starting queue event."""
         del kwargs
+        start_time = time.perf_counter()
         self.info_log('Started. Priority: %s', self.priority)
 
         self.active = True
@@ -256,14 +273,19 @@ class Mode(LogMixin):
 
         This is posted after the "mode_(name)_starting" event.
         '''
+        self._phase_duration += time.perf_counter() - start_time
 
     def _mode_started_callback(self, **kwargs) -> None:
         """Handle result of mode_<name>_started queue event."""
         del kwargs
+        start_time = time.perf_counter()
         self.mode_start(**self.start_event_kwargs)
 
         self.start_event_kwargs = dict()
 
+        self.machine.mode_controller.record_mode_start(
+            self, self._phase_duration + time.perf_counter() - start_time)
+
         if self.start_callback:
             self.start_callback()
 
@@ -307,6 +329,7 @@ class Mode(LogMixin):
         '''
 
         self.stopping = True
+        start_time = time.perf_counter()
 
         self.mode_stop_kwargs = kwargs
 
@@ -324,9 +347,11 @@ class Mode(LogMixin):
         mode won't actually stop until the queue is cleared.
 
         '''
+        self._phase_duration = time.perf_counter() - start_time
         return True
 
     def _stopped(self) -> None:
+        start_time = time.perf_counter()
         self.info_log('Stopped.')
 
         self.priority = 0
@@ -371,8 +396,11 @@ class Mode(LogMixin):
             self._mode_start_wait_queue.clear()
             self._mode_start_wait_queue = None
 
+        self._phase_duration += time.perf_counter() - start_time
+
     def _mode_stopped_callback(self, **kwargs) -> None:
         del kwargs
+        start_time = time.perf_counter()
         self._remove_mode_event_handlers()
         self._remove_mode_devices()
 
@@ -380,13 +408,26 @@ class Mode(LogMixin):
 
         self.mode_stop_kwargs = dict()
 
+        self.machine.mode_controller.record_mode_stop(
+            self, self._phase_duration + time.perf_counter() - start_time)
+
         for callback in self.stop_callbacks:
             callback()
 
         self.stop_callbacks = []
 
-    def _add_mode_devices(self) -> None:
-        # adds and initializes mode devices which get removed at the end of the mode
+    def _get_activation_plan(self) -> ModeActivationPlan:
+        """Return the activation plan of this mode and compile it if needed."""
+        if not self._activation_plan or \
+                self._activation_plan.start_methods_version != self.machine.mode_controller.start_methods_version:
+            self._activation_plan = self._compile_activation_plan()
+
+        return self._activation_plan
+
+    def _compile_activation_plan(self) -> ModeActivationPlan:
+        """Resolve devices, start methods and event handlers of this mode."""
+        self.debug_log("Compiling mode activation plan")
+        plan = ModeActivationPlan(self.machine.mode_controller.start_methods_version)
 
         for collection_name, device_class in (
                 iter(self.machine.device_manager.device_classes.items())):
@@ -401,16 +442,67 @@ class Mode(LogMixin):
                     # get device
                     device = collection[device_name]
 
-                    # Track that this device was added via this mode so we
-                    # can remove it when the mode ends.
-                    self.mode_devices.add(device)
                     if not self.config['mode']['game_mode'] and not device.can_exist_outside_of_game:
                         raise AssertionError("Device {} cannot exist in non game-mode {}.".format(
                             device, self.name
                         ))
 
-                    # This lets the device know it was added to a mode
-                    device.device_loaded_in_mode(mode=self, player=self.player)
+                    plan.devices.append(device)
+
+        # register mode stop events
+        if 'stop_events' in self.config['mode']:
+
+            for event in self.config['mode']['stop_events']:
+                # stop priority is +1 so if two modes of the same priority
+                # start and stop on the same event, the one will stop before
+                # the other starts
+                plan.stop_handlers.append(self.machine.events.prepare_handler(
+                    event, self.stop, self.config['mode']['stop_priority'] + 1, mode=self))
+
+        for item in self.machine.mode_controller.start_methods:
+            if item.config_section in self.config or not item.config_section:
+                plan.start_methods.append((item.method, self.config.get(item.config_section, self.config),
+                                           item.kwargs))
+
+        # control events for all devices specified in this mode's config (not
+        # just newly-created devices)
+        for event, method, delay, device in (
+                self.machine.device_manager.get_device_control_events(
+                self.config)):
+
+            try:
+                event, priority = event.split('|')
+            except ValueError:
+                priority = 0
+
+            if not delay:
+                plan.control_handlers.append(self.machine.events.prepare_handler(
+                    event, method, int(priority) + 2, blocking_facility=device.class_label, mode=self))
+            else:
+                plan.control_handlers.append(self.machine.events.prepare_handler(
+                    event, self._control_event_handler, int(priority) + 2, blocking_facility=device.class_label,
+                    callback=method, ms_delay=delay, mode=self))
+
+        # get all devices in the mode
+        for collection in self.machine.device_manager.collections:
+            if self.machine.device_manager.collections[collection].config_section in self.config:
+                for device, _ in \
+                        iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
+                    device = self.machine.device_manager.collections[collection][device]
+                    if device not in plan.control_devices:
+                        plan.control_devices.append(device)
+
+        return plan
+
+    def _add_mode_devices(self, plan: ModeActivationPlan) -> None:
+        # adds and initializes mode devices which get removed at the end of the mode
+        for device in plan.devices:
+            # Track that this device was added via this mode so we
+            # can remove it when the mode ends.
+            self.mode_devices.add(device)
+
+            # This lets the device know it was added to a mode
+            device.device_loaded_in_mode(mode=self, player=self.player)
 
     def create_mode_devices(self) -> None:
         """Create new devices that are specified in a mode config that haven't been created in the machine-wide."""
@@ -476,45 +568,15 @@ class Mode(LogMixin):
 
         self.mode_devices = set()
 
-    def _setup_device_control_events(self) -> None:
+    def _setup_device_control_events(self, plan: ModeActivationPlan) -> None:
         # registers mode handlers for control events for all devices specified
         # in this mode's config (not just newly-created devices)
 
-        self.debug_log("Scanning mode-based config for device control_events")
-
-        for event, method, delay, device in (
-                self.machine.device_manager.get_device_control_events(
-                self.config)):
-
-            try:
-                event, priority = event.split('|')
-            except ValueError:
-                priority = 0
-
-            if not delay:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=method,
-                    priority=int(priority) + 2,
-                    blocking_facility=device.class_label)
-            else:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=self._control_event_handler,
-                    priority=int(priority) + 2,
-                    callback=method,
-                    ms_delay=delay,
-                    blocking_facility=device.class_label)
+        self.debug_log("Registering device control_events")
 
-        # get all devices in the mode
-        device_list = set()
-        for collection in self.machine.device_manager.collections:
-            if self.machine.device_manager.collections[collection].config_section in self.config:
-                for device, _ in \
-                        iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
-                    device_list.add(self.machine.device_manager.collections[collection][device])
+        self.event_handlers.update(self.machine.events.add_prepared_handlers(plan.control_handlers, self.priority))
 
-        for device in device_list:
+        for device in plan.control_devices:
             device.add_control_events_in_mode(self)
 
     def _control_event_handler(self, callback: Callable[..., None], ms_delay: int = 0, **kwargs) -> None:
@@ -562,8 +624,7 @@ class Mode(LogMixin):
         return key
 
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(list(self.event_handlers))
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
@@ -28,6 +28,34 @@ be called on mode_start or mode_stop.
 """
 
 
+class ModeTiming(object):
+
+    """Accumulated start and stop times of one mode."""
+
+    __slots__ = ["starts", "start_total", "start_max", "stops", "stop_total", "stop_max"]
+
+    def __init__(self) -> None:
+        """Initialise mode timing."""
+        self.starts = 0
+        self.start_total = 0.0
+        self.start_max = 0.0
+        self.stops = 0
+        self.stop_total = 0.0
+        self.stop_max = 0.0
+
+    def add_start(self, duration: float):
+        """Add the duration of one mode start."""
+        self.starts += 1
+        self.start_total += duration
+        self.start_max = max(self.start_max, duration)
+
+    def add_stop(self, duration: float):
+        """Add the duration of one mode stop."""
+        self.stops += 1
+        self.stop_total += duration
+        self.stop_max = max(self.stop_max, duration)
+
+
 class ModeController(MpfController):
 
     """Responsible for loading, unloading, and managing all modes in MPF."""
@@ -35,7 +63,7 @@ class ModeController(MpfController):
     config_name = "mode_controller"
 
     __slots__ = ["queue", "active_modes", "mode_stop_count", "_machine_mode_folders", "_mpf_mode_folders",
-                 "loader_methods", "start_methods", "stop_methods"]
+                 "loader_methods", "start_methods", "stop_methods", "start_methods_version", "mode_timings"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialise mode controller.
@@ -62,6 +90,12 @@ class ModeController(MpfController):
         self.start_methods = list()                 # type: List[RemoteMethod]
         self.stop_methods = list()                  # type: List[Tuple[Callable[[Mode], None], int]]
 
+        # incremented whenever start_methods change. modes use this to
+        # invalidate their precompiled activation plans.
+        self.start_methods_version = 0
+
+        self.mode_timings = dict()                  # type: Dict[str, ModeTiming]
+
         if 'modes' in self.machine.config:
             # priority needs to be higher than device_manager::_load_device_modules
             self.machine.events.add_async_handler('init_phase_1', self.load_modes, priority=10)
@@ -84,6 +118,8 @@ class ModeController(MpfController):
                                         self._player_turn_ended,
                                         priority=1000000)
 
+        self.machine.events.add_handler('debug_dump_stats', self._debug_dump_mode_timings)
+
     def create_mode_devices(self):
         """Create mode devices."""
         for mode in self.machine.modes:
@@ -451,6 +487,7 @@ class ModeController(MpfController):
                                                kwargs=kwargs))
 
         self.start_methods.sort(key=lambda x: x.priority, reverse=True)
+        self.start_methods_version += 1
 
     def remove_start_method(self, start_method, config_section_name=None, priority=0, **kwargs):
         """Remove an existing start method."""
@@ -459,6 +496,7 @@ class ModeController(MpfController):
 
         if method in self.start_methods:
             self.start_methods.remove(method)
+            self.start_methods_version += 1
 
     def register_stop_method(self, callback, priority=0):
         """Register a method which is called when the mode is stopped.
@@ -491,6 +529,39 @@ class ModeController(MpfController):
 
         self.dump()
 
+    def record_mode_start(self, mode: Mode, duration: float):
+        """Record how long (in seconds) a mode spent in its start code."""
+        if mode.name not in self.mode_timings:
+            self.mode_timings[mode.name] = ModeTiming()
+        self.mode_timings[mode.name].add_start(duration)
+
+    def record_mode_stop(self, mode: Mode, duration: float):
+        """Record how long (in seconds) a mode spent in its stop code."""
+        if mode.name not in self.mode_timings:
+            self.mode_timings[mode.name] = ModeTiming()
+        self.mode_timings[mode.name].add_stop(duration)
+
+    def get_mode_timing_report(self) -> str:
+        """Return a table with start and stop times of all modes which ran.
+
+        Modes are sorted by their total time (slowest first). Times are in ms.
+        """
+        lines = ["{:<30} {:>6} {:>9} {:>9} {:>6} {:>9} {:>9}".format(
+            "Mode", "Starts", "Avg (ms)", "Max (ms)", "Stops", "Avg (ms)", "Max (ms)")]
+        for name, timing in sorted(self.mode_timings.items(),
+                                   key=lambda x: x[1].start_total + x[1].stop_total, reverse=True):
+            lines.append("{:<30} {:>6} {:>9.3f} {:>9.3f} {:>6} {:>9.3f} {:>9.3f}".format(
+                name,
+                timing.starts, timing.start_total * 1000 / timing.starts if timing.starts else 0,
+                timing.start_max * 1000,
+                timing.stops, timing.stop_total * 1000 / timing.stops if timing.stops else 0,
+                timing.stop_max * 1000))
+        return "\n".join(lines)
+
+    def _debug_dump_mode_timings(self, **kwargs):
+        del kwargs
+        self.info_log("Mode start/stop timings:\n%s", self.get_mode_timing_report())
+
     def dump(self):
         """Dump the current status of the running modes to the log file."""
         self.debug_log('+=========== ACTIVE MODES ============+')
@@ -503,9 +503,8 @@ class SettingsPlaceholder(BasePlaceholder):
         return asyncio.Future(loop=self._machine.clock.loop)
 
     def subscribe_attribute(self, item):
-        """Subscribe to machine variable for this setting."""
-        return self._machine.events.wait_for_event(
-            'machine_var_{}'.format(self._machine.settings.get_setting_machine_var(item)))
+        """Subscribe to changes of this setting."""
+        return self._machine.settings.wait_for_change(item)
 
     def __getattr__(self, item):
         """Attribute access."""
@@ -1,13 +1,89 @@
 """Generic list randomizer."""
 from uuid import uuid4
 import random
+from typing import List
+
+
+class WeightTree(object):
+
+    """Cumulative weights of a list of items in a Fenwick tree.
+
+    Finding the item for a random value and changing the weight of one item
+    both take O(log n). Items with weight 0 are never picked. This is used to
+    exclude items (e.g. the last one or all which were already sent).
+    """
+
+    __slots__ = ["_weights", "_current", "_tree", "_step", "total"]
+
+    def __init__(self, weights: List[int]) -> None:
+        """Initialise weight tree."""
+        self._weights = weights
+        self._current = []      # type: List[int]
+        self._tree = []         # type: List[int]
+        self._step = 1
+        while self._step * 2 <= len(weights):
+            self._step *= 2
+        self.total = 0
+        self.reset()
+
+    def reset(self):
+        """Restore the initial weights of all items."""
+        self._current = list(self._weights)
+        size = len(self._weights)
+        tree = [0] + self._current
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self.total = sum(self._current)
+
+    def get(self, index: int) -> int:
+        """Return current weight of item at index."""
+        return self._current[index]
+
+    def set(self, index: int, weight: int):
+        """Change weight of item at index."""
+        diff = weight - self._current[index]
+        if not diff:
+            return
+        self._current[index] = weight
+        self.total += diff
+        size = len(self._current)
+        i = index + 1
+        while i <= size:
+            self._tree[i] += diff
+            i += i & -i
+
+    def find(self, value: int) -> int:
+        """Return index of the first item where the sum of weights up to that item reaches value.
+
+        Value has to be between 1 and total.
+        """
+        position = 0
+        step = self._step
+        size = len(self._current)
+        tree = self._tree
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] < value:
+                position = next_position
+                value -= tree[next_position]
+            step >>= 1
+
+        return position
 
 
 class Randomizer(object):
 
-    """Generic list randomizer."""
+    """Generic list randomizer.
 
-    def __init__(self, items):
+    Weights are stored in a WeightTree when the randomizer is created. Every
+    draw uses one random number and takes O(log n) for all modes. Pass a seed
+    to get the same sequence every time (e.g. to replay a game).
+    """
+
+    def __init__(self, items, seed=None):
         """Initialise Randomizer."""
         self.force_different = True
         self.force_all = False
@@ -18,6 +94,8 @@ class Randomizer(object):
         self._loop = True
         self.data = None
         self._uuid = uuid4()
+        self._random = random.Random(seed) if seed is not None else random
+        self._current_index = None
 
         if isinstance(items, (list, tuple)):
             for i in items:
@@ -33,10 +111,14 @@ class Randomizer(object):
         elif isinstance(items, dict):
             for this_item, this_weight in items.items():
                 self.items.append((this_item, int(this_weight)))
-                self.items.sort()
+            self.items.sort()
         else:
             raise AssertionError("Invalid input for Randomizer")
 
+        self._weights = WeightTree([x[1] for x in self.items])
+        # weights of items which have not been sent in this round of force_all
+        self._unsent_weights = None     # type: WeightTree
+
         self.data = dict()
         self._init_data(self.data)
 
@@ -49,34 +131,60 @@ class Randomizer(object):
         if self.disable_random:
             return self._next_not_random()
 
-        potential_nexts = list()
-
         if self.force_all:
-            potential_nexts = [
-                x for x in self.items if x[0] not in self.data['items_sent']]
+            index = self._next_force_all()
+        else:
+            self._unsent_weights = None
+            if self.force_different and len(self.items) > 1:
+                index = self._pick_different(self._weights)
+            else:
+                index = self._pick(self._weights)
 
-        elif self.force_different:
-            potential_nexts = [
-                x for x in self.items if x[0] is not self.data['current_item']]
+        self._current_index = index
+        self.data['current_item'] = self.items[index][0]
+        self.data['items_sent'].add(self.data['current_item'])
+
+        return self.data['current_item']
 
-        if not potential_nexts:
+    def _next_force_all(self) -> int:
+        """Return index of a weighted random item which has not been sent in this round."""
+        if self._unsent_weights is None:
+            self._unsent_weights = WeightTree(
+                [0 if x[0] in self.data['items_sent'] else x[1] for x in self.items])
+        weights = self._unsent_weights
 
+        if weights.total:
+            index = self._pick(weights)
+        else:
             if not self._loop:
                 raise StopIteration
 
             self.data['items_sent'] = set()
+            weights.reset()
 
             # force different only works with more than 1 elements
             if self.force_different and len(self.items) > 1:
-                potential_nexts = [x for x in self.items if x[0] is not (
-                    self.data['current_item'])]
+                index = self._pick_different(weights)
             else:
-                potential_nexts = [x for x in self.items]
+                index = self._pick(weights)
 
-        self.data['current_item'] = self.pick_weighted_random(potential_nexts)
-        self.data['items_sent'].add(self.data['current_item'])
+        weights.set(index, 0)
+        return index
 
-        return self.data['current_item']
+    def _pick(self, weights: WeightTree) -> int:
+        return weights.find(self._random.randint(1, weights.total))
+
+    def _pick_different(self, weights: WeightTree) -> int:
+        """Pick any item but the current one."""
+        current_index = self._current_index
+        if current_index is None or not weights.total - weights.get(current_index):
+            return self._pick(weights)
+
+        weight = weights.get(current_index)
+        weights.set(current_index, 0)
+        index = self._pick(weights)
+        weights.set(current_index, weight)
+        return index
 
     @property
     def loop(self):
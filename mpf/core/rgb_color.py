@@ -6,8 +6,9 @@ Copyright (c) 2015 Erick Daniszewski
 The MIT License (MIT)
 """
 import random
+from functools import lru_cache
 
-from typing import List, Union, Tuple
+from typing import List, Union, Tuple, Dict
 
 from mpf.core.utility_functions import Util
 
@@ -165,29 +166,58 @@ named_rgb_colors = dict(
 
 class RGBColor(object):
 
-    """One RGB Color."""
+    """One immutable RGB Color.
+
+    Colors created from strings are interned. RGBColor("red") will return the
+    same instance every time (as long as it is in the parse cache). Colors are
+    hashable and can be used as keys in dicts.
+    """
 
     __slots__ = ["_color"]
 
-    def __init__(self, color: Union["RGBColor", str, List[int], Tuple[int, int, int]] = None) -> None:
-        """Initialise color."""
+    def __new__(cls, color: Union["RGBColor", str, List[int], Tuple[int, int, int]] = None):
+        """Return a new color or the interned color for strings and colors."""
+        if cls is RGBColor:
+            if isinstance(color, str):
+                return _get_interned_color(color)
+            if color.__class__ is RGBColor:
+                return color
+        instance = super().__new__(cls)
         if isinstance(color, RGBColor):
-            self._color = color.rgb
+            instance._color = color.rgb
         elif isinstance(color, str):
-            self._color = RGBColor.string_to_rgb(color)
+            instance._color = _get_interned_color(color).rgb
         elif color:
-            self._color = (color[0], color[1], color[2])
+            instance._color = (color[0], color[1], color[2])
         else:
-            self._color = rgb_min
+            instance._color = rgb_min
+        return instance
+
+    @staticmethod
+    def from_rgb(rgb: Tuple[int, int, int]) -> "RGBColor":
+        """Return a color for an rgb tuple without any conversion or validation."""
+        color = object.__new__(RGBColor)
+        color._color = rgb
+        return color
 
     def __eq__(self, other):
         """Return true if equal."""
-        return RGBColor(other).rgb == self.rgb
+        if isinstance(other, RGBColor):
+            return other.rgb == self._color
+        if isinstance(other, tuple):
+            return other == self._color
+        if isinstance(other, str):
+            return _get_interned_color(other).rgb == self._color
+        return RGBColor(other).rgb == self._color
 
     def __ne__(self, other):
         """Return true if not equal."""
         return not self.__eq__(other)
 
+    def __hash__(self):
+        """Return hash of rgb tuple."""
+        return hash(self._color)
+
     def __add__(self, other):
         """Return sum of two RGB colors."""
         if isinstance(other, RGBColor):
@@ -201,9 +231,9 @@ class RGBColor(object):
                 "Unsupported operand type(s) for +: '{0}' and '{1}'".format(
                     type(self), type(other)))
 
-        return RGBColor((min(r1 + r2, channel_max_val),
-                         min(g1 + g2, channel_max_val),
-                         min(b1 + b2, channel_max_val)))
+        return RGBColor.from_rgb((min(r1 + r2, channel_max_val),
+                                  min(g1 + g2, channel_max_val),
+                                  min(b1 + b2, channel_max_val)))
 
     def __sub__(self, other):
         """Return difference of two RGB colors."""
@@ -218,9 +248,9 @@ class RGBColor(object):
                 "Unsupported operand type(s) for -: '{0}' and '{1}'".format(
                     type(self), type(other)))
 
-        return RGBColor((max(r1 - r2, channel_min_val),
-                         max(g1 - g2, channel_min_val),
-                         max(b1 - b2, channel_min_val)))
+        return RGBColor.from_rgb((max(r1 - r2, channel_min_val),
+                                  max(g1 - g2, channel_min_val),
+                                  max(b1 - b2, channel_min_val)))
 
     def __mul__(self, other):
         """Multiple color by scalar."""
@@ -232,10 +262,13 @@ class RGBColor(object):
         if other < 0:
             raise TypeError("Operand needs to be positive")
 
+        if other == 1 and self.__class__ is RGBColor:
+            return self
+
         r1, g1, b1 = self.rgb
-        return RGBColor((min(int(r1 * other), channel_max_val),
-                         min(int(g1 * other), channel_max_val),
-                         min(int(b1 * other), channel_max_val)))
+        return RGBColor.from_rgb((min(int(r1 * other), channel_max_val),
+                                  min(int(g1 * other), channel_max_val),
+                                  min(int(b1 * other), channel_max_val)))
 
     def __iter__(self):
         """Return iterator."""
@@ -254,46 +287,26 @@ class RGBColor(object):
         """Return the red component of the RGB color representation."""
         return self._color[0]
 
-    @red.setter
-    def red(self, value: int):
-        self._color = (value, self._color[1], self._color[2])
-
     @property
     def green(self) -> int:
         """Return the green component of the RGB color representation."""
         return self._color[1]
 
-    @green.setter
-    def green(self, value: int):
-        self._color = (self._color[0], value, self._color[2])
-
     @property
     def blue(self) -> int:
         """Return the blue component of the RGB color representation."""
         return self._color[2]
 
-    @blue.setter
-    def blue(self, value: int):
-        self._color = (self._color[0], self._color[1], value)
-
     @property
     def rgb(self) -> Tuple[int, int, int]:
         """Return an RGB representation of the color."""
         return self._color
 
-    @rgb.setter
-    def rgb(self, value: Tuple[int, int, int]):
-        self._color = value
-
     @property
     def hex(self) -> str:
         """Return a 6-char HEX representation of the color."""
         return RGBColor.rgb_to_hex(self.rgb)
 
-    @hex.setter
-    def hex(self, value: str):
-        self._color = RGBColor.hex_to_rgb(value)
-
     @property
     def name(self) -> str:
         """Return the color name or None.
@@ -305,10 +318,6 @@ class RGBColor(object):
             [(_v, _k) for _k, _v in list(named_rgb_colors.items())]).get(
             self._color)
 
-    @name.setter
-    def name(self, value: str):
-        self._color = RGBColor.name_to_rgb(value)
-
     @staticmethod
     def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
         """Convert an RGB color representation to a HEX color representation.
@@ -363,19 +372,22 @@ class RGBColor(object):
             colors
 
         """
-        if isinstance(start_color, RGBColor):
-            start_color = start_color.rgb
-        else:
-            start_color = RGBColor(start_color).rgb
+        if not isinstance(start_color, RGBColor):
+            start_color = RGBColor(start_color)
 
-        if isinstance(end_color, RGBColor):
-            end_color = end_color.rgb
-        else:
-            end_color = RGBColor(start_color).rgb
+        if not isinstance(end_color, RGBColor):
+            end_color = RGBColor(end_color)
 
-        output_color = tuple(start_color[i] + int(
-            (end_color[i] - start_color[i]) * fraction) for i in range(3))
-        return RGBColor(output_color)
+        if fraction == 0 and start_color.__class__ is RGBColor:
+            return start_color
+        if fraction == 1 and end_color.__class__ is RGBColor:
+            return end_color
+
+        r1, g1, b1 = start_color.rgb
+        r2, g2, b2 = end_color.rgb
+        return RGBColor.from_rgb((r1 + int((r2 - r1) * fraction),
+                                  g1 + int((g2 - g1) * fraction),
+                                  b1 + int((b2 - b1) * fraction)))
 
     @staticmethod
     def random_rgb() -> Tuple[int, int, int]:
@@ -417,13 +429,8 @@ class RGBColor(object):
         if '%' in value:
             value, brightness = value.split("%")
 
-        rgb = named_rgb_colors.get(value)
-        if rgb is None:
-            # we do not want to call lower every time since this code path is very hot
-            # instead we just add the upper case string to the color hash map so next time we will hit the fast path
-            rgb = named_rgb_colors.get(value.lower())
-            if rgb:
-                named_rgb_colors[value] = rgb
+        # RGBColor caches parsed strings so this is not called for every color
+        rgb = named_rgb_colors.get(value.lower())
         if rgb is None:
             rgb = RGBColor.hex_to_rgb(value)
             if rgb is None:
@@ -457,6 +464,14 @@ class RGBColor(object):
 
         """
         named_rgb_colors[str(name.lower())] = RGBColor(color).rgb
+        # colors with this name may be cached with the old value
+        _get_interned_color.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _get_interned_color(value: str) -> RGBColor:
+    """Parse a color string once and return the same RGBColor for it until it drops out of the cache."""
+    return RGBColor.from_rgb(RGBColor.string_to_rgb(value))
 
 
 class ColorException(AssertionError):
@@ -470,6 +485,11 @@ class RGBColorCorrectionProfile(object):
 
     """Encapsulates a named RGB color correction profile and its associated lookup tables."""
 
+    __slots__ = ["_name", "_lookup_table", "_cache"]
+
+    # number of corrected colors to remember
+    CACHE_SIZE = 4096
+
     def __init__(self, name: str = None) -> None:
         """Create a linear correction profile that does not alter color values by default.
 
@@ -480,6 +500,9 @@ class RGBColorCorrectionProfile(object):
         """
         self._name = name
 
+        # corrected colors by packed rgb value (r << 16 | g << 8 | b)
+        self._cache = {}                    # type: Dict[int, RGBColor]
+
         # Default lookup table values (linear)
         self._lookup_table = []             # type: List[List[int]]
 
@@ -507,6 +530,7 @@ class RGBColorCorrectionProfile(object):
         # Copyright (c) 2013 Micah Elizabeth Scott
         # The MIT License (MIT)
         scale = 1.0 - linear_cutoff
+        self._cache = {}
 
         for channel in range(3):
             for index in range(256):
@@ -538,6 +562,7 @@ class RGBColorCorrectionProfile(object):
             raise TypeError('Invalid lookup table values type for color correction profile - '
                             'must be a list of 256 integer values')
 
+        self._cache = {}
         for index in range(256):
             value = table_values[index]
             if not isinstance(value, int) or value < 0 or value > 255:
@@ -563,9 +588,17 @@ class RGBColorCorrectionProfile(object):
 
         Returns: RGBColor
         """
-        return RGBColor((self._lookup_table[0][color.red],
-                         self._lookup_table[1][color.green],
-                         self._lookup_table[2][color.blue]))
+        red, green, blue = color.rgb
+        packed = red << 16 | green << 8 | blue
+        corrected = self._cache.get(packed)
+        if corrected is None:
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            corrected = RGBColor.from_rgb((self._lookup_table[0][red],
+                                           self._lookup_table[1][green],
+                                           self._lookup_table[2][blue]))
+            self._cache[packed] = corrected
+        return corrected
 
     @staticmethod
     def default() -> "RGBColorCorrectionProfile":
@@ -11,13 +11,12 @@ class RGBAColor(RGBColor):
     __slots__ = ["opacity"]
 
     def __init__(self, color: Union[RGBColor, str, Tuple[int, int, int], Tuple[int, int, int, int], List[int]]) -> None:
-        """Initialise RGBA color."""
+        """Initialise RGBA color. RGB channels are set in RGBColor.__new__."""
+        super().__init__()
         if isinstance(color, (tuple, list)) and len(color) == 4:
             self.opacity = color[3]
-            super().__init__((color[0], color[1], color[2]))
         else:
             self.opacity = 255
-            super().__init__(color)     # type: ignore
 
     def __iter__(self):
         """Return iterator."""
@@ -1,7 +1,8 @@
 """Manages operator controllable settings."""
+import asyncio
 from collections import namedtuple
 
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 
 from mpf.core.utility_functions import Util
 
@@ -26,6 +27,11 @@ class SettingsController(MpfController):
         self._settings = {}     # type: Dict[str, SettingEntry]
         """Dictionary of available settings."""
 
+        # resolved values of settings. entries are removed when their machine var changes
+        self._values = {}       # type: Dict[str, Any]
+        self._settings_by_machine_var = {}  # type: Dict[str, List[str]]
+        self._change_handlers = {}          # type: Dict[str, List[Callable[[str], None]]]
+
         self._add_entries_from_config()
 
     def _add_entries_from_config(self):
@@ -48,7 +54,48 @@ class SettingsController(MpfController):
 
     def add_setting(self, setting: SettingEntry):
         """Add a setting."""
+        if setting.name in self._settings:
+            self._settings_by_machine_var[self._settings[setting.name].machine_var].remove(setting.name)
         self._settings[setting.name] = setting
+        self._values.pop(setting.name, None)
+
+        if setting.machine_var not in self._settings_by_machine_var:
+            self._settings_by_machine_var[setting.machine_var] = []
+            self.machine.add_machine_var_change_handler(setting.machine_var, self._machine_var_changed)
+        self._settings_by_machine_var[setting.machine_var].append(setting.name)
+
+    def _machine_var_changed(self, machine_var):
+        """Invalidate the values of all settings stored in machine_var and notify handlers."""
+        for setting_name in self._settings_by_machine_var[machine_var]:
+            self._values.pop(setting_name, None)
+            for callback in list(self._change_handlers.get(setting_name, ())):
+                callback(setting_name)
+
+    def add_change_handler(self, setting_name: str, callback: Callable[[str], None]):
+        """Call callback with the setting name whenever the value of the setting may have changed.
+
+        Use this to cache a setting (or a value derived from it).
+        """
+        self._change_handlers.setdefault(setting_name, []).append(callback)
+
+    def remove_change_handler(self, setting_name: str, callback: Callable[[str], None]):
+        """Remove a handler added by add_change_handler."""
+        handlers = self._change_handlers.get(setting_name)
+        if handlers and callback in handlers:
+            handlers.remove(callback)
+
+    def wait_for_change(self, setting_name: str) -> asyncio.Future:
+        """Return a future which is done the next time the setting changes."""
+        future = asyncio.Future(loop=self.machine.clock.loop)
+
+        def _changed(name):
+            if not future.done():
+                future.set_result(name)
+
+        self.add_change_handler(setting_name, _changed)
+        # also remove the handler when the future gets cancelled
+        future.add_done_callback(lambda _: self.remove_change_handler(setting_name, _changed))
+        return future
 
     def get_settings(self) -> List[SettingEntry]:
         """Return all available settings."""
@@ -63,7 +110,7 @@ class SettingsController(MpfController):
 
     def __getattr__(self, item):
         """Return setting."""
-        if "_settings" not in self.__dict__ or item not in self.__dict__['settings']:
+        if "_settings" not in self.__dict__ or item not in self.__dict__['_settings']:
             raise AttributeError()
         return self.get_setting_value(item)
 
@@ -73,6 +120,11 @@ class SettingsController(MpfController):
 
     def get_setting_value(self, setting_name):
         """Return the current value of a setting."""
+        try:
+            return self._values[setting_name]
+        except KeyError:
+            pass
+
         if setting_name not in self._settings:
             raise AssertionError("Invalid setting {}".format(setting_name))
 
@@ -81,7 +133,8 @@ class SettingsController(MpfController):
         else:
             value = self.machine.get_machine_var(self._settings[setting_name].machine_var)
 
-        self.debug_log("Retrieving value: {}={}".format(setting_name, value))
+        self.debug_log("Resolved value: %s=%s", setting_name, value)
+        self._values[setting_name] = value
 
         return value
 
@@ -41,7 +41,7 @@ class SwitchController(MpfController):
     config_name = "switch_controller"
 
     __slots__ = ["registered_switches", "_timed_switch_handler_delay", "active_timed_switches",
-                 "_switch_lookup", "monitors", "_initialised"]
+                 "_switch_lookup", "monitors", "_initialised", "_platform_edge_handlers"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialise switch controller."""
@@ -67,9 +67,22 @@ class SwitchController(MpfController):
 
         self.monitors = list()      # type: List[Callable[[MonitoredSwitchChange], None]]
 
+        self._platform_edge_handlers = dict()   # type: Dict[SwitchPlatform, Callable[[str, int], None]]
+        # Platforms which do not see physical switch edges themselves (e.g.
+        # the virtual platform) get them here before any handlers run.
+
         # to detect early switch changes before init
         self._initialised = False
 
+    def add_platform_edge_handler(self, platform: SwitchPlatform, callback: Callable[[str, int], None]):
+        """Call callback with number and physical state for every switch change on platform.
+
+        The callback runs before any switch handlers. Platforms which receive
+        switch edges from hardware should handle them before calling
+        process_switch_by_num instead.
+        """
+        self._platform_edge_handlers[platform] = callback
+
     def register_switch(self, switch: Switch):
         """Add the name of a switch to the switch controller for tracking.
 
@@ -372,6 +385,9 @@ class SwitchController(MpfController):
 
         # Update the hardware state since we always want this to match real hw
         obj.hw_state = hw_state
+        edge_handler = self._platform_edge_handlers.get(obj.platform)
+        if edge_handler:
+            edge_handler(obj.hw_switch.number, hw_state)
         # update the switch device
         obj.state = state
         obj.last_change = self.machine.clock.get_time()
@@ -3,6 +3,7 @@ import asyncio
 from collections import OrderedDict
 from datetime import datetime
 import logging
+import threading
 from typing import Tuple
 
 from asciimatics.screen import Screen
@@ -28,7 +29,8 @@ class TextUi(MpfController):
 
     __slots__ = ["start_time", "machine", "_tick_task", "screen", "mpf_process", "ball_devices", "switches",
                  "player_start_row", "column_positions", "columns", "_pending_bcp_connection", "_asset_percent",
-                 "_bcp_status"]
+                 "_bcp_status", "_switch_names", "_dirty_switches", "_frame_interval", "_frame_timer",
+                 "_last_frame_time", "_stats", "_stats_thread", "_stats_stop"]
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize TextUi."""
@@ -47,6 +49,18 @@ class TextUi(MpfController):
         self.ball_devices = list()      # type: List[BallDevice]
 
         self.switches = OrderedDict()   # type: Dict[Switch, Tuple[str, int, int]]
+        self._switch_names = {}         # type: Dict[str, Switch]
+        # switches are redrawn in frames with at most text_ui_max_fps per second
+        self._dirty_switches = set()
+        self._frame_interval = 0
+        self._frame_timer = None
+        self._last_frame_time = 0
+
+        # system stats are sampled in a thread because psutil reads them from /proc
+        self._stats = None
+        self._stats_stop = threading.Event()
+        self._stats_thread = threading.Thread(target=self._collect_stats, name="text_ui_stats", daemon=True)
+        self._stats_thread.start()
         self.player_start_row = 0
         self.column_positions = [0, .25, .5, .75]
         self.columns = [0] * len(self.column_positions)
@@ -78,9 +92,10 @@ class TextUi(MpfController):
 
     def _init(self, **kwargs):
         del kwargs
+        self._frame_interval = 1 / self.machine.config['mpf']['text_ui_max_fps']
         self.machine.mode_controller.register_start_method(self._mode_change)
         self.machine.mode_controller.register_stop_method(self._mode_change)
-        self.machine.switch_controller.add_monitor(self._update_switches)
+        self.machine.switch_controller.add_monitor(self._switch_changed)
         self.machine.bcp.interface.register_command_callback(
             "status_report", self._bcp_status_report)
 
@@ -159,18 +174,21 @@ class TextUi(MpfController):
         self.screen.print_at(time_string, width - len(time_string),
                              height - 2, colour=2)
 
+        if not self._stats:
+            # no stats sampled yet
+            return
+
+        available, cpu, process_cpu, rss, vms = self._stats
+
         # System Stats
         system_str = 'Free Memory (MB): {} CPU:{:3d}%'.format(
-            round(virtual_memory().available / 1048576),
-            round(cpu_percent(interval=None, percpu=False)))
+            round(available / 1048576), round(cpu))
         self.screen.print_at(system_str, width - len(system_str), height - 1,
                              colour=2)
 
         # MPF process stats
         stats_str = 'MPF (CPU RSS/VMS): {}% {}/{} MB    '.format(
-            round(self.mpf_process.cpu_percent()),
-            round(self.mpf_process.memory_info().rss / 1048576),
-            round(self.mpf_process.memory_info().vms / 1048576))
+            round(process_cpu), round(rss / 1048576), round(vms / 1048576))
 
         self.screen.print_at(stats_str, 0, height - 1, colour=6)
 
@@ -183,6 +201,14 @@ class TextUi(MpfController):
 
             self.screen.print_at(bcp_string, len(stats_str) - 2, height - 1, colour=5)
 
+    def _collect_stats(self):
+        """Sample system and process stats once per second until stopped."""
+        while not self._stats_stop.is_set():
+            memory_info = self.mpf_process.memory_info()
+            self._stats = (virtual_memory().available, cpu_percent(interval=None, percpu=False),
+                           self.mpf_process.cpu_percent(), memory_info.rss, memory_info.vms)
+            self._stats_stop.wait(1)
+
     def _update_switch_layout(self):
         start_row = 4
         cutoff = int(len(self.machine.switches) / 2) + start_row - 1
@@ -196,6 +222,7 @@ class TextUi(MpfController):
                 name = sw.name
 
             self.switches[sw] = (name, self.columns[col], row)
+            self._switch_names[sw.name] = sw
 
             if row == cutoff:
                 row = start_row
@@ -207,12 +234,37 @@ class TextUi(MpfController):
 
     def _update_switches(self, *args, **kwargs):
         del args, kwargs
-        for sw, info in self.switches.items():
+        self._dirty_switches.update(self.switches)
+        self._draw_frame()
+
+    def _switch_changed(self, change):
+        """Mark switch as dirty and schedule a frame."""
+        switch = self._switch_names.get(change.name)
+        if not switch:
+            return
+        self._dirty_switches.add(switch)
+        if self._frame_timer:
+            return
+        delay = self._last_frame_time + self._frame_interval - self.machine.clock.get_time()
+        self._frame_timer = self.machine.clock.schedule_once(self._draw_frame, max(delay, 0))
+
+    def _draw_frame(self):
+        """Redraw dirty switches."""
+        if self._frame_timer:
+            self.machine.clock.unschedule(self._frame_timer)
+            self._frame_timer = None
+        self._last_frame_time = self.machine.clock.get_time()
+
+        for sw in self._dirty_switches:
+            info = self.switches.get(sw)
+            if not info:
+                continue
             if sw.state:
                 self.screen.print_at(*info, colour=0, bg=2)
             else:
                 self.screen.print_at(*info)
 
+        self._dirty_switches.clear()
         self.screen.refresh()
 
     def _mode_change(self, *args, **kwargs):
@@ -339,6 +391,10 @@ class TextUi(MpfController):
 
         if self.screen:
             self.machine.clock.unschedule(self._tick_task)
+            if self._frame_timer:
+                self.machine.clock.unschedule(self._frame_timer)
+                self._frame_timer = None
+            self._stats_stop.set()
             logger = logging.getLogger()
             logger.addHandler(logging.StreamHandler())
             self.screen.close(True)
@@ -0,0 +1,108 @@
+"""Contains the TimeoutQueue class."""
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.clock import ClockBase, WheelTimer
+
+__api__ = ['TimeoutQueue']
+
+
+class TimeoutQueue(object):
+
+    """Timeouts for many keys which share one clock timer.
+
+    Devices which track many short lived timeouts (e.g. one per started
+    sequence or per active switch) add them here instead of creating a delay
+    for every timeout. Only the earliest deadline has a timer in the clock.
+    Adding is O(log n) and removing a key is O(1).
+
+    When the deadline of a key passed, it is removed and callback is called
+    with the key. Keys with the same deadline expire in the order in which
+    they were added.
+    """
+
+    __slots__ = ["_clock", "_callback", "_heap", "_deadlines", "_counter", "_timer", "_timer_deadline"]
+
+    def __init__(self, clock: "ClockBase", callback: Callable[[Any], None]) -> None:
+        """Initialise timeout queue."""
+        self._clock = clock
+        self._callback = callback
+        self._heap = []             # type: List[Tuple[float, int, Any]]
+        self._deadlines = {}        # type: Dict[Any, Tuple[float, int]]
+        self._counter = count()
+        self._timer = None          # type: WheelTimer
+        self._timer_deadline = None
+
+    def __contains__(self, key) -> bool:
+        """Return true if key has a pending timeout."""
+        return key in self._deadlines
+
+    def __len__(self) -> int:
+        """Return number of pending timeouts."""
+        return len(self._deadlines)
+
+    def add(self, key, deadline: float):
+        """Add or replace the timeout of key at the clock time deadline."""
+        entry = (deadline, next(self._counter))
+        self._deadlines[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+        if len(self._heap) > 2 * len(self._deadlines) + 16:
+            # drop removed entries
+            self._heap = [(entry[0], entry[1], key) for key, entry in self._deadlines.items()]
+            heapq.heapify(self._heap)
+        self._schedule()
+
+    def add_ms(self, key, ms: int):
+        """Add or replace the timeout of key in ms milliseconds from now."""
+        self.add(key, self._clock.get_time() + ms / 1000.0)
+
+    def remove(self, key) -> bool:
+        """Remove timeout of key. Return true if it was pending."""
+        return self._deadlines.pop(key, None) is not None
+
+    def clear(self):
+        """Remove all timeouts."""
+        self._heap = []
+        self._deadlines = {}
+        if self._timer:
+            self._clock.unschedule(self._timer)
+            self._timer = None
+
+    def _schedule(self):
+        """Make sure a timer runs at or before the earliest deadline."""
+        heap = self._heap
+        # drop removed entries from the top
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+
+        if not heap:
+            return
+
+        deadline = heap[0][0]
+        if self._timer:
+            if self._timer_deadline <= deadline:
+                # the timer will reschedule itself when it fires
+                return
+            self._clock.unschedule(self._timer)
+
+        self._timer_deadline = deadline
+        self._timer = self._clock.schedule_at(self._expire, deadline)
+
+    def _expire(self):
+        """Call callback for all keys with passed deadlines."""
+        self._timer = None
+        heap = self._heap
+        current_time = self._clock.get_time()
+        while heap and heap[0][0] <= current_time:
+            deadline, number, key = heapq.heappop(heap)
+            if self._deadlines.get(key) != (deadline, number):
+                # removed or replaced
+                continue
+            del self._deadlines[key]
+            self._callback(key)
+
+        if not self._timer:
+            self._schedule()
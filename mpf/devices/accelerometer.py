@@ -1,7 +1,8 @@
 """Contains the Accelerometer device."""
 import asyncio
 import math
-from typing import Tuple
+from array import array
+from typing import Tuple, Sequence, List
 
 from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.machine import MachineController
@@ -10,6 +11,45 @@ from mpf.core.system_wide_device import SystemWideDevice
 from mpf.platforms.interfaces.accelerometer_platform_interface import AccelerometerPlatformInterface
 
 
+class AccelerometerSampleBuffer(object):
+
+    """Fixed-size ring buffer of x, y, z samples backed by one array."""
+
+    __slots__ = ["size", "data", "position", "count"]
+
+    def __init__(self, size: int) -> None:
+        """Initialise buffer for size samples."""
+        self.size = size
+        self.data = array('d', [0.0]) * (size * 3)
+        self.position = 0
+        self.count = 0
+
+    def append(self, x: float, y: float, z: float) -> None:
+        """Add one sample and overwrite the oldest one if the buffer is full."""
+        index = self.position * 3
+        self.data[index] = x
+        self.data[index + 1] = y
+        self.data[index + 2] = z
+        self.position = (self.position + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def extend(self, samples: Sequence[float]) -> None:
+        """Add x, y, z of one or more samples (oldest first)."""
+        append = self.append
+        for i in range(0, len(samples), 3):
+            append(samples[i], samples[i + 1], samples[i + 2])
+
+    def get_window(self, count: int) -> List[Tuple[float, float, float]]:
+        """Return the last count samples (oldest first)."""
+        count = min(count, self.count)
+        result = []
+        for i in range(self.position - count, self.position):
+            index = (i % self.size) * 3
+            result.append((self.data[index], self.data[index + 1], self.data[index + 2]))
+        return result
+
+
 @DeviceMonitor("value")
 class Accelerometer(SystemWideDevice):
 
@@ -39,11 +79,13 @@ class Accelerometer(SystemWideDevice):
         self.history = None     # type: Tuple[float, float, float]
         self.value = None       # type: Tuple[float, float, float]
         self.hw_device = None   # type: AccelerometerPlatformInterface
+        self.samples = None     # type: AccelerometerSampleBuffer
 
     @asyncio.coroutine
     def _initialize(self):
         """Initialise and configure accelerometer."""
         yield from super()._initialize()
+        self.samples = AccelerometerSampleBuffer(self.config['sample_buffer_size'])
         self.platform = self.machine.get_platform_sections(
             'accelerometers', self.config['platform'])
         self.hw_device = self.platform.configure_accelerometer(self.config['number'],
@@ -65,26 +107,70 @@ class Accelerometer(SystemWideDevice):
 
     def update_acceleration(self, x: float, y: float, z: float) -> None:
         """Calculate acceleration based on readings from hardware."""
-        self.value = (x, y, z)
-
-        if not self.history:
-            self.history = (x, y, z)
-            dx = dy = dz = 0
-        else:
-            dx = x - self.history[0]
-            dy = y - self.history[1]
-            dz = z - self.history[2]
-
-            alpha = self.config['alpha']
-            self.history = (self.history[0] * alpha + x * (1 - alpha),
-                            self.history[1] * alpha + y * (1 - alpha),
-                            self.history[2] * alpha + z * (1 - alpha))
-
-        self._handle_hits(dx, dy, dz)
-        # only check level when we are in a stedy state
-        if math.fabs(dx) + math.fabs(dy) + math.fabs(dz) < 0.05:
+        self.update_acceleration_batch((x, y, z))
+
+    def update_acceleration_batch(self, samples: Sequence[float]) -> None:
+        """Process readings from hardware in windows of the sample buffer.
+
+        Args:
+            samples: x, y, z of every sample (oldest first).
+
+        Samples are added to the sample buffer and detection runs over the new
+        window in the buffer. Batches larger than the buffer are processed in
+        multiple windows. Hit limits are checked against the strongest hit in
+        the batch and post their event at most once per batch. Level limits are
+        checked once for the last sample if it is steady.
+        """
+        if not samples:
+            return
+
+        window_size = self.samples.size * 3
+        max_hit_squared = 0.0
+        steady = False
+        for start in range(0, len(samples), window_size):
+            window = samples[start:start + window_size]
+            self.samples.extend(window)
+            hit_squared, steady = self._process_window(len(window) // 3)
+            if hit_squared > max_hit_squared:
+                max_hit_squared = hit_squared
+
+        self.value = (samples[-3], samples[-2], samples[-1])
+
+        self._handle_hits(math.sqrt(max_hit_squared))
+        if steady:
             self._handle_level()
 
+    def _process_window(self, count: int) -> Tuple[float, bool]:
+        """Update history from the last count samples in the buffer in one pass.
+
+        Returns the square of the strongest hit and whether the last sample is
+        steady.
+        """
+        alpha = self.config['alpha']
+        history = self.history
+        max_hit_squared = 0.0
+        steady = False
+        for x, y, z in self.samples.get_window(count):
+            if not history:
+                history = (x, y, z)
+                dx = dy = dz = 0
+            else:
+                dx = x - history[0]
+                dy = y - history[1]
+                dz = z - history[2]
+                history = (history[0] * alpha + x * (1 - alpha),
+                           history[1] * alpha + y * (1 - alpha),
+                           history[2] * alpha + z * (1 - alpha))
+
+            hit_squared = dx * dx + dy * dy + dz * dz
+            if hit_squared > max_hit_squared:
+                max_hit_squared = hit_squared
+            # only check level when we are in a stedy state
+            steady = math.fabs(dx) + math.fabs(dy) + math.fabs(dz) < 0.05
+
+        self.history = history
+        return max_hit_squared, steady
+
     def get_level_xyz(self) -> float:
         """Return current 3D level."""
         return self._calculate_angle(self.config['level_x'],
@@ -124,8 +210,7 @@ class Accelerometer(SystemWideDevice):
                     deviation_xz=deviation_xz,
                     deviation_yz=deviation_yz)
 
-    def _handle_hits(self, dx: float, dy: float, dz: float) -> None:
-        acceleration = self._calculate_vector_length(dx, dy, dz)
+    def _handle_hits(self, acceleration: float) -> None:
         for min_acceleration in self.config['hit_limits']:
             if acceleration > min_acceleration:
                 self.debug_log("Received hit of %s > %s. Posting %s",
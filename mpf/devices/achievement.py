@@ -1,4 +1,6 @@
 """An achievement which can be reached in a pinball machine."""
+import asyncio
+from typing import Dict, List, Tuple
 
 from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.events import event_handler
@@ -8,6 +10,17 @@ from mpf.core.mode_device import ModeDevice
 from mpf.core.player import Player
 from mpf.devices.achievement_group import AchievementGroup
 
+STATES = ('disabled', 'enabled', 'started', 'stopped', 'selected', 'completed')
+
+# action -> {source state: target state}
+TRANSITIONS = {
+    "enable": {"disabled": "enabled", "selected": "enabled", "started": "enabled"},
+    "start": {"enabled": "started", "selected": "started"},
+    "complete": {"started": "completed", "selected": "completed"},
+    "stop": {"started": "stopped", "selected": "stopped"},
+    "disable": {"enabled": "disabled", "selected": "disabled"},
+}   # type: Dict[str, Dict[str, str]]
+
 
 @DeviceMonitor(_state="state")
 class Achievement(ModeDevice):
@@ -30,6 +43,8 @@ class Achievement(ModeDevice):
         self._mode = None
         self._show = None
         self._group_memberships = set()
+        self._transitions = {}      # type: Dict[str, Dict[str, str]]
+        self._state_outputs = {}    # type: Dict[str, Tuple[List[str], str]]
 
     @property
     def state(self):
@@ -52,16 +67,32 @@ class Achievement(ModeDevice):
         """Validate and parse config."""
         config = super().validate_and_parse_config(config, is_mode_config, debug_prefix)
 
-        states = ['disabled', 'enabled', 'started', 'stopped', 'selected',
-                  'completed']
-
-        for state in states:
+        for state in STATES:
             if not config['events_when_{}'.format(state)]:
                 config['events_when_{}'.format(state)] = [
                     "achievement_{}_state_{}".format(self.name, state)]
 
         return config
 
+    @asyncio.coroutine
+    def _initialize(self):
+        """Build transition table and the events and show per state."""
+        yield from super()._initialize()
+        self._transitions = {action: dict(transitions) for action, transitions in TRANSITIONS.items()}
+        if self.config['restart_after_stop_possible']:
+            self._transitions["start"]["stopped"] = "started"
+            self._transitions["disable"]["stopped"] = "disabled"
+
+        self._state_outputs = {state: (self.config['events_when_' + state], self.config['show_when_' + state])
+                               for state in STATES}
+
+    def _transition(self, action):
+        """Move to the target state of action if there is a transition from the current state."""
+        target = self._transitions[action].get(self._state)
+        if target:
+            self._state = target
+            self._run_state()
+
     @event_handler(10)
     def enable(self, **kwargs):
         """Enable the achievement.
@@ -69,45 +100,31 @@ class Achievement(ModeDevice):
         It can only start if it was enabled before.
         """
         del kwargs
-        if self._state in ("disabled", "selected", "started"):
-            self._state = "enabled"
-            self._run_state()
+        self._transition("enable")
 
     @event_handler(5)
     def start(self, **kwargs):
         """Start achievement."""
         del kwargs
-        if self._state in ("enabled", "selected") or (
-            self.config['restart_after_stop_possible'] and
-                self._state == "stopped"):
-            self._state = "started"
-            self._run_state()
+        self._transition("start")
 
     @event_handler(4)
     def complete(self, **kwargs):
         """Complete achievement."""
         del kwargs
-        if self._state in ("started", "selected"):
-            self._state = "completed"
-            self._run_state()
+        self._transition("complete")
 
     @event_handler(2)
     def stop(self, **kwargs):
         """Stop achievement."""
         del kwargs
-        if self._state in ("started", "selected"):
-            self._state = "stopped"
-            self._run_state()
+        self._transition("stop")
 
     @event_handler(0)
     def disable(self, **kwargs):
         """Disable achievement."""
         del kwargs
-        if self._state in ("enabled", "selected") or (
-            self.config['restart_after_stop_possible'] and
-                self._state == "stopped"):
-            self._state = "disabled"
-            self._run_state()
+        self._transition("disable")
 
     @event_handler(1)
     def reset(self, **kwargs):
@@ -139,7 +156,8 @@ class Achievement(ModeDevice):
 
     def _run_state(self, restore=False):
         """Run shows and post events for current step."""
-        for event in self.config['events_when_{}'.format(self._state)]:
+        events, show = self._state_outputs[self._state]
+        for event in events:
             self.machine.events.post(event, restore=restore)
             '''event: achievement_(name)_state_(state)
             desc: Achievement (name) changed to state (state).
@@ -158,8 +176,6 @@ class Achievement(ModeDevice):
             self._show.stop()
             self._show = None
 
-        show = self.config['show_when_' + self._state]
-
         if show:
             if show not in self.machine.shows:
                 # don't want a "try:" here since it would swallow any errors
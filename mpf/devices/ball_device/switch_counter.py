@@ -1,5 +1,6 @@
 """Switch ball counter."""
 import asyncio
+from functools import partial
 
 from mpf.core.utility_functions import Util
 from mpf.devices.ball_device.physical_ball_counter import PhysicalBallCounter, EjectTracker, BallLostActivity, \
@@ -14,38 +15,96 @@ class SwitchCounter(PhysicalBallCounter):
     should use a simpler counter.
     """
 
-    __slots__ = ["_entrances", "_trigger_recount", "_task", "_is_unreliable"]
+    __slots__ = ["_entrances", "_trigger_recount", "_task", "_is_unreliable", "_active_switches", "_unsettled",
+                 "_settle_timer", "_settle_time"]
 
     def __init__(self, ball_device, config):
         """Initialise ball counter."""
         super().__init__(ball_device, config)
         self._entrances = []
         self._trigger_recount = asyncio.Event(loop=self.machine.clock.loop)
-        # Register switch handlers with delays for entrance & exit counts
+        # the count is kept up to date from switch edges. switches in _unsettled changed within their entrance or
+        # exit count delay (value is the delay in ms)
+        self._active_switches = set()
+        self._unsettled = {}
+        self._settle_timer = None
+        self._settle_time = None
         for switch in self.config['ball_switches']:
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=1,
-                ms=self.config['entrance_count_delay'],
-                callback=self.trigger_recount)
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=1,
-                callback=self.invalidate_count)
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=0,
-                ms=self.config['exit_count_delay'],
-                callback=self.trigger_recount)
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=0,
-                callback=self.invalidate_count)
+            if switch.state:
+                self._active_switches.add(switch)
+            delay = self._get_count_delay(switch.state)
+            if self.machine.switch_controller.ms_since_change(switch.name) < delay:
+                self._switch_changed(switch, switch.state)
+
+            self.machine.switch_controller.add_switch_handler_obj(
+                switch, state=1, callback=partial(self._switch_changed, switch, 1))
+            self.machine.switch_controller.add_switch_handler_obj(
+                switch, state=0, callback=partial(self._switch_changed, switch, 0))
 
         self._task = self.machine.clock.loop.create_task(self._run())
         self._is_unreliable = False
 
+    def _get_count_delay(self, state):
+        return self.config['entrance_count_delay'] if state else self.config['exit_count_delay']
+
+    def _switch_changed(self, switch, state):
+        """Update count on a switch edge and wait until the switch settled."""
+        if state:
+            self._active_switches.add(switch)
+        else:
+            self._active_switches.discard(switch)
+
+        self.invalidate_count()
+
+        delay = self._get_count_delay(state)
+        if not delay:
+            self._unsettled.pop(switch, None)
+            self.trigger_recount()
+            return
+
+        self._unsettled[switch] = delay
+        self._schedule_settle()
+
+    def _schedule_settle(self):
+        """Schedule a recount when the last unsettled switch settles."""
+        settle_time = max(switch.last_change + delay / 1000.0 for switch, delay in self._unsettled.items())
+        if self._settle_timer:
+            if settle_time >= self._settle_time:
+                # the timer will reschedule itself when it fires
+                return
+            self.machine.clock.unschedule(self._settle_timer)
+
+        self._settle_time = settle_time
+        self._settle_timer = self.machine.clock.schedule_at(self._settled, settle_time)
+
+    def _settled(self):
+        self._settle_timer = None
+        if self._is_settled():
+            self.trigger_recount()
+        else:
+            self._schedule_settle()
+
+    def _is_settled(self):
+        """Return true if all switches are in their state for at least their count delay."""
+        if not self._unsettled:
+            return True
+        current_time = self.machine.clock.get_time()
+        for switch, delay in list(self._unsettled.items()):
+            # same rounding as SwitchController.ms_since_change
+            if round((current_time - switch.last_change) * 1000.0, 0) < delay:
+                return False
+            del self._unsettled[switch]
+
+        return True
+
     def stop(self):
         """Stop task."""
         super().stop()
         if self._task:
             self._task.cancel()
+        if self._settle_timer:
+            self.machine.clock.unschedule(self._settle_timer)
+            self._settle_timer = None
 
     def trigger_recount(self):
         """Trigger a count."""
@@ -120,30 +179,20 @@ class SwitchCounter(PhysicalBallCounter):
 
     def _count_switches_sync(self):
         """Return active switches or raise ValueError if switches are unstable."""
-        switches = []
-        for switch in self.config['ball_switches']:
-            valid = False
-            if self.machine.switch_controller.is_active(
-                    switch.name, ms=self.config['entrance_count_delay']):
-                switches.append(switch.name)
-                valid = True
-            elif self.machine.switch_controller.is_inactive(
-                    switch.name, ms=self.config['exit_count_delay']):
-                valid = True
-
-            if not valid:
-                # one of our switches wasn't valid long enough
-                self.debug_log("Switch '%s' changed too recently. Aborting count!", switch.name)
-                raise ValueError('Count not stable yet. Run again!')
-
-        return switches
+        if not self._is_settled():
+            self.debug_log("Switches changed too recently. Aborting count!")
+            raise ValueError('Count not stable yet. Run again!')
+
+        return [switch.name for switch in self.config['ball_switches'] if switch in self._active_switches]
 
     def count_balls_sync(self):
         """Count currently active switches or raise ValueError if switches are unstable."""
-        switches = self._count_switches_sync()
-        ball_count = len(switches)
+        if not self._is_settled():
+            self.debug_log("Switches changed too recently. Aborting count!")
+            raise ValueError('Count not stable yet. Run again!')
 
-        self.debug_log("Counted %s balls. Active switches: %s. Old: %s", ball_count, switches, self._last_count)
+        ball_count = len(self._active_switches)
+        self.debug_log("Counted %s balls. Old: %s", ball_count, self._last_count)
         return ball_count
 
     def is_jammed(self):
@@ -158,12 +207,7 @@ class SwitchCounter(PhysicalBallCounter):
     @property
     def is_ready_to_receive(self):
         """Return true if count is stable and we got at least one slot."""
-        try:
-            count = self._count_switches_sync()
-        except ValueError:
-            # count not stable
-            return False
-        return count != len(self.config['ball_switches'])
+        return self._is_settled() and len(self._active_switches) != len(self.config['ball_switches'])
 
     def wait_for_ready_to_receive(self):
         """Wait until there is at least on inactive switch."""
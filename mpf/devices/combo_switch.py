@@ -1,12 +1,13 @@
 """Contains the Combo Switch device class."""
 import asyncio
+from functools import partial
 
-from mpf.core.delays import DelayManager, DelayManagerRegistry
 from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.mode import Mode
 from mpf.core.mode_device import ModeDevice
 from mpf.core.player import Player
 from mpf.core.system_wide_device import SystemWideDevice
+from mpf.core.timeout_queue import TimeoutQueue
 
 
 @DeviceMonitor("state")
@@ -25,9 +26,19 @@ class ComboSwitch(SystemWideDevice, ModeDevice):
         self._state = 'inactive'
         self._switches_1_active = False
         self._switches_2_active = False
-
-        self.delay_registry = DelayManagerRegistry(self.machine)
-        self.delay = DelayManager(self.delay_registry)
+        # number of active switches per group
+        self._active_count = {1: 0, 2: 0}
+        self._handlers = []
+
+        self._timeouts = TimeoutQueue(self.machine.clock, self._timeout)
+        self._timeout_callbacks = {
+            "switch_1_active": partial(self._activate_switches, 1),
+            "switch_2_active": partial(self._activate_switches, 2),
+            "switch_1_inactive": partial(self._release_switches, 1),
+            "switch_2_inactive": partial(self._release_switches, 2),
+            "switch_1_only": partial(self._post_only_one_active_event, 1),
+            "switch_2_only": partial(self._post_only_one_active_event, 2),
+        }
 
     def validate_and_parse_config(self, config: dict, is_mode_config: bool, debug_prefix: str = None) -> dict:
         """Validate and parse config."""
@@ -89,150 +100,96 @@ class ComboSwitch(SystemWideDevice, ModeDevice):
         self._kill_delays()
 
     def _register_switch_handlers(self):
-        for switch in self.config['switches_1']:
-            switch.add_handler(self._switch_1_went_active, state=1)
-            switch.add_handler(self._switch_1_went_inactive, state=0)
-
-        for switch in self.config['switches_2']:
-            switch.add_handler(self._switch_2_went_active, state=1)
-            switch.add_handler(self._switch_2_went_inactive, state=0)
+        self._remove_switch_handlers()
+        for number in (1, 2):
+            switches = self.config['switches_{}'.format(number)]
+            self._active_count[number] = sum(1 for switch in switches if switch.state)
+            for switch in switches:
+                self._handlers.append(switch.add_handler(partial(self._switch_went_active, number), state=1))
+                self._handlers.append(switch.add_handler(partial(self._switch_went_inactive, number), state=0))
 
     def _remove_switch_handlers(self):
-        for switch in self.config['switches_1']:
-            switch.remove_handler(self._switch_1_went_active, state=1)
-            switch.remove_handler(self._switch_1_went_inactive, state=0)
-
-        for switch in self.config['switches_2']:
-            switch.remove_handler(self._switch_2_went_active, state=1)
-            switch.remove_handler(self._switch_2_went_inactive, state=0)
+        for handler in self._handlers:
+            self.machine.switch_controller.remove_switch_handler_by_key(handler)
+        self._handlers = []
 
     def _kill_delays(self):
-        self.delay.clear()
+        self._timeouts.clear()
 
-    def _switch_1_went_active(self):
-        self.debug_log('A switch from switches_1 just went active')
-        self.delay.remove('switch_1_inactive')
+    def _timeout(self, key):
+        self._timeout_callbacks[key]()
 
-        if self._switches_1_active:
-            return
-
-        if not self.config['hold_time']:
-            self._activate_switches_1()
-        else:
-            self.delay.add_if_doesnt_exist(self.config['hold_time'],
-                                           self._activate_switches_1,
-                                           'switch_1_active')
+    def _switch_went_active(self, number):
+        self.debug_log('A switch from switches_%s just went active', number)
+        self._active_count[number] += 1
+        self._timeouts.remove('switch_{}_inactive'.format(number))
 
-    def _switch_2_went_active(self):
-        self.debug_log('A switch from switches_2 just went active')
-        self.delay.remove('switch_2_inactive')
-
-        if self._switches_2_active:
+        if self._get_switches_active(number):
             return
 
         if not self.config['hold_time']:
-            self._activate_switches_2()
-        else:
-            self.delay.add_if_doesnt_exist(self.config['hold_time'],
-                                           self._activate_switches_2,
-                                           'switch_2_active')
-
-    def _switch_1_went_inactive(self):
-        self.debug_log('A switch from switches_1 just went inactive')
-        for switch in self.config['switches_1']:
-            if switch.state:
-                # at least one switch is still active
-                return
+            self._activate_switches(number)
+        elif 'switch_{}_active'.format(number) not in self._timeouts:
+            self._timeouts.add_ms('switch_{}_active'.format(number), self.config['hold_time'])
+
+    def _switch_went_inactive(self, number):
+        self.debug_log('A switch from switches_%s just went inactive', number)
+        self._active_count[number] = max(0, self._active_count[number] - 1)
+        if self._active_count[number]:
+            # at least one switch is still active
+            return
 
-        self.delay.remove('switch_1_active')
+        self._timeouts.remove('switch_{}_active'.format(number))
 
         if not self.config['release_time']:
-            self._release_switches_1()
-        else:
-            self.delay.add_if_doesnt_exist(self.config['release_time'],
-                                           self._release_switches_1,
-                                           'switch_1_inactive')
-
-    def _switch_2_went_inactive(self):
-        self.debug_log('A switch from switches_2 just went inactive')
-        for switch in self.config['switches_2']:
-            if switch.state:
-                # at least one switch is still active
-                return
+            self._release_switches(number)
+        elif 'switch_{}_inactive'.format(number) not in self._timeouts:
+            self._timeouts.add_ms('switch_{}_inactive'.format(number), self.config['release_time'])
 
-        self.delay.remove('switch_2_active')
+    def _get_switches_active(self, number):
+        return self._switches_1_active if number == 1 else self._switches_2_active
 
-        if not self.config['release_time']:
-            self._release_switches_2()
+    def _set_switches_active(self, number, value):
+        if number == 1:
+            self._switches_1_active = value
         else:
-            self.delay.add_if_doesnt_exist(self.config['release_time'],
-                                           self._release_switches_2,
-                                           'switch_2_inactive')
-
-    def _activate_switches_1(self):
-        self.debug_log('Switches_1 has passed the hold time and is now '
-                       'active')
-        self._switches_1_active = self.machine.clock.get_time()
-        self.delay.remove("switch_2_only")
-
-        if self._switches_2_active:
+            self._switches_2_active = value
+
+    def _activate_switches(self, number):
+        self.debug_log('Switches_%s has passed the hold time and is now '
+                       'active', number)
+        other = 3 - number
+        active_time = self.machine.clock.get_time()
+        self._set_switches_active(number, active_time)
+        self._timeouts.remove("switch_{}_only".format(other))
+
+        other_active_time = self._get_switches_active(other)
+        if other_active_time:
             if (self.config['max_offset_time'] >= 0 and
-                    (self._switches_1_active - self._switches_2_active >
+                    (active_time - other_active_time >
                         self.config['max_offset_time'])):
 
-                self.debug_log("Switches_2 is active, but the "
+                self.debug_log("Switches_%s is active, but the "
                                "max_offset_time=%s which is largest than when "
-                               "a Switches_2 switch was first activated, so "
+                               "a Switches_%s switch was first activated, so "
                                "the state will not switch to 'both'",
-                               self.config['max_offset_time'])
+                               other, self.config['max_offset_time'], other)
 
                 return
 
             self._switch_state('both')
-        elif self.config['max_offset_time'] >= 0:
-            self.delay.add_if_doesnt_exist(self.config['max_offset_time'] * 1000, self._post_only_one_active_event,
-                                           "switch_1_only", number=1)
-
-    def _activate_switches_2(self):
-        self.debug_log('Switches_2 has passed the hold time and is now '
-                       'active')
-        self._switches_2_active = self.machine.clock.get_time()
-        self.delay.remove("switch_1_only")
-
-        if self._switches_1_active:
-            if (self.config['max_offset_time'] >= 0 and
-                    (self._switches_2_active - self._switches_1_active >
-                        self.config['max_offset_time'])):
-                self.debug_log("Switches_2 is active, but the "
-                               "max_offset_time=%s which is largest than when "
-                               "a Switches_2 switch was first activated, so "
-                               "the state will not switch to 'both'",
-                               self.config['max_offset_time'])
-                return
-
-            self._switch_state('both')
-        elif self.config['max_offset_time'] >= 0:
-            self.delay.add_if_doesnt_exist(self.config['max_offset_time'] * 1000, self._post_only_one_active_event,
-                                           "switch_2_only", number=2)
+        elif self.config['max_offset_time'] >= 0 and "switch_{}_only".format(number) not in self._timeouts:
+            self._timeouts.add_ms("switch_{}_only".format(number), self.config['max_offset_time'] * 1000)
 
     def _post_only_one_active_event(self, number):
         for event in self.config['events_when_switches_{}'.format(number)]:
             self.machine.events.post(event)
 
-    def _release_switches_1(self):
-        self.debug_log('Switches_1 has passed the release time and is now '
-                       'releases')
-        self._switches_1_active = None
-        if self._switches_2_active and self._state == 'both':
-            self._switch_state('one')
-        elif self._state == 'one':
-            self._switch_state('inactive')
-
-    def _release_switches_2(self):
-        self.debug_log('Switches_2 has passed the release time and is now '
-                       'releases')
-        self._switches_2_active = None
-        if self._switches_1_active and self._state == 'both':
+    def _release_switches(self, number):
+        self.debug_log('Switches_%s has passed the release time and is now '
+                       'releases', number)
+        self._set_switches_active(number, None)
+        if self._get_switches_active(3 - number) and self._state == 'both':
             self._switch_state('one')
         elif self._state == 'one':
             self._switch_state('inactive')
@@ -1,5 +1,6 @@
 """Contains the Light class."""
 import asyncio
+from bisect import bisect_left, bisect_right
 from functools import partial
 from operator import itemgetter
 
@@ -60,6 +61,11 @@ class LightStackEntry(object):
         """Compare two stack entries."""
         return self.priority > other.priority or (self.priority == other.priority and self.key > other.key)
 
+    @property
+    def sort_key(self):
+        """Return a tuple which sorts the same way as this entry."""
+        return self.priority, self.key
+
 
 @DeviceMonitor(_color="color")
 class Light(SystemWideDevice, DevicePositionMixin):
@@ -71,7 +77,7 @@ class Light(SystemWideDevice, DevicePositionMixin):
     class_label = 'light'
 
     __slots__ = ["hw_drivers", "platforms", "delay", "default_fade_ms", "_color_correction_profile", "stack",
-                 "hw_driver_functions"]
+                 "hw_driver_functions", "_stack_keys", "_stack_index"]
 
     def __init__(self, machine, name):
         """Initialise light."""
@@ -117,8 +123,17 @@ class Light(SystemWideDevice, DevicePositionMixin):
             replaced by the new entry. The key is also used to remove entries
             from the stack (e.g. when shows or modes end and they want to
             remove their commands from the light).
+
+        The stack is sorted from the highest to the lowest entry. Use
+        _stack_insert and _stack_remove to change it.
         """
 
+        self._stack_keys = list()           # type: List[Tuple[int, str]]
+        """Sort keys of the entries in stack in ascending order (i.e. reversed) used for bisecting."""
+
+        self._stack_index = dict()          # type: Dict[str, LightStackEntry]
+        """Entries in stack by key. Every key exists only once in the stack."""
+
     @classmethod
     def device_class_init(cls, machine: MachineController):
         """Register handler for duplicate light number checks."""
@@ -402,15 +417,12 @@ class Light(SystemWideDevice, DevicePositionMixin):
         color_below = self.get_color_below(priority, key)
         self._remove_from_stack_by_key(key)
 
-        self.stack.append(LightStackEntry(priority,
-                                          key,
-                                          start_time,
-                                          color_below,
-                                          dest_time,
-                                          color))
-
-        if len(self.stack) > 1:
-            self.stack.sort(reverse=True)
+        self._stack_insert(LightStackEntry(priority,
+                                           key,
+                                           start_time,
+                                           color_below,
+                                           dest_time,
+                                           color))
 
         if self._debug:
             self.debug_log("+-------------- Adding to stack ----------------+")
@@ -441,22 +453,17 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         key = str(key)
 
-        priority = None
-        color_changes = True
-        stack = []
-        for i, entry in enumerate(self.stack):
-            if entry.key == key:
-                stack = self.stack[i:]
-                priority = entry.priority
-                break
-            elif entry.dest_color is not None:
-                # no transparency above key
-                color_changes = False
-
+        entry = self._stack_index.get(key)
         # key not in stack
-        if not stack:
+        if entry is None:
             return
 
+        priority = entry.priority
+        position = self._get_stack_position(entry)
+        stack = self.stack[position:]
+        # no transparency above key
+        color_changes = all(entry_above.dest_color is None for entry_above in self.stack[:position])
+
         # this is already a fadeout. do not fade out the fade out.
         if stack[0].dest_color is None:
             fade_ms = None
@@ -467,52 +474,63 @@ class Light(SystemWideDevice, DevicePositionMixin):
         self._remove_from_stack_by_key(key)
         if fade_ms:
             start_time = self.machine.clock.get_time()
-            self.stack.append(LightStackEntry(priority,
-                                              key,
-                                              start_time,
-                                              color_of_key,
-                                              start_time + fade_ms / 1000.0,
-                                              None))
+            self._stack_insert(LightStackEntry(priority,
+                                               key,
+                                               start_time,
+                                               color_of_key,
+                                               start_time + fade_ms / 1000.0,
+                                               None))
             self.delay.reset(ms=fade_ms, callback=partial(self._remove_fade_out, key=key), name="remove_fade")
-            if len(self.stack) > 1:
-                self.stack.sort(reverse=True)
 
         if color_changes:
             self._schedule_update()
 
     def _remove_fade_out(self, key):
         """Remove a timed out fade out."""
-        if not self.stack:
+        entry = self._stack_index.get(key)
+        if entry is None or entry.dest_color is not None:
             return
 
-        found = False
-        color_change = True
-        for _, entry in enumerate(self.stack):
-            if entry.key == key and entry.dest_color is None:
-                found = True
-                break
-            elif entry.dest_color is not None:
-                # found entry above the removed which is non-transparent
-                color_change = False
+        # check if there is a non-transparent entry above the removed one
+        color_change = all(entry_above.dest_color is None
+                           for entry_above in self.stack[:self._get_stack_position(entry)])
 
-        if found:
-            self.debug_log("Removing fadeout for key '%s' from stack", key)
-            self.stack = [x for x in self.stack if x.key != key or x.dest_color is not None]
+        self.debug_log("Removing fadeout for key '%s' from stack", key)
+        self._stack_remove(entry)
 
-        if found and color_change:
+        if color_change:
             self._schedule_update()
 
     def _remove_from_stack_by_key(self, key):
         """Remove a key from stack."""
-        # tune the common case
-        if not self.stack:
+        entry = self._stack_index.get(key)
+        if entry is None:
             return
         self.debug_log("Removing key '%s' from stack", key)
-        if len(self.stack) == 1:
-            if self.stack[0].key == key:
-                self.stack = []
-        else:
-            self.stack = [x for x in self.stack if x.key != key]
+        self._stack_remove(entry)
+
+    def _get_stack_position(self, entry: LightStackEntry) -> int:
+        """Return the index of an entry in stack."""
+        return len(self.stack) - 1 - bisect_left(self._stack_keys, entry.sort_key)
+
+    def _stack_insert(self, entry: LightStackEntry):
+        """Insert an entry into the stack at its sorted position.
+
+        The key must not be in the stack already.
+        """
+        sort_key = entry.sort_key
+        position = bisect_left(self._stack_keys, sort_key)
+        self._stack_keys.insert(position, sort_key)
+        # stack is sorted in reverse order
+        self.stack.insert(len(self.stack) - position, entry)
+        self._stack_index[entry.key] = entry
+
+    def _stack_remove(self, entry: LightStackEntry):
+        """Remove an entry from the stack."""
+        position = bisect_left(self._stack_keys, entry.sort_key)
+        del self._stack_keys[position]
+        del self.stack[len(self.stack) - 1 - position]
+        del self._stack_index[entry.key]
 
     def _schedule_update(self):
         for hw_driver, function in self.hw_driver_functions:
@@ -524,20 +542,18 @@ class Light(SystemWideDevice, DevicePositionMixin):
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
         self.stack = []
+        self._stack_keys = []
+        self._stack_index = {}
 
         self.debug_log("Clearing Stack")
 
         self._schedule_update()
 
     def _get_priority_from_key(self, key):
-        if not self.stack:
-            return 0
-        if self.stack[0].key == key:
-            return self.stack[0].priority
-        try:
-            return [x for x in self.stack if x.key == key][0].priority
-        except IndexError:
+        entry = self._stack_index.get(key)
+        if entry is None:
             return 0
+        return entry.priority
 
     def gamma_correct(self, color):
         """Apply max brightness correction to color.
@@ -549,10 +565,11 @@ class Light(SystemWideDevice, DevicePositionMixin):
             An updated RGBColor() instance with gamma corrected.
         """
         factor = self.machine.get_machine_var("brightness")
-        if not factor:
+        if not factor or factor == 1.0:
             return color
         else:
-            return RGBColor([int(x * factor) for x in color])
+            red, green, blue = color.rgb
+            return RGBColor.from_rgb((int(red * factor), int(green * factor), int(blue * factor)))
 
     def color_correct(self, color):
         """Apply the current color correction profile to the color passed.
@@ -655,8 +672,11 @@ class Light(SystemWideDevice, DevicePositionMixin):
             # fast path for resetting the top element
             return self._get_color_and_fade(self.stack, 0)[0]
 
+        # entries which are not below (priority, key) in sort order can never match. skip them
+        start = len(self.stack) - bisect_right(self._stack_keys, (priority, key))
         stack = []
-        for i, entry in enumerate(self.stack):
+        for i in range(start, len(self.stack)):
+            entry = self.stack[i]
             if entry.priority <= priority and entry.key <= key:
                 stack = self.stack[i:]
                 break
@@ -33,6 +33,7 @@ class LogicBlock(SystemWideDevice, ModeDevice):
         super().__init__(machine, name)
         self._state = None          # type: LogicBlockState
         self._start_enabled = None  # type: bool
+        self._update_event = "logicblock_{}_updated".format(self.name)
 
         self.player_state_variable = "{}_state".format(self.name)
         '''player_var: (logic_block)_state
@@ -151,9 +152,11 @@ class LogicBlock(SystemWideDevice, ModeDevice):
     def post_update_event(self, **kwargs):
         """Post an event to notify about changes."""
         del kwargs
+        if not self.machine.events.has_handlers_for_family(self._update_event):
+            return
         value = self._state.value
         enabled = self._state.enabled
-        self.machine.events.post("logicblock_{}_updated".format(self.name), value=value, enabled=enabled)
+        self.machine.events.post(self._update_event, value=value, enabled=enabled)
         '''event: logicblock_(name)_updated
 
         desc: The logic block called "name" has changed.
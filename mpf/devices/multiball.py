@@ -28,6 +28,7 @@ class Multiball(SystemWideDevice, ModeDevice):
         self.balls_live_target = 0
         self.enabled = False
         self.shoot_again = False
+        self._counting_balls = False
 
     @property
     def can_exist_outside_of_game(self):
@@ -49,6 +50,10 @@ class Multiball(SystemWideDevice, ModeDevice):
         yield from super()._initialize()
         self.ball_locks = self.config['ball_locks']
         self.source_playfield = self.config['source_playfield']
+        # ball_drain handlers stay registered and check shoot_again and _counting_balls. shoot again runs below
+        # ball saves (priority 1000 and 1001 for early saves) so an active ball save always gets a drain first
+        self.machine.events.add_handler('ball_drain', self._ball_drain_shoot_again, priority=999)
+        self.machine.events.add_handler('ball_drain', self._ball_drain_count_balls)
 
     @classmethod
     def prepare_config(cls, config, is_mode_config):
@@ -111,16 +116,11 @@ class Multiball(SystemWideDevice, ModeDevice):
         if not self.config['shoot_again']:
             # No shoot again. Just stop multiball right away
             self.stop()
-        else:
-            # Enable shoot again
-            self.machine.events.add_handler('ball_drain',
-                                            self._ball_drain_shoot_again,
-                                            priority=1000)
-            # Register stop handler
-            if self.config['shoot_again'] > 0:
-                self.delay.add(name='disable_shoot_again',
-                               ms=self.config['shoot_again'],
-                               callback=self.stop)
+        elif self.config['shoot_again'] > 0:
+            # Register stop handler. Shoot again is active until then.
+            self.delay.add(name='disable_shoot_again',
+                           ms=self.config['shoot_again'],
+                           callback=self.stop)
 
         self.machine.events.post("multiball_" + self.name + "_started",
                                  balls=self.balls_live_target)
@@ -132,6 +132,8 @@ class Multiball(SystemWideDevice, ModeDevice):
 
     def _ball_drain_shoot_again(self, balls, **kwargs):
         del kwargs
+        if not self.shoot_again:
+            return None
 
         balls_to_safe = self.balls_live_target - self.machine.game.balls_in_play + balls
 
@@ -157,6 +159,8 @@ class Multiball(SystemWideDevice, ModeDevice):
 
     def _ball_drain_count_balls(self, balls, **kwargs):
         del kwargs
+        if not self._counting_balls:
+            return
         self.machine.events.post("multiball_{}_ball_lost".format(self.name))
         '''event: multiball_(name)_lost_ball
         desc: The multiball called (name) has lost a ball after ball save expired.
@@ -165,7 +169,7 @@ class Multiball(SystemWideDevice, ModeDevice):
         if not self.machine.game or self.machine.game.balls_in_play - balls < 1:
             self.balls_added_live = 0
             self.balls_live_target = 0
-            self.machine.events.remove_handler(self._ball_drain_count_balls)
+            self._counting_balls = False
             self.machine.events.post("multiball_{}_ended".format(self.name))
             '''event: multiball_(name)_ended
             desc: The multiball called (name) has just ended.
@@ -179,17 +183,13 @@ class Multiball(SystemWideDevice, ModeDevice):
         self.debug_log("Stopping shoot again of multiball")
         self.shoot_again = False
 
-        # disable shoot again
-        self.machine.events.remove_handler(self._ball_drain_shoot_again)
-
         self.machine.events.post("multiball_" + self.name + "_shoot_again_ended")
         '''event: multiball_(name)_shoot_again_ended
         desc: Shoot again for multiball (name) has ended.
         '''
 
-        # add handler for ball_drain until self.balls_ejected are drained
-        self.machine.events.remove_handler(self._ball_drain_count_balls)
-        self.machine.events.add_handler('ball_drain', self._ball_drain_count_balls)
+        # count drained balls until self.balls_ejected are drained
+        self._counting_balls = True
 
     @event_handler(8)
     def add_a_ball(self, **kwargs):
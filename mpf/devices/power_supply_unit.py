@@ -15,6 +15,17 @@ class PowerSupplyUnit(SystemWideDevice):
         super().__init__(machine, name)
         self._busy_until = None
 
+    def get_next_pulse_time(self) -> float:
+        """Return the clock time when the next pulse can be issued without waiting."""
+        current_time = self.machine.clock.get_time()
+        if self._busy_until and self._busy_until > current_time:
+            return self._busy_until
+        return current_time
+
+    def get_pulse_spacing(self, pulse_ms) -> float:
+        """Return the time in seconds the PSU is busy after a pulse of pulse_ms."""
+        return (pulse_ms + self.config['release_wait_ms']) / 1000.0
+
     def get_wait_time_for_pulse(self, pulse_ms, max_wait_ms) -> int:
         """Return a wait time for a pulse or 0."""
         current_time = self.machine.clock.get_time()
@@ -36,7 +47,7 @@ class PowerSupplyUnit(SystemWideDevice):
 
             # calculate wait time and return it
             wait_ms = (self._busy_until - current_time) * 1000
-            self._busy_until += (pulse_ms + self.config['release_wait_ms']) / 1000.0
+            self._busy_until += self.get_pulse_spacing(pulse_ms)
             return wait_ms
 
     def notify_about_instant_pulse(self, pulse_ms):
@@ -44,6 +55,6 @@ class PowerSupplyUnit(SystemWideDevice):
         if self._busy_until:
             self._busy_until = max(
                 self._busy_until,
-                self.machine.clock.get_time() + (pulse_ms + self.config['release_wait_ms']) / 1000.0)
+                self.machine.clock.get_time() + self.get_pulse_spacing(pulse_ms))
         else:
-            self._busy_until = self.machine.clock.get_time() + ((pulse_ms + self.config['release_wait_ms']) / 1000.0)
+            self._busy_until = self.machine.clock.get_time() + self.get_pulse_spacing(pulse_ms)
@@ -1,8 +1,6 @@
 """Contains the base classes for mechanical EM-style score reels."""
 import asyncio
 
-from mpf.core.utility_functions import Util
-
 from mpf.core.delays import DelayManager
 from mpf.core.system_wide_device import SystemWideDevice
 
@@ -42,12 +40,14 @@ class ScoreReel(SystemWideDevice):
         self._destination_value = 0
         # Holds the index of the destination the reel is trying to advance to.
 
-        self._runner = None
-        # asyncio task which advances the reel
+        self._started = False
+        # switch handlers are active and the reel may move
+
+        self._pulse_timer = None
+        # timer which fires when the last pulse is done. the reel ignores switch changes while it is set
 
-        self._busy = asyncio.Event(loop=self.machine.clock.loop)
-        self._busy.set()
-        # will be cleared when the runner is done. set to trigger the runner
+        self._planned = False
+        # the score reel group pulses this reel. the reel ignores switch changes while it is set
 
         self._ready = asyncio.Event(loop=self.machine.clock.loop)
         # will be set when this real is ready and shows the destination value
@@ -69,21 +69,39 @@ class ScoreReel(SystemWideDevice):
         for value in range(num_values):
             self.value_switches.append(self.config.get('switch_' + str(value)))
 
-        self._runner = self.machine.clock.loop.create_task(self._run())
-        self._runner.add_done_callback(self._done)
+        self.machine.events.add_handler("init_phase_3", self._start)
+
+    def _start(self, **kwargs):
+        """Watch the value switches and move to the destination value."""
+        del kwargs
+        for switch in self.value_switches:
+            if switch is None:
+                continue
+            for state in (0, 1):
+                self.machine.switch_controller.add_switch_handler_obj(
+                    switch, self._value_switch_changed, state=state, ms=self.config['hw_confirm_time'])
+
+        self._started = True
+        self.check_hw_switches()
+        self._advance_reel_if_position_does_not_match()
 
     def stop(self, **kwargs):
         """Stop device."""
         del kwargs
-        if self._runner:
-            self._runner.cancel()
+        self._started = False
+        self._planned = False
+        if self._pulse_timer:
+            self.machine.clock.unschedule(self._pulse_timer)
+            self._pulse_timer = None
+
+    def _value_switch_changed(self):
+        """Check the value when a value switch changed and stayed for hw_confirm_time."""
+        if self._pulse_timer or self._planned or not self._started:
+            # the reel checks its switches when the pulse is done
+            return
 
-    @staticmethod
-    def _done(future):
-        try:
-            future.result()
-        except asyncio.CancelledError:
-            pass
+        self.check_hw_switches()
+        self._advance_reel_if_position_does_not_match()
 
     def check_hw_switches(self):
         """Check all the value switches for this score reel.
@@ -120,7 +138,6 @@ class ScoreReel(SystemWideDevice):
                             self.log.warning("Reel desynced. Assumed: %s. Real: %s", self.assumed_value, i)
 
                         self.assumed_value = i
-                        self._busy.set()
                         self._ready.clear()
                     return
 
@@ -130,61 +147,100 @@ class ScoreReel(SystemWideDevice):
                                                              ms=self.config['hw_confirm_time'])):
             self.log.warning("Resetting value because the switch for %s is not active.", self.assumed_value)
             self.assumed_value = -999
-            self._busy.set()
             self._ready.clear()
 
-    @asyncio.coroutine
-    def _run(self):
-        yield from self.machine.events.wait_for_event("init_phase_3")
-        self.check_hw_switches()
-        while True:
-            # wait for either a new value or a switch change
-            switch_change_future = self.machine.switch_controller.wait_for_any_switch(
-                switch_names=[switch.name for switch in self.value_switches if switch is not None], state=2,
-                ms=self.config['hw_confirm_time'])
-            result = yield from Util.first([switch_change_future, self._busy.wait()], loop=self.machine.clock.loop)
-            if result == switch_change_future:
-                self.check_hw_switches()
-                continue
-
-            # advance the reel until we reached our destination position
-            yield from self._advance_reel_if_position_does_not_match()
-
-    @asyncio.coroutine
     def _advance_reel_if_position_does_not_match(self):
         """Advance reel if the destination value has not been reached."""
+        if self._pulse_timer or self._planned or not self._started:
+            # the running pulse train will continue to the new destination
+            return
+
         # check if there is any need to do something
         if self._destination_value == self.assumed_value:
             self.log.debug("Reel is already at value %s (will not move)", self._destination_value)
-            self._busy.clear()
             self._ready.set()
             return
 
         self.log.debug("Advancing reel to value %s (current value: %s repeat_pulse_time: %sms)",
                        self._destination_value, self.assumed_value, self.config['repeat_pulse_time'])
-        while self._destination_value != self.assumed_value:
-            wait_ms = self.config['coil_inc'].pulse(max_wait_ms=500)
-            previous_value = self.assumed_value
-
-            yield from asyncio.sleep((wait_ms + self.config['repeat_pulse_time']) / 1000, loop=self.machine.clock.loop)
-            if self.assumed_value >= 0:
-                self.assumed_value += 1
-                self.assumed_value %= len(self.value_switches)
+        self._ready.clear()
+        self._pulse()
 
-            self.check_hw_switches()
+    def _pulse(self):
+        """Pulse the coil and check the value when the pulse is done."""
+        wait_ms = self.config['coil_inc'].pulse(max_wait_ms=500)
+        self._pulse_timer = self.machine.clock.schedule_once(
+            self._pulse_done, (wait_ms + self.config['repeat_pulse_time']) / 1000)
 
-            if previous_value != self.assumed_value and self.assumed_value >= 0:
-                self.machine.events.post('reel_{}_advance'.format(self.name))
-                '''event: reel_(name)_advance
+    def _pulse_done(self):
+        self._pulse_timer = None
+        self._count_pulse()
 
-                desc: The reel (name) advanced to the next position.
-                '''
-            self.log.debug("Assumed value: %s", self.assumed_value)
+        if self._destination_value != self.assumed_value:
+            self._pulse()
+            return
 
-        self._busy.clear()
         self._ready.set()
         self.log.debug("Advancing to %s successful.", self._destination_value)
 
+    def _count_pulse(self):
+        """Advance the assumed value after a pulse and verify it with the value switches."""
+        previous_value = self.assumed_value
+        if self.assumed_value >= 0:
+            self.assumed_value += 1
+            self.assumed_value %= len(self.value_switches)
+
+        self.check_hw_switches()
+
+        if previous_value != self.assumed_value and self.assumed_value >= 0:
+            self.machine.events.post('reel_{}_advance'.format(self.name))
+            '''event: reel_(name)_advance
+
+            desc: The reel (name) advanced to the next position.
+            '''
+        self.log.debug("Assumed value: %s", self.assumed_value)
+
+    def get_pulses_to(self, value, pulses_in_flight=0) -> int:
+        """Return the number of pulses to advance to value or -1 if the value of the reel is unknown.
+
+        Args:
+            value: The value the reel should show.
+            pulses_in_flight: Pulses which have been issued but are not counted in the assumed value yet.
+        """
+        if self.assumed_value < 0:
+            return -1
+        return (value - self.assumed_value - pulses_in_flight) % len(self.value_switches)
+
+    def start_planned_move(self, value) -> bool:
+        """Set the destination value and let the score reel group plan the pulses.
+
+        Returns False if the reel has to move on its own. That is the case if it
+        is not started, runs its own pulse train or does not know its value.
+        """
+        if self._pulse_timer or not self._started or self.assumed_value < 0:
+            self.set_destination_value(value)
+            return False
+
+        self.log.debug("Setting planned score_reel value. Old destination value: %s, New destination value: %s",
+                       self._destination_value, value)
+        self._destination_value = value
+        self._planned = True
+        self._ready.clear()
+        return True
+
+    def planned_pulse(self) -> int:
+        """Pulse the coil for a planned pulse and return how long the PSU delayed it in ms."""
+        return self.config['coil_inc'].pulse(max_wait_ms=500)
+
+    def planned_pulse_done(self):
+        """Count a planned pulse after repeat_pulse_time."""
+        self._count_pulse()
+
+    def end_planned_move(self):
+        """Become ready or continue on its own when the group has no more pulses planned."""
+        self._planned = False
+        self._advance_reel_if_position_does_not_match()
+
     def wait_for_ready(self):
         """Return a future for ready."""
         return self._ready.wait()
@@ -205,5 +261,5 @@ class ScoreReel(SystemWideDevice):
 
             self._destination_value = value
 
-            self._busy.set()
             self._ready.clear()
+            self._advance_reel_if_position_does_not_match()
@@ -1,4 +1,5 @@
 """A group of score reels."""
+import heapq
 from collections import deque
 
 import asyncio
@@ -6,6 +7,10 @@ import asyncio
 from mpf.core.system_wide_device import SystemWideDevice
 from mpf.devices.score_reel_controller import ScoreReelController
 
+# kinds of planned events. a reel counts its last pulse before its next pulse at the same time
+PULSE_DONE = 0
+PULSE = 1
+
 
 class ScoreReelGroup(SystemWideDevice):
 
@@ -56,6 +61,20 @@ class ScoreReelGroup(SystemWideDevice):
 
         self._tick_task = None
 
+        self._plan = []
+        # Heap of planned events (time, kind, reel index) for all reels which
+        # move to the desired value. It contains the pulses which have not
+        # been issued yet and the pulses which are done at time.
+
+        self._planned_reels = set()
+        # Indices of the reels which are moved by the plan.
+
+        self._planned_pulses = []
+        # Number of pulses per reel which have not been issued yet.
+
+        self._plan_timer = None
+        self._plan_timer_time = None
+
     @asyncio.coroutine
     def _initialize(self):
         yield from super()._initialize()
@@ -72,6 +91,9 @@ class ScoreReelGroup(SystemWideDevice):
                                                 handler=self.chime,
                                                 chime=self.config['chimes'][i])
 
+        self._planned_pulses = [0] * len(self.reels)
+        self.machine.events.add_handler("shutdown", self._stop_plan)
+
     @classmethod
     def chime(cls, chime, **kwargs):
         """Pulse chime."""
@@ -107,12 +129,117 @@ class ScoreReelGroup(SystemWideDevice):
         # where we want them to.
         self.desired_value_list = value_list
 
-        # loop through the reels one by one
+        # reels which know their value are pulsed by one plan for the group
         for i in range(len(self.reels)):
             if not self.reels[i]:
                 continue
 
-            self.reels[i].set_destination_value(self.desired_value_list[i])
+            if self.reels[i].start_planned_move(self.desired_value_list[i]):
+                self._planned_reels.add(i)
+
+        self._plan_pulses()
+        self._schedule_plan()
+
+    def _plan_pulses(self):
+        """Plan the pulses of all planned reels as one batch.
+
+        Pulses which have not been issued yet are planned again. Every reel
+        waits repeat_pulse_time between its pulses and reels which share a PSU
+        are spaced apart like the PSU would delay them. The lowest reel pulses
+        first when two reels could pulse at the same time.
+        """
+        now = self.machine.clock.get_time()
+        self._plan = [event for event in self._plan if event[1] == PULSE_DONE]
+        heapq.heapify(self._plan)
+        reel_next = {index: done_time for done_time, _, index in self._plan}
+
+        pulses = {}
+        for index in sorted(self._planned_reels):
+            reel = self.reels[index]
+            self._planned_pulses[index] = 0
+            count = reel.get_pulses_to(self.desired_value_list[index], 1 if index in reel_next else 0)
+            if count > 0:
+                pulses[index] = count
+                reel_next.setdefault(index, now)
+            elif index not in reel_next:
+                # at the destination or the value is unknown
+                self._planned_reels.discard(index)
+                reel.end_planned_move()
+
+        psu_next = {}
+        while pulses:
+            pulse_time = pulse_index = None
+            for index in pulses:
+                psu = self.reels[index].config['coil_inc'].config['psu']
+                if psu not in psu_next:
+                    psu_next[psu] = psu.get_next_pulse_time()
+                index_time = max(reel_next[index], psu_next[psu])
+                if pulse_time is None or index_time < pulse_time:
+                    pulse_time = index_time
+                    pulse_index = index
+
+            coil = self.reels[pulse_index].config['coil_inc']
+            heapq.heappush(self._plan, (pulse_time, PULSE, pulse_index))
+            self._planned_pulses[pulse_index] += 1
+            reel_next[pulse_index] = pulse_time + self.reels[pulse_index].config['repeat_pulse_time'] / 1000.0
+            psu_next[coil.config['psu']] = pulse_time + coil.config['psu'].get_pulse_spacing(
+                coil.get_and_verify_pulse_ms(None))
+
+            pulses[pulse_index] -= 1
+            if not pulses[pulse_index]:
+                del pulses[pulse_index]
+
+    def _schedule_plan(self):
+        """Run the plan when its next event is due."""
+        next_time = self._plan[0][0] if self._plan else None
+        if next_time == self._plan_timer_time:
+            return
+
+        if self._plan_timer:
+            self.machine.clock.unschedule(self._plan_timer)
+            self._plan_timer = None
+
+        self._plan_timer_time = next_time
+        if next_time is not None:
+            self._plan_timer = self.machine.clock.schedule_at(self._run_plan, next_time)
+
+    def _run_plan(self):
+        """Issue all pulses and count all pulses which are due."""
+        self._plan_timer = None
+        self._plan_timer_time = None
+        now = self.machine.clock.get_time()
+        replan = False
+        while self._plan and self._plan[0][0] <= now:
+            event_time, kind, index = heapq.heappop(self._plan)
+            reel = self.reels[index]
+            if kind == PULSE:
+                self._planned_pulses[index] -= 1
+                wait_ms = reel.planned_pulse()
+                heapq.heappush(self._plan, (
+                    now + (wait_ms + reel.config['repeat_pulse_time']) / 1000.0, PULSE_DONE, index))
+                if wait_ms or now > event_time:
+                    # the pulse did not happen at the planned time
+                    replan = True
+                continue
+
+            reel.planned_pulse_done()
+            if reel.get_pulses_to(self.desired_value_list[index]) != self._planned_pulses[index]:
+                # the reel desynced or did not advance
+                replan = True
+            elif not self._planned_pulses[index]:
+                self._planned_reels.discard(index)
+                reel.end_planned_move()
+
+        if replan:
+            self._plan_pulses()
+        self._schedule_plan()
+
+    def _stop_plan(self, **kwargs):
+        """Stop to pulse reels."""
+        del kwargs
+        self._plan = []
+        self._planned_reels = set()
+        self._schedule_plan()
 
     def wait_for_ready(self):
         """Return a future which will be done when all reels reached their destination."""
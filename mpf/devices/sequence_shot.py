@@ -1,14 +1,14 @@
 """A shot in MPF."""
 import asyncio
-import uuid
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from itertools import count
 from typing import List, Dict, Set
 
-import mpf.core.delays
 from mpf.core.mode import Mode
 from mpf.core.player import Player
 from mpf.core.mode_device import ModeDevice
 from mpf.core.system_wide_device import SystemWideDevice
+from mpf.core.timeout_queue import TimeoutQueue
 
 ActiveSequence = namedtuple("ActiveSequence", ["id", "current_position_index", "next_event"])
 
@@ -25,12 +25,16 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         """Initialise sequence shot."""
         super().__init__(machine, name)
 
-        self.delay = mpf.core.delays.DelayManager(self.machine.delayRegistry)
-        self.active_sequences = list()  # type: List[ActiveSequence]
+        # sequence timeouts (int sequence ids) and delay timers (str names) share one timer
+        self._timeouts = TimeoutQueue(self.machine.clock, self._timeout)
+        self._sequence_ids = count()
+        # event -> active sequences (id -> position index) which wait for this event in the order they started to
+        # wait
+        self._waiting = {}              # type: Dict[str, OrderedDict[int, int]]
+        self._waiting_for = {}          # type: Dict[int, str]
         self.active_delays = set()      # type: Set[str]
 
         self._sequence_events = []      # type: List[str]
-        self._delay_events = {}         # type: Dict[str, int]
 
     @property
     def can_exist_outside_of_game(self):
@@ -53,7 +57,8 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         del mode
         self._remove_handlers()
         self._reset_all_sequences()
-        self.delay.clear()
+        self._timeouts.clear()
+        self.active_delays = set()
 
     @asyncio.coroutine
     def _initialize(self):
@@ -66,6 +71,14 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         for switch in self.config['switch_sequence']:
             self._sequence_events.append(self.machine.switch_controller.get_active_event_for_switch(switch.name))
 
+        self._waiting = {event: OrderedDict() for event in self._sequence_events[1:]}
+
+    @property
+    def active_sequences(self) -> List[ActiveSequence]:
+        """Return all active sequences."""
+        return [ActiveSequence(seq_id, self._waiting[event][seq_id], event)
+                for seq_id, event in self._waiting_for.items()]
+
     def _register_handlers(self):
         for event in set(self._sequence_events):
             self.machine.events.add_handler(event, self._sequence_advance, event_name=event)
@@ -113,14 +126,11 @@ class SequenceShot(SystemWideDevice, ModeDevice):
                 # if it only has one step it will finish right away
                 self._completed()
         else:
-            # Get the seq_id of the first sequence this switch is next for.
-            # This is not a loop because we only want to advance 1 sequence
-            seq = next((x for x in self.active_sequences if
-                        x.next_event == event_name), None)
-
-            if seq:
-                # advance this sequence
-                self._advance_sequence(seq)
+            # advance the first sequence which waits for this event. This is not a loop because we only want to
+            # advance 1 sequence
+            waiting = self._waiting.get(event_name)
+            if waiting:
+                self._advance_sequence(*waiting.popitem(last=False))
 
     def _start_new_sequence(self):
         # If the sequence hasn't started, make sure we're not within the
@@ -132,41 +142,41 @@ class SequenceShot(SystemWideDevice, ModeDevice):
             return
 
         # create a new sequence
-        seq_id = uuid.uuid4()
+        seq_id = next(self._sequence_ids)
         next_event = self._sequence_events[1]
 
         self.debug_log("Setting up a new sequence. Next: %s", next_event)
 
-        self.active_sequences.append(ActiveSequence(seq_id, 0, next_event))
+        self._wait_for(seq_id, 0, next_event)
 
         # if this sequence has a time limit, set that up
         if self.config['sequence_timeout']:
             self.debug_log("Setting up a sequence timer for %sms",
                            self.config['sequence_timeout'])
 
-            self.delay.reset(name=seq_id,
-                             ms=self.config['sequence_timeout'],
-                             callback=self._sequence_timeout,
-                             seq_id=seq_id)
+            self._timeouts.add_ms(seq_id, self.config['sequence_timeout'])
 
-    def _advance_sequence(self, sequence: ActiveSequence):
-        # Remove this sequence from the list
-        self.active_sequences.remove(sequence)
+    def _wait_for(self, seq_id: int, current_position_index: int, next_event: str):
+        self._waiting[next_event][seq_id] = current_position_index
+        self._waiting_for[seq_id] = next_event
 
-        if sequence.current_position_index == (len(self._sequence_events) - 2):  # complete
+    def _advance_sequence(self, seq_id: int, current_position_index: int):
+        del self._waiting_for[seq_id]
+
+        if current_position_index == (len(self._sequence_events) - 2):  # complete
 
             self.debug_log("Sequence complete!")
 
-            self.delay.remove(sequence.id)
+            self._timeouts.remove(seq_id)
             self._completed()
 
         else:
-            current_position_index = sequence.current_position_index + 1
+            current_position_index += 1
             next_event = self._sequence_events[current_position_index + 1]
 
             self.debug_log("Advancing the sequence. Next: %s", next_event)
 
-            self.active_sequences.append(ActiveSequence(sequence.id, current_position_index, next_event))
+            self._wait_for(seq_id, current_position_index, next_event)
 
     def _completed(self):
         """Post sequence complete event."""
@@ -181,30 +191,31 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         self._reset_all_sequences()
 
     def _reset_all_sequences(self):
-        seq_ids = [x.id for x in self.active_sequences]
-
-        for seq_id in seq_ids:
-            self.delay.remove(seq_id)
+        for seq_id in self._waiting_for:
+            self._timeouts.remove(seq_id)
 
-        self.active_sequences = list()
+        self._waiting_for = {}
+        for waiting in self._waiting.values():
+            waiting.clear()
 
     def _delay_switch_hit(self, name, ms, **kwargs):
         del kwargs
-        self.delay.reset(name=name + '_delay_timer',
-                         ms=ms,
-                         callback=self._release_delay,
-                         delay_name=name)
-
+        self._timeouts.add_ms(name, ms)
         self.active_delays.add(name)
 
-    def _release_delay(self, delay_name):
-        self.active_delays.remove(delay_name)
+    def _timeout(self, key):
+        if isinstance(key, str):
+            # delay timer of delay_switch_list or delay_event_list
+            self.active_delays.remove(key)
+        else:
+            self._sequence_timeout(key)
 
     def _sequence_timeout(self, seq_id):
         """Sequence timeouted."""
         self.debug_log("Sequence %s timeouted", seq_id)
 
-        self.active_sequences = [x for x in self.active_sequences
-                                 if x[0] != seq_id]
+        next_event = self._waiting_for.pop(seq_id, None)
+        if next_event:
+            del self._waiting[next_event][seq_id]
 
         self.machine.events.post("{}_timeout".format(self.name))
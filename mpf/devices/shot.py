@@ -250,74 +250,76 @@ class Shot(EnableDisableMixin, ModeDevice):
 
         self._notify_monitors(self.config['profile'].name, state)
 
-        self.machine.events.post('{}_hit'.format(self.name),
-                                 profile=self.profile_name, state=state, advancing=advancing)
-        '''event: (shot)_hit
-        desc: The shot called (shot) was just hit.
-
-        Note that there are four events posted when a shot is hit, each
-        with variants of the shot name, profile, and current state,
-        allowing you to key in on the specific granularity you need.
-
-        args:
-        profile: The name of the profile that was active when hit.
-        state: The name of the state the profile was in when it was hit'''
-
-        self.machine.events.post('{}_{}_hit'.format(self.name, self.profile_name),
-                                 profile=self.profile_name, state=state, advancing=advancing)
-        '''event: (shot)_(profile)_hit
-        desc: The shot called (shot) was just hit with the profile (profile)
-        active.
-
-        Note that there are four events posted when a shot is hit, each
-        with variants of the shot name, profile, and current state,
-        allowing you to key in on the specific granularity you need.
-
-        Also remember that shots can have more than one active profile at a
-        time (typically each associated with a mode), so a single hit to this
-        shot might result in this event being posted multiple times with
-        different (profile) values.
-
-        args:
-        profile: The name of the profile that was active when hit.
-        state: The name of the state the profile was in when it was hit'''
-
-        self.machine.events.post('{}_{}_{}_hit'.format(self.name, self.profile_name, state),
-                                 profile=self.profile_name, state=state, advancing=advancing)
-        '''event: (shot)_(profile)_(state)_hit
-        desc: The shot called (shot) was just hit with the profile (profile)
-        active in the state (state).
-
-        Note that there are four events posted when a shot is hit, each
-        with variants of the shot name, profile, and current state,
-        allowing you to key in on the specific granularity you need.
-
-        Also remember that shots can have more than one active profile at a
-        time (typically each associated with a mode), so a single hit to this
-        shot might result in this event being posted multiple times with
-        different (profile) and (state) values.
-
-        args:
-        profile: The name of the profile that was active when hit.
-        state: The name of the state the profile was in when it was hit'''
-
-        self.machine.events.post('{}_{}_hit'.format(self.name, state),
-                                 profile=self.profile_name, state=state, advancing=advancing)
-        '''event: (shot)_(state)_hit
-        desc: The shot called (shot) was just hit while in the profile (state).
-
-        Note that there are four events posted when a shot is hit, each
-        with variants of the shot name, profile, and current state,
-        allowing you to key in on the specific granularity you need.
-
-        Also remember that shots can have more than one active profile at a
-        time (typically each associated with a mode), so a single hit to this
-        shot might result in this event being posted multiple times with
-        different (profile) and (state) values.
-
-        args:
-        profile: The name of the profile that was active when hit.
-        state: The name of the state the profile was in when it was hit'''
+        # most of these events have no handlers. skip formatting and posting all of them in that case
+        if self.machine.events.has_handlers_for_family(self.name + "_", "_hit"):
+            self.machine.events.post('{}_hit'.format(self.name),
+                                     profile=self.profile_name, state=state, advancing=advancing)
+            '''event: (shot)_hit
+            desc: The shot called (shot) was just hit.
+
+            Note that there are four events posted when a shot is hit, each
+            with variants of the shot name, profile, and current state,
+            allowing you to key in on the specific granularity you need.
+
+            args:
+            profile: The name of the profile that was active when hit.
+            state: The name of the state the profile was in when it was hit'''
+
+            self.machine.events.post('{}_{}_hit'.format(self.name, self.profile_name),
+                                     profile=self.profile_name, state=state, advancing=advancing)
+            '''event: (shot)_(profile)_hit
+            desc: The shot called (shot) was just hit with the profile (profile)
+            active.
+
+            Note that there are four events posted when a shot is hit, each
+            with variants of the shot name, profile, and current state,
+            allowing you to key in on the specific granularity you need.
+
+            Also remember that shots can have more than one active profile at a
+            time (typically each associated with a mode), so a single hit to this
+            shot might result in this event being posted multiple times with
+            different (profile) values.
+
+            args:
+            profile: The name of the profile that was active when hit.
+            state: The name of the state the profile was in when it was hit'''
+
+            self.machine.events.post('{}_{}_{}_hit'.format(self.name, self.profile_name, state),
+                                     profile=self.profile_name, state=state, advancing=advancing)
+            '''event: (shot)_(profile)_(state)_hit
+            desc: The shot called (shot) was just hit with the profile (profile)
+            active in the state (state).
+
+            Note that there are four events posted when a shot is hit, each
+            with variants of the shot name, profile, and current state,
+            allowing you to key in on the specific granularity you need.
+
+            Also remember that shots can have more than one active profile at a
+            time (typically each associated with a mode), so a single hit to this
+            shot might result in this event being posted multiple times with
+            different (profile) and (state) values.
+
+            args:
+            profile: The name of the profile that was active when hit.
+            state: The name of the state the profile was in when it was hit'''
+
+            self.machine.events.post('{}_{}_hit'.format(self.name, state),
+                                     profile=self.profile_name, state=state, advancing=advancing)
+            '''event: (shot)_(state)_hit
+            desc: The shot called (shot) was just hit while in the profile (state).
+
+            Note that there are four events posted when a shot is hit, each
+            with variants of the shot name, profile, and current state,
+            allowing you to key in on the specific granularity you need.
+
+            Also remember that shots can have more than one active profile at a
+            time (typically each associated with a mode), so a single hit to this
+            shot might result in this event being posted multiple times with
+            different (profile) and (state) values.
+
+            args:
+            profile: The name of the profile that was active when hit.
+            state: The name of the state the profile was in when it was hit'''
 
         if self.profile.config['block']:
             min_priority = kwargs.get("_min_priority", {"all": 0})
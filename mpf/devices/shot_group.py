@@ -119,6 +119,9 @@ class ShotGroup(ModeDevice):
         if advancing:
             self._check_for_complete()
 
+        if not self.machine.events.has_handlers_for_family(self.name + "_", "_hit"):
+            return
+
         self.machine.events.post(self.name + '_hit')
         '''event: (shot_group)_hit
         desc: A member shots in the shot group called (shot_group)
@@ -1,5 +1,6 @@
 """A generic state machine."""
 import asyncio
+from typing import Dict, List
 
 from mpf.core.mode import Mode
 from mpf.core.player import Player
@@ -20,8 +21,23 @@ class StateMachine(SystemWideDevice, ModeDevice):
         super().__init__(machine, name)
         self.player = None
         self._state = None
-        self._handlers = []
         self._show = None
+        self._active = False
+        self._transition_table = {}     # type: Dict[str, Dict[str, List[dict]]]
+
+    @asyncio.coroutine
+    def _initialize(self):
+        """Build transition table and add one handler per transition event."""
+        yield from super()._initialize()
+        for transition in self.config['transitions']:
+            for event in transition['events']:
+                transitions_by_state = self._transition_table.setdefault(event, {})
+                for state in transition['source']:
+                    transitions_by_state.setdefault(state, []).append(transition)
+
+        # handlers stay registered. they are ignored while the state machine is not active
+        for event, transitions_by_state in self._transition_table.items():
+            self.machine.events.add_handler(event, self._transition_event, transitions_by_state=transitions_by_state)
 
     @asyncio.coroutine
     def device_added_system_wide(self):
@@ -31,6 +47,7 @@ class StateMachine(SystemWideDevice, ModeDevice):
         if self.config['persist_state']:
             self.raise_config_error("Cannot set persist_state for system-wide state_machine", 1)
 
+        self._active = True
         self._start_state("start")
 
     @property
@@ -53,16 +70,16 @@ class StateMachine(SystemWideDevice, ModeDevice):
         """Restore internal state from player if persist_state is set or create new state."""
         super().device_loaded_in_mode(mode, player)
         self.player = player
+        self._active = True
         if not self.state:
             self._start_state("start")
         else:
-            self._add_handlers_for_current_state()
             self._run_show_for_current_state()
 
     def device_removed_from_mode(self, mode: Mode):
         """Unset internal state to prevent leakage."""
         super().device_removed_from_mode(mode)
-        self._remove_handlers()
+        self._active = False
         self._state = None
         self.player = None
 
@@ -71,7 +88,6 @@ class StateMachine(SystemWideDevice, ModeDevice):
             self._show = None
 
     def _stop_current_state(self):
-        self._remove_handlers()
         state_config = self.config['states'][self.state]
         if state_config['events_when_stopped']:
             for event_name in state_config['events_when_stopped']:
@@ -93,7 +109,6 @@ class StateMachine(SystemWideDevice, ModeDevice):
             for event_name in state_config['events_when_started']:
                 self.machine.events.post(event_name)
 
-        self._add_handlers_for_current_state()
         self._run_show_for_current_state()
 
     def _run_show_for_current_state(self):
@@ -103,12 +118,15 @@ class StateMachine(SystemWideDevice, ModeDevice):
             self._show = self.machine.show_controller.play_show_with_config(state_config['show_when_active'],
                                                                             self.mode)
 
-    def _add_handlers_for_current_state(self):
-        for transition in self.config['transitions']:
-            if self.state in transition['source']:
-                for event in transition['events']:
-                    self._handlers.append(self.machine.events.add_handler(event, self._transition,
-                                                                          transition_config=transition))
+    def _transition_event(self, transitions_by_state, **kwargs):
+        """Run all transitions of an event which start in the current state."""
+        del kwargs
+        if not self._active:
+            return
+
+        # all transitions of the state which was active when the event was posted run
+        for transition in transitions_by_state.get(self.state, []):
+            self._transition(transition)
 
     def _transition(self, transition_config, **kwargs):
         del kwargs
@@ -117,6 +135,3 @@ class StateMachine(SystemWideDevice, ModeDevice):
             for event_name in transition_config['events_when_transitioning']:
                 self.machine.events.post(event_name)
         self._start_state(transition_config['target'])
-
-    def _remove_handlers(self):
-        self.machine.events.remove_handlers_by_keys(self._handlers)
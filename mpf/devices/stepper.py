@@ -33,7 +33,7 @@ class Stepper(SystemWideDevice):
         self._cachedVelocity = 0
         self._isHomed = False
         self._isMoving = False
-        self._move_complete_pollrate = 100  # ms
+        self._move_task = None      # type: asyncio.Task
         self._resetPosition = 0
         self._position = None
         self._max_velocity = None
@@ -84,9 +84,9 @@ class Stepper(SystemWideDevice):
             raise RuntimeError("Cannot do a position move in velocity mode")
         if self._min_pos <= position <= self._max_pos:
             self.hw_stepper.move_abs_pos(position)
-            if self._isMoving is False:     # already moving, don't re-kickoff polling
+            if self._isMoving is False:     # already moving, don't wait twice
                 self._isMoving = True
-                self._schedule_move_complete_check()
+                self._wait_for_move_complete(homing=False)
         else:
             raise ValueError("move_abs: position argument beyond limits")
 
@@ -95,9 +95,9 @@ class Stepper(SystemWideDevice):
         if self.positionMode:
             self.hw_stepper.home()
             self._isHomed = False
-            if self._isMoving is False:     # already moving, don't re-kickoff polling
+            if self._isMoving is False:     # already moving, don't wait twice
                 self._isMoving = True
-                self._schedule_home_complete_check()
+                self._wait_for_move_complete(homing=True)
         else:
             raise RuntimeError("Cannot home in velocity mode")
 
@@ -121,44 +121,34 @@ class Stepper(SystemWideDevice):
         self.hw_stepper.stop()
         self._isMoving = False
         self._cachedVelocity = 0.0
-        self.delay.remove('stepper_move_complete_check')
-        self.delay.remove('stepper_home_complete_check')
+        if self._move_task:
+            self._move_task.cancel()
+            self._move_task = None
 
-    def _schedule_move_complete_check(self):
-        self.delay.add(name='stepper_move_complete_check',
-                       ms=self._move_complete_pollrate,
-                       callback=self._check_mv_complete)
+    def _wait_for_move_complete(self, homing):
+        """Post ready when the platform reports that the move is complete."""
+        self._move_task = self.machine.clock.loop.create_task(self._move_complete(homing))
+        self._move_task.add_done_callback(self._move_done)
 
-    def _check_mv_complete(self):
-        # TODO add timeout that stops this with error event if it hasn't made it in some amount of time
-        if not self._isMoving:
-            return
-        if self.hw_stepper.is_move_complete():
-            self._isMoving = False
-            self._cachedPosition = self.current_position()
-            self.machine.events.post('stepper_' + self.name + "_ready")
-            '''event: stepper_(name)_ready'''
-        else:
-            # reschedule
-            self._schedule_move_complete_check()
-
-    def _schedule_home_complete_check(self):
-        self.delay.add(name='stepper_home_complete_check',
-                       ms=self._move_complete_pollrate,
-                       callback=self._check_home_complete)
-
-    def _check_home_complete(self):
+    @asyncio.coroutine
+    def _move_complete(self, homing):
         # TODO add timeout that stops this with error event if it hasn't made it in some amount of time
-        if self._isHomed:
-            return
-        if self.hw_stepper.is_move_complete():
-            self._isMoving = False
+        yield from self.hw_stepper.wait_for_move_completed(self.machine.clock.loop)
+        self._isMoving = False
+        if homing:
             self._isHomed = True
-            self.machine.events.post('stepper_' + self.name + "_ready")
-            '''event: stepper_(name)_ready'''
         else:
-            # reschedule
-            self._schedule_home_complete_check()
+            self._cachedPosition = self.current_position()
+        self.machine.events.post('stepper_' + self.name + "_ready")
+        '''event: stepper_(name)_ready'''
+
+    def _move_done(self, future):
+        if self._move_task is future:
+            self._move_task = None
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
 
     @event_handler(1)
     def reset(self, **kwargs):
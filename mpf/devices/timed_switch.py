@@ -2,8 +2,11 @@
 import asyncio
 
 from mpf.core.device_monitor import DeviceMonitor
+from mpf.core.mode import Mode
 from mpf.core.mode_device import ModeDevice
+from mpf.core.player import Player
 from mpf.core.system_wide_device import SystemWideDevice
+from mpf.core.timeout_queue import TimeoutQueue
 
 
 @DeviceMonitor("active_switches")
@@ -19,6 +22,9 @@ class TimedSwitch(SystemWideDevice, ModeDevice):
         """Initialize Timed Switch."""
         super().__init__(machine, name)
         self.active_switches = set()
+        self._handlers = []
+        # switches which are in state but not yet for time
+        self._timeouts = TimeoutQueue(self.machine.clock, self._activate)
 
     def validate_and_parse_config(self, config: dict, is_mode_config: bool, debug_prefix: str = None) -> dict:
         """Validate and parse config."""
@@ -45,6 +51,15 @@ class TimedSwitch(SystemWideDevice, ModeDevice):
                 if switch not in self.config['switches']:
                     self.config['switches'].append(switch)
 
+    @asyncio.coroutine
+    def device_added_system_wide(self):
+        """Add switch handlers."""
+        yield from super().device_added_system_wide()
+        self._register_switch_handlers()
+
+    def device_loaded_in_mode(self, mode: Mode, player: Player):
+        """Add switch handlers."""
+        super().device_loaded_in_mode(mode, player)
         self._register_switch_handlers()
 
     @property
@@ -60,25 +75,34 @@ class TimedSwitch(SystemWideDevice, ModeDevice):
         """
         del mode
         self._remove_switch_handlers()
+        self._timeouts.clear()
+        self.active_switches = set()
 
     def _register_switch_handlers(self):
         for switch in self.config['switches']:
-            switch.add_handler(self._activate,
-                               state=self.config['state'] ^ 0,
-                               ms=self.config['time'], return_info=True)
-            switch.add_handler(self._deactivate,
-                               state=self.config['state'] ^ 1,
-                               ms=0, return_info=True)
+            self._handlers.append(switch.add_handler(self._switch_changed_to_state, state=self.config['state'],
+                                                     return_info=True))
+            self._handlers.append(switch.add_handler(self._deactivate, state=self.config['state'] ^ 1,
+                                                     return_info=True))
+
+            # catch switches which were already in state when the handlers were registered
+            if switch.state == self.config['state'] and \
+                    self.machine.switch_controller.ms_since_change(switch.name) < self.config['time']:
+                self._start_timeout(switch)
 
     def _remove_switch_handlers(self):
-        for switch in self.config['switches']:
-            switch.remove_handler(self._activate,
-                                  state=1 if self.config['state'] else 0)
-            switch.remove_handler(self._deactivate,
-                                  state=0 if self.config['state'] else 1)
+        for handler in self._handlers:
+            self.machine.switch_controller.remove_switch_handler_by_key(handler)
+        self._handlers = []
 
-    def _activate(self, switch_name, state, ms):
+    def _start_timeout(self, switch):
+        self._timeouts.add(switch.name, switch.last_change + self.config['time'] / 1000.0)
+
+    def _switch_changed_to_state(self, switch_name, state, ms):
         del state, ms
+        self._start_timeout(self.machine.switches[switch_name])
+
+    def _activate(self, switch_name):
         if not self.active_switches:
             for event in self.config['events_when_active']:
                 self.machine.events.post(event)
@@ -87,6 +111,7 @@ class TimedSwitch(SystemWideDevice, ModeDevice):
 
     def _deactivate(self, switch_name, state, ms):
         del state, ms
+        self._timeouts.remove(switch_name)
 
         try:
 
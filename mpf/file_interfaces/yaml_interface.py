@@ -4,6 +4,7 @@ Fixes for octal and boolean values are from here:
 http://stackoverflow.com/questions/32965846/cant-parse-yaml-correctly/
 """
 import copy
+import os
 import re
 
 from typing import Any, Iterable
@@ -21,6 +22,11 @@ from ruamel.yaml.constructor import Constructor, ConstructorError
 
 from mpf.core.file_interface import FileInterface
 
+try:
+    from ruamel.yaml.cyaml import CParser
+except ImportError:     # pragma: no cover
+    CParser = None
+
 
 class MpfResolver(BaseResolver):
 
@@ -149,6 +155,26 @@ class MpfLoader(Reader, Scanner, Parser, Composer, MpfConstructor, MpfResolver):
         MpfResolver.__init__(self)
 
 
+if CParser:
+    class MpfCLoader(CParser, MpfConstructor, MpfResolver):
+
+        """Config loader which scans and parses in libyaml.
+
+        Scalars are still resolved by MpfResolver and mappings are built by
+        MpfConstructor so the result is the same as with MpfLoader. Only the
+        marks in error messages do not contain the source line.
+        """
+
+        # pylint: disable-msg=super-init-not-called
+        def __init__(self, stream):
+            """Initialise loader."""
+            CParser.__init__(self, stream)
+            MpfConstructor.__init__(self)
+            MpfResolver.__init__(self)
+else:   # pragma: no cover
+    MpfCLoader = None
+
+
 for ch in list(u'yYnNoO'):
     del Resolver.yaml_implicit_resolvers[ch]
 
@@ -159,6 +185,8 @@ class YamlInterface(FileInterface):
 
     file_types = ['.yaml', '.yml']
     cache = False
+    # use libyaml when ruamel.yaml was built with it
+    loader = MpfCLoader if MpfCLoader else MpfLoader
     file_cache = dict()     # type: Dict[str, Any]
 
     def load(self, filename, expected_version_str=None, halt_on_error=True) -> dict:
@@ -212,15 +240,17 @@ class YamlInterface(FileInterface):
 
         return config
 
-    @staticmethod
-    def process(data_string: Iterable[str]) -> dict:
+    @classmethod
+    def process(cls, data_string: Iterable[str]) -> dict:
         """Parse yaml from a string."""
-        return yaml.load(data_string, Loader=MpfLoader)
+        return yaml.load(data_string, Loader=cls.loader)
 
     def save(self, filename: str, data: dict) -> None:   # pragma: no cover
-        """Save config to yaml file."""
+        """Save config to yaml file and flush it to disk."""
         with open(filename, 'w', encoding='utf8') as output_file:
             output_file.write(yaml.dump(data, default_flow_style=False))
+            output_file.flush()
+            os.fsync(output_file.fileno())
 
 
 file_interface_class = YamlInterface
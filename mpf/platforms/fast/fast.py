@@ -18,7 +18,7 @@ from mpf.platforms.fast import fast_defines
 from mpf.platforms.fast.fast_dmd import FASTDMD
 from mpf.platforms.fast.fast_driver import FASTDriver
 from mpf.platforms.fast.fast_gi import FASTGIString
-from mpf.platforms.fast.fast_led import FASTDirectLED, FASTDirectLEDChannel
+from mpf.platforms.fast.fast_led import FASTDirectLED, FASTDirectLEDChannel, FASTLedEncoder
 from mpf.platforms.fast.fast_light import FASTMatrixLight
 from mpf.platforms.fast.fast_serial_communicator import FastSerialCommunicator
 from mpf.platforms.fast.fast_switch import FASTSwitch
@@ -26,6 +26,7 @@ from mpf.platforms.fast.fast_switch import FASTSwitch
 from mpf.core.platform import ServoPlatform, DmdPlatform, SwitchPlatform, DriverPlatform, LightsPlatform,\
     DriverSettings, SwitchSettings, DriverConfig, SwitchConfig
 from mpf.core.utility_functions import Util
+from mpf.platforms.led_output_stage import LedFrameBuffer, LedOutputStage
 
 
 # pylint: disable-msg=too-many-instance-attributes
@@ -54,7 +55,9 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         self.rgb_connection = None
         self.serial_connections = set()         # type: Set[FastSerialCommunicator]
         self.fast_leds = {}
-        self.flag_led_tick_registered = False
+        self.led_frame = None                   # type: LedFrameBuffer
+        self.led_encoder = FASTLedEncoder()
+        self.led_output_stage = None            # type: LedOutputStage
         self.config = None
         self.machine_type = None
         self.hw_switch_data = None
@@ -262,18 +265,14 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
     def update_leds(self):
         """Update all the LEDs connected to a FAST controller.
 
-        This is done once per game loop for efficiency (i.e. all LEDs are sent as a single
+        This is done once per frame for efficiency (i.e. all changed LEDs are sent as a single
         update rather than lots of individual ones).
-
-        Also, every LED is updated every loop, even if it doesn't change. This
-        is in case some interference causes a LED to change color. Since we
-        update every loop, it will only be the wrong color for one tick.
         """
-        dirty_leds = [led for led in self.fast_leds.values() if led.dirty]
+        if self.led_output_stage:
+            self.led_output_stage.tick()
 
-        if dirty_leds:
-            msg = 'RS:' + ','.join(["%s%s" % (led.number, led.current_color) for led in dirty_leds])
-            self.rgb_connection.send(msg)
+    def _send_leds(self, msg: str):
+        self.rgb_connection.send(msg)
 
     @asyncio.coroutine
     def get_hw_switch_states(self):
@@ -577,16 +576,22 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
             return FASTMatrixLight(number, self.net_connection.send, self.machine,
                                    int(1 / self.machine.config['mpf']['default_light_hw_update_hz'] * 1000), self)
         elif not subtype or subtype == "led":
-            if not self.flag_led_tick_registered:
+            if not self.led_output_stage:
                 # Update leds every frame
-                self.machine.clock.schedule_interval(self.update_leds,
-                                                     1 / self.machine.config['mpf']['default_light_hw_update_hz'])
-                self.flag_led_tick_registered = True
+                self.led_frame = LedFrameBuffer(hardware_fade_ms=int(self.config['hardware_led_fade_time']))
+                self.led_output_stage = LedOutputStage(self.machine.clock,
+                                                       self.machine.config['mpf']['default_light_hw_update_hz'])
+                self.led_output_stage.add_frame(self.led_frame, self.led_encoder, self._send_leds)
+                self.led_output_stage.start()
 
             number_str, channel = number.split("-")
             if number_str not in self.fast_leds:
-                self.fast_leds[number_str] = FASTDirectLED(
-                    number_str, int(self.config['hardware_led_fade_time']))
+                led = FASTDirectLED(number_str, self.led_frame, len(self.led_frame))
+                self.led_frame.resize(len(self.led_frame) + 3)
+                # send all leds with the next frame
+                self.led_frame.invalidate()
+                self.led_encoder.add_led(led)
+                self.fast_leds[number_str] = led
             fast_led_channel = FASTDirectLEDChannel(self.fast_leds[number_str], channel)
 
             return fast_led_channel
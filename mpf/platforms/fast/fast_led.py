@@ -3,44 +3,70 @@ import logging
 
 from typing import Callable, Tuple
 from typing import List
-from typing import Union
 
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformInterface
+from mpf.platforms.led_output_stage import LedFrameBuffer
+
+HEX_BYTES = ["%02x" % i for i in range(256)]
 
 
 class FASTDirectLED(object):
 
-    """FAST RGB LED."""
+    """FAST RGB LED.
+
+    The three channels of the LED are stored at ``offset`` in the frame buffer
+    of the RGB processor.
+    """
 
-    __slots__ = ["number", "dirty", "hardware_fade_ms", "colors", "log"]
+    __slots__ = ["number", "frame", "offset", "log"]
 
-    def __init__(self, number: str, hardware_fade_ms: int) -> None:
+    def __init__(self, number: str, frame: LedFrameBuffer, offset: int) -> None:
         """Initialise FAST LED."""
         self.number = number
-        self.dirty = True
-        self.hardware_fade_ms = hardware_fade_ms
-        self.colors = [0, 0, 0]     # type: List[Union[int, Callable[[int], Tuple[float, int]]]]
+        self.frame = frame
+        self.offset = offset
         self.log = logging.getLogger('FASTLED')
         # All FAST LEDs are 3 element RGB and are set using hex strings
         self.log.debug("Creating FAST RGB LED at hardware address: %s", self.number)
 
     @property
     def current_color(self):
-        """Return current color."""
-        result = ""
-        self.dirty = False
+        """Return current color as it is sent to the hardware (GRB)."""
+        back = self.frame.back
+        offset = self.offset
         # send this as grb because the hardware will twist it again
-        for index in [1, 0, 2]:
-            color = self.colors[index]
-            if callable(color):
-                brightness, fade_ms = color(self.hardware_fade_ms)  # pylint: disable-msg=not-callable
-                result += hex(int(brightness * 255))[2:].zfill(2)
-                if fade_ms >= self.hardware_fade_ms:
-                    self.dirty = True
-            else:
-                result += "00"
+        return HEX_BYTES[back[offset + 1]] + HEX_BYTES[back[offset]] + HEX_BYTES[back[offset + 2]]
+
+
+class FASTLedEncoder(object):
+
+    """Encode the dirty range of a FAST RGB frame buffer into a RS: command."""
+
+    __slots__ = ["leds"]
+
+    def __init__(self) -> None:
+        """Initialise encoder."""
+        self.leds = []  # type: List[FASTDirectLED]
+
+    def add_led(self, led: FASTDirectLED):
+        """Add a LED. LEDs have to be added in the order of their offset."""
+        self.leds.append(led)
+
+    def __call__(self, frame: LedFrameBuffer, start: int, end: int):
+        """Return RS: command with all LEDs which changed between start and end."""
+        back = frame.back
+        front = frame.front
+        full_refresh = frame.full_refresh
+        leds = []
+        for led in self.leds[start // 3:(end + 2) // 3]:
+            offset = led.offset
+            if full_refresh or back[offset:offset + 3] != front[offset:offset + 3]:
+                leds.append(led.number + led.current_color)
+
+        if not leds:
+            return None
 
-        return result
+        return 'RS:' + ','.join(leds)
 
 
 class FASTDirectLEDChannel(LightPlatformInterface):
@@ -57,8 +83,7 @@ class FASTDirectLEDChannel(LightPlatformInterface):
 
     def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
         """Set brightness via callback."""
-        self.led.dirty = True
-        self.led.colors[self.channel] = color_and_fade_callback
+        self.led.frame.set_fade(self.led.offset + self.channel, color_and_fade_callback)
 
     def get_board_name(self):
         """Return the board of this light."""
@@ -1,5 +1,6 @@
 """Platform interface for smart steppers."""
 import abc
+import asyncio
 
 
 class StepperPlatformInterface(metaclass=abc.ABCMeta):
@@ -45,3 +46,19 @@ class StepperPlatformInterface(metaclass=abc.ABCMeta):
     def stop(self):
         """Stop a motor."""
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def is_move_complete(self) -> bool:
+        """Return true if the last move or homing is complete."""
+        raise NotImplementedError
+
+    @asyncio.coroutine
+    def wait_for_move_completed(self, loop):
+        """Wait until the last move or homing is complete.
+
+        The default implementation polls is_move_complete() every 100ms for
+        controllers which can only be queried. Platforms which get notified by
+        the controller should override this.
+        """
+        while not self.is_move_complete():
+            yield from asyncio.sleep(.1, loop=loop)
@@ -0,0 +1,182 @@
+"""Frame-synchronous, double-buffered output stage for serial LED controllers.
+
+Platforms which send LED data as frames (FAST RGB processor, Open Pixel
+Control, OPP neopixel cards) share the same problems: They have to track
+which LEDs changed, evaluate fade callbacks, serialise the result and pace
+updates to a refresh rate. This module implements those parts once.
+
+Every controller (or channel of a controller) owns a ``LedFrameBuffer``. Lights
+write their fade callbacks or brightness values into the preallocated back
+buffer. Once per frame the ``LedOutputStage`` renders pending callbacks, finds
+the range of bytes which differ from the last frame sent (front buffer) and
+passes that range to a platform specific encoder.
+"""
+from typing import Callable, Tuple, Optional, List, Dict, Any
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.clock import ClockBase, PeriodicTask
+
+
+class LedFrameBuffer(object):
+
+    """Preallocated 8 bit channel buffer for one LED controller.
+
+    ``back`` contains the frame which is currently rendered and ``front`` the
+    frame which has last been sent to the hardware. Changed ranges are found by
+    comparing both buffers as (big) integers which runs in C instead of looping
+    over every channel in Python.
+    """
+
+    __slots__ = ["front", "back", "fade_callbacks", "hardware_fade_ms", "_touched", "full_refresh"]
+
+    def __init__(self, size: int = 0, hardware_fade_ms: int = 0) -> None:
+        """Initialise frame buffer."""
+        self.front = bytearray(size)
+        self.back = bytearray(size)
+        self.fade_callbacks = {}    # type: Dict[int, Callable[[int], Tuple[float, int]]]
+        self.hardware_fade_ms = hardware_fade_ms
+        self._touched = False
+        self.full_refresh = False
+
+    def __len__(self):
+        """Return number of channels in this buffer."""
+        return len(self.back)
+
+    def resize(self, size: int):
+        """Grow buffer to at least size channels.
+
+        This should only be called while configuring lights. The buffer is
+        not reallocated while running.
+        """
+        if size <= len(self.back):
+            return
+        self.front.extend(bytes(size - len(self.front)))
+        self.back.extend(bytes(size - len(self.back)))
+
+    def invalidate(self):
+        """Send the complete buffer with the next frame.
+
+        Encoders should check ``full_refresh`` and also send unchanged channels.
+        """
+        self.full_refresh = True
+
+    def set_fade(self, index: int, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
+        """Set a fade callback for a channel which will be evaluated on the next frame."""
+        self.fade_callbacks[index] = color_and_fade_callback
+        self._touched = True
+
+    def set_value(self, index: int, value: int):
+        """Set a channel to a value (0-255) immediately."""
+        self.back[index] = value
+        self._touched = True
+
+    def render(self):
+        """Evaluate all pending fade callbacks into the back buffer.
+
+        Callbacks stay pending as long as their fade is not finished within
+        ``hardware_fade_ms``.
+        """
+        if not self.fade_callbacks:
+            return
+        back = self.back
+        hardware_fade_ms = self.hardware_fade_ms
+        for index, callback in list(self.fade_callbacks.items()):
+            brightness, fade_ms = callback(hardware_fade_ms)
+            back[index] = min(255, max(0, int(brightness * 255)))
+            if not fade_ms or fade_ms < hardware_fade_ms:
+                # fade is done
+                del self.fade_callbacks[index]
+        self._touched = True
+
+    def get_dirty_range(self) -> Optional[Tuple[int, int]]:
+        """Return (start, end) of the channels which changed since the last commit or None."""
+        if self.full_refresh:
+            return 0, len(self.back)
+        if not self._touched:
+            return None
+
+        diff = int.from_bytes(self.back, 'big') ^ int.from_bytes(self.front, 'big')
+        if not diff:
+            self._touched = False
+            return None
+
+        size = len(self.back)
+        # highest set bit is in the first changed byte. lowest set bit in the last one
+        start = size - 1 - (diff.bit_length() - 1) // 8
+        end = size - ((diff & -diff).bit_length() - 1) // 8
+        return start, end
+
+    def commit(self, start: int, end: int):
+        """Mark channels start to end as sent to the hardware."""
+        self.front[start:end] = self.back[start:end]
+        self.full_refresh = False
+        if not self.fade_callbacks:
+            self._touched = False
+
+    def clear(self):
+        """Set all channels to zero in both buffers."""
+        size = len(self.back)
+        self.back[:] = bytes(size)
+        self.front[:] = bytes(size)
+        self.fade_callbacks = {}
+        self._touched = False
+        self.full_refresh = False
+
+
+class LedOutputStage(object):
+
+    """Renders, encodes and sends LedFrameBuffers at a fixed refresh rate.
+
+    An encoder is called with (frame, start, end) and returns the message to
+    send for the dirty range or None if nothing has to be sent.
+    """
+
+    __slots__ = ["clock", "hz", "frames", "_task"]
+
+    def __init__(self, clock: "ClockBase", hz: float) -> None:
+        """Initialise output stage."""
+        self.clock = clock
+        self.hz = hz
+        self.frames = []    # type: List[Tuple[LedFrameBuffer, Callable, Callable, bool]]
+        self._task = None   # type: PeriodicTask
+
+    def add_frame(self, frame: LedFrameBuffer, encoder: Callable[[LedFrameBuffer, int, int], Any],
+                  sender: Callable[[Any], None], refresh_every_frame=False):
+        """Add a frame buffer to this stage.
+
+        Args:
+            frame: The frame buffer.
+            encoder: Called with the dirty range to build the message.
+            sender: Called with the message to send it to the hardware.
+            refresh_every_frame: Send the frame even when it did not change.
+        """
+        self.frames.append((frame, encoder, sender, refresh_every_frame))
+
+    def start(self):
+        """Start sending frames."""
+        if not self._task:
+            self._task = self.clock.schedule_interval(self.tick, 1 / self.hz)
+
+    def stop(self):
+        """Stop sending frames."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def tick(self):
+        """Render, encode and send all dirty frames."""
+        for frame, encoder, sender, refresh_every_frame in self.frames:
+            frame.render()
+            dirty_range = frame.get_dirty_range()
+            if dirty_range is None:
+                if not refresh_every_frame:
+                    continue
+                start = end = 0
+            else:
+                start, end = dirty_range
+
+            message = encoder(frame, start, end)
+            frame.commit(start, end)
+            if message:
+                sender(message)
@@ -1,22 +1,40 @@
 """MMA8451 accelerometer platform."""
 import asyncio
 import logging
+import struct
 
 from mpf.core.platform import AccelerometerPlatform, I2cPlatform
 
 
+# output data rates in Hz and their DR bits in CTRL_REG1
+DATA_RATES = [(1.56, 7), (6.25, 6), (12.5, 5), (50, 4), (100, 3), (200, 2), (400, 1), (800, 0)]
+
+# 4096 counts per g at 2g resolution
+RANGE_DIVISOR = 4096 / 9.80665
+
+# SMBus block reads are limited to 32 bytes. read at most 5 samples at once
+MAX_SAMPLES_PER_READ = 5
+
+
 class MMA8451Device(object):
 
-    """MMA8451 accelerometer."""
+    """MMA8451 accelerometer.
+
+    Without fifo the device reads one sample every poll_interval. With fifo the
+    sensor buffers up to 32 samples at sample_rate and every poll drains its
+    FIFO with burst block reads and passes all samples to the accelerometer at
+    once.
+    """
 
-    __slots__ = ["i2c_platform", "platform", "callback", "number", "task"]
+    __slots__ = ["i2c_platform", "platform", "callback", "number", "task", "config"]
 
-    def __init__(self, number, callback, i2c_platform, platform):
+    def __init__(self, number, callback, i2c_platform, platform, config=None):
         """Initialise MMA8451 accelerometer."""
         self.i2c_platform = i2c_platform    # type: I2cPlatform
         self.platform = platform            # type: MMA8451Platform
         self.callback = callback
         self.number = number
+        self.config = config if config else {"sample_rate": 12.5, "poll_interval": 100, "fifo": False}
 
         self.task = self.platform.machine.clock.loop.create_task(self._poll())
         self.task.add_done_callback(self._done)
@@ -61,30 +79,58 @@ class MMA8451Device(object):
         # turn on orientation
         device.i2c_write8(0x11, 0x40)
 
-        # low noise mode, 12,5Hz and activate
-        device.i2c_write8(0x2A, 0x2D)
+        if self.config['fifo']:
+            # circular buffer mode. the FIFO can only be configured in standby
+            device.i2c_write8(0x09, 0x40)
+
+        # low noise mode, sample rate and activate
+        device.i2c_write8(0x2A, (self._get_data_rate_bits() << 3) | 0x05)
 
         # wait for activate
         yield from asyncio.sleep(.3, loop=self.platform.machine.clock.loop)
 
         self.platform.log.info("Init done for device at: %s", self.number)
 
+        poll_interval = self.config['poll_interval'] / 1000
         while True:
-            data = yield from device.i2c_read_block(0x01, 6)
-            x = ((data[0] << 8) | data[1]) >> 2
-            y = ((data[2] << 8) | data[3]) >> 2
-            z = ((data[4] << 8) | data[5]) >> 2
-            max_val = 2 ** (14 - 1) - 1
-            signed_max = 2 ** 14
-            x -= signed_max if x > max_val else 0
-            y -= signed_max if y > max_val else 0
-            z -= signed_max if z > max_val else 0
-            range_divisor = 4096 / 9.80665
-            x = round((float(x)) / range_divisor, 3)
-            y = round((float(y)) / range_divisor, 3)
-            z = round((float(z)) / range_divisor, 3)
-            self.callback.update_acceleration(x, y, z)
-            yield from asyncio.sleep(.1, loop=self.platform.machine.clock.loop)
+            if self.config['fifo']:
+                samples = yield from self._read_fifo(device)
+            else:
+                data = yield from device.i2c_read_block(0x01, 6)
+                samples = self._convert_samples(data)
+
+            if samples:
+                self.callback.update_acceleration_batch(samples)
+            yield from asyncio.sleep(poll_interval, loop=self.platform.machine.clock.loop)
+
+    def _get_data_rate_bits(self) -> int:
+        """Return DR bits for the lowest data rate which is at least sample_rate."""
+        for rate, bits in DATA_RATES:
+            if rate >= self.config['sample_rate']:
+                return bits
+        return DATA_RATES[-1][1]
+
+    @asyncio.coroutine
+    def _read_fifo(self, device):
+        """Read all samples in the FIFO of the device."""
+        status = yield from device.i2c_read8(0x00)
+        if status & 0x80:
+            self.platform.log.debug("FIFO of device at %s overflowed. Lost samples.", self.number)
+        count = status & 0x3F
+        samples = []
+        while count > 0:
+            chunk = min(count, MAX_SAMPLES_PER_READ)
+            data = yield from device.i2c_read_block(0x01, chunk * 6)
+            samples.extend(self._convert_samples(data))
+            count -= chunk
+        return samples
+
+    @staticmethod
+    def _convert_samples(data) -> list:
+        """Convert x, y, z registers of one or more samples to acceleration in m/s^2."""
+        # samples are 14 bit left aligned big endian two's complement values
+        values = struct.unpack(">{}h".format(len(data) // 2), bytes(data))
+        return [round((value >> 2) / RANGE_DIVISOR, 3) for value in values]
 
 
 class MMA8451Platform(AccelerometerPlatform):
@@ -116,4 +162,4 @@ class MMA8451Platform(AccelerometerPlatform):
         """Configure MMA8451 accelerometer."""
         config = self.machine.config_validator.validate_config("mma8451_accelerometer", config)
         i2c_platform = self.machine.get_platform_sections("i2c", config['i2c_platform'])
-        return MMA8451Device(number, callback, i2c_platform, self)
+        return MMA8451Device(number, callback, i2c_platform, self, config)
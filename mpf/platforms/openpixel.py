@@ -5,12 +5,14 @@ https://github.com/zestyping/openpixelcontrol/blob/master/python_clients/opc.py
 """
 import asyncio
 import logging
+from functools import partial
 
-from typing import Callable
+from typing import Callable, List
 from typing import Tuple
 
 from mpf.core.platform import LightsPlatform
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformInterface
+from mpf.platforms.led_output_stage import LedFrameBuffer, LedOutputStage
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -54,6 +56,8 @@ class OpenpixelHardwarePlatform(LightsPlatform):
         """Stop platform."""
         # disconnect sender
         if self.opc_client:
+            if self.opc_client.output_stage:
+                self.opc_client.output_stage.stop()
             self.opc_client.blank_all()
             if self.opc_client.socket_sender:
                 self.opc_client.socket_sender.close()
@@ -128,8 +132,8 @@ class OpenPixelClient(object):
         config: Config to use
     """
 
-    __slots__ = ["machine", "log", "update_every_tick", "socket_sender", "max_fade_ms", "channels", "dirty_leds",
-                 "msg", "openpixel_config"]
+    __slots__ = ["machine", "log", "update_every_tick", "socket_sender", "max_fade_ms", "frames", "msg",
+                 "openpixel_config", "output_stage"]
 
     def __init__(self, machine, config):
         """Initialise openpixel client."""
@@ -139,10 +143,10 @@ class OpenPixelClient(object):
         self.update_every_tick = False
         self.socket_sender = None
         self.max_fade_ms = None
-        self.channels = []
-        self.dirty_leds = []
-        self.msg = []
+        self.frames = []        # type: List[LedFrameBuffer]
+        self.msg = []           # type: List[bytearray]
         self.openpixel_config = config
+        self.output_stage = None    # type: LedOutputStage
 
     @asyncio.coroutine
     def connect(self):
@@ -151,6 +155,8 @@ class OpenPixelClient(object):
         _, self.socket_sender = yield from connector
 
         self.max_fade_ms = int(1 / self.machine.config['mpf']['default_light_hw_update_hz'] * 1000)
+        for frame in self.frames:
+            frame.hardware_fade_ms = self.max_fade_ms
 
         self.machine.events.add_handler("init_phase_3", self._start_loop)
 
@@ -160,7 +166,11 @@ class OpenPixelClient(object):
         self.blank_all()
 
         # Update at a regular interval
-        self.machine.clock.schedule_interval(self.tick, 1 / self.machine.config['mpf']['default_light_hw_update_hz'])
+        self.output_stage = LedOutputStage(self.machine.clock,
+                                           self.machine.config['mpf']['default_light_hw_update_hz'])
+        for channel, frame in enumerate(self.frames):
+            self.output_stage.add_frame(frame, partial(self._encode, channel), self.send, self.update_every_tick)
+        self.output_stage.start()
 
     def add_pixel(self, channel, led):
         """Add a pixel to the list that will be sent to the OPC server.
@@ -175,18 +185,13 @@ class OpenPixelClient(object):
         we make sure we have 19 items on the list before it.
 
         """
-        if len(self.channels) < channel + 1:
+        while len(self.frames) < channel + 1:
+            self.frames.append(LedFrameBuffer(hardware_fade_ms=self.max_fade_ms or 0))
+            self.msg.append(None)
 
-            channels_to_add = channel + 1 - len(self.channels)
-
-            self.channels += [list() for _ in range(channels_to_add)]
-            self.dirty_leds += [dict() for _ in range(channels_to_add)]
-            self.msg += [None for _ in range(channels_to_add)]
-
-        if len(self.channels[channel]) < led + 1:
-
-            leds_to_add = led + 1 - len(self.channels[channel])
-            self.channels[channel] += [0 for _ in range(leds_to_add)]
+        if len(self.frames[channel]) < led + 1:
+            self.frames[channel].resize(led + 1)
+            self.msg[channel] = self._build_message(channel)
 
     def set_pixel_color(self, channel, pixel, callback: Callable[[int], Tuple[float, int]]):
         """Set an individual pixel color.
@@ -196,80 +201,50 @@ class OpenPixelClient(object):
             pixel: Int of the number for this pixel on that channel.
             callback: callback to get brightness
         """
-        self.dirty_leds[channel][pixel] = callback
+        self.frames[channel].set_fade(pixel, callback)
 
     def tick(self):
         """Update pixels.
 
         Called periodically.
         """
-        for channel_index in range(len(self.channels)):
-            if not self.update_every_tick and not self.dirty_leds[channel_index]:
-                continue
-            self._handle_dirty_leds(channel_index)
-            self._update_pixels(channel_index)
-
-    def _handle_dirty_leds(self, channel):
-        if not self.dirty_leds[channel]:
-            return
-
-        # invalidate cached message
-        self.msg[channel] = None
+        if self.output_stage:
+            self.output_stage.tick()
 
-        for pixel, callback in dict(self.dirty_leds[channel]).items():
-            brightness, remaining_fade = callback(self.max_fade_ms)
-            value = min(255, max(0, int(brightness * 255)))
-            self.channels[channel][pixel] = value
-            # fade is done
-            if remaining_fade < self.max_fade_ms:
-                del self.dirty_leds[channel][pixel]
-
-    def _update_pixels(self, channel):
-        """Send the list of pixel colors to the OPC server.
-
-        Args:
-            pixels: A list of 3-item iterables (tuples or lists). Each item is
-                a 0-255 value of the intensity of the red, green, and blue
-                values for the pixel. The first item in the list is the first
-                pixel on the channel, the second item is the second one, etc.
-            channel: Which OPC channel the pixel data will be written to.
-
-        Returns:
-            True on success. False if it was unable to connect to the OPC
-            server.
+    def _encode(self, channel, frame: LedFrameBuffer, start: int, end: int):
+        """Write dirty pixels into the preallocated OPC message of a channel and return it.
 
         Note that you must send color data for all the pixels in a channel (or
         all the pixels up until the point you want. e.g. if you have 30 LEDs on
         the channel and you just want to update LED #10, then you need to send
-        pixel data for the first 10 pixels.)
+        pixel data for the first 10 pixels.) Therefore, the whole message is
+        sent but only the changed pixels are encoded.
         """
-        # if we got a cached message just send it
-        if not self.msg[channel]:
-            self.msg[channel] = bytes(self._build_message(channel))
-
-        self.send(self.msg[channel])
+        msg = self.msg[channel]
+        pixels = frame.back
+        first = start // 3
+        last = min((end + 2) // 3, len(pixels) // 3)
+        # send GRB because that is the default color order for WS2812
+        msg[4 + first * 3:4 + last * 3:3] = pixels[first * 3 + 1:last * 3:3]
+        msg[5 + first * 3:5 + last * 3:3] = pixels[first * 3:last * 3:3]
+        msg[6 + first * 3:6 + last * 3:3] = pixels[first * 3 + 2:last * 3 + 2:3]
+        return bytes(msg)
 
     def _build_message(self, channel):
-        """Build the OPC message."""
-        msg = bytearray()
-        pixels = self.channels[channel]
+        """Build the (empty) OPC message."""
+        pixels = self.frames[channel]
         len_hi_byte = int(len(pixels) / 256)
         len_lo_byte = (len(pixels)) % 256
-        header = bytes([channel, 0, len_hi_byte, len_lo_byte])
-        msg.extend(header)
-        for i in range(int(len(pixels) / 3)):
-            # send GRB because that is the default color order for WS2812
-
-            msg.append(pixels[i * 3 + 1])
-            msg.append(pixels[i * 3])
-            msg.append(pixels[i * 3 + 2])
+        msg = bytearray([channel, 0, len_hi_byte, len_lo_byte])
+        msg.extend(bytes(int(len(pixels) / 3) * 3))
         return msg
 
     def blank_all(self):
         """Blank all channels."""
-        for channel_index in range(len(self.channels)):
-            self.channels[channel_index] = [0] * len(self.channels[channel_index])
-            self.send(bytes(self._build_message(channel_index)))
+        for channel_index, frame in enumerate(self.frames):
+            frame.clear()
+            self.msg[channel_index] = self._build_message(channel_index)
+            self.send(bytes(self.msg[channel_index]))
 
     def send(self, message):
         """Send a message to the socket.
@@ -782,9 +782,8 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
     def light_sync(self):
         """Update lights."""
         # first neo pixels
-        for light in self.neoDict.values():
-            if light.dirty:
-                light.update_color()
+        for neo_card in self.opp_neopixels:
+            neo_card.update_pixels()
 
         # then incandescents
         self.update_incand()
@@ -2,6 +2,7 @@
 import logging
 
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade
+from mpf.platforms.led_output_stage import LedFrameBuffer
 
 from mpf.platforms.opp.opp_rs232_intf import OppRs232Intf
 
@@ -11,7 +12,7 @@ class OPPNeopixelCard(object):
     """OPP Neopixel/WS2812 card."""
 
     __slots__ = ["log", "chain_serial", "platform", "addr", "cardNum", "numPixels", "numColorEntries",
-                 "colorTableDict"]
+                 "colorTableDict", "frame", "pixels"]
 
     def __init__(self, chain_serial, addr, neo_card_dict, platform):
         """Initialise OPP Neopixel/WS2812 card."""
@@ -23,6 +24,8 @@ class OPPNeopixelCard(object):
         self.numPixels = 0
         self.numColorEntries = 0
         self.colorTableDict = dict()
+        self.frame = LedFrameBuffer()
+        self.pixels = dict()
         neo_card_dict[chain_serial + '-' + self.cardNum] = self
 
         self.log.debug("Creating OPP Neopixel card at hardware address: 0x%02x", addr)
@@ -41,10 +44,26 @@ class OPPNeopixelCard(object):
         if number > self.numPixels:
             self.numPixels = number + 1
         pixel_number = self.cardNum + '-' + str(number)
+        self.frame.resize((number + 1) * 3)
         pixel = OPPNeopixel(pixel_number, self)
         neo_dict[pixel_number] = pixel
+        self.pixels[number] = pixel
         return pixel
 
+    def update_pixels(self):
+        """Send all pixels which changed since the last update."""
+        dirty_range = self.frame.get_dirty_range()
+        if dirty_range is None:
+            return
+        start, end = dirty_range
+        back = self.frame.back
+        front = self.frame.front
+        for number in range(start // 3, (end + 2) // 3):
+            offset = number * 3
+            if number in self.pixels and back[offset:offset + 3] != front[offset:offset + 3]:
+                self.pixels[number].color(back[offset:offset + 3])
+        self.frame.commit(start, end)
+
 
 class OPPLightChannel(LightPlatformSoftwareFade):
 
@@ -72,7 +91,7 @@ class OPPNeopixel:
 
     """One WS2812 LED."""
 
-    __slots__ = ["log", "number", "current_color", "neoCard", "index_char", "_color", "dirty"]
+    __slots__ = ["log", "number", "current_color", "neoCard", "index_char", "offset"]
 
     def __init__(self, number, neo_card):
         """Initialise LED."""
@@ -82,20 +101,13 @@ class OPPNeopixel:
         self.neoCard = neo_card
         _, index = number.split('-')
         self.index_char = chr(int(index))
-        self._color = [0, 0, 0]
-        self.dirty = False
+        self.offset = int(index) * 3
 
         self.log.debug("Creating OPP Neopixel: %s", number)
 
     def set_channel(self, index, brightness):
         """Set one channel."""
-        self._color[index] = brightness
-        self.dirty = True
-
-    def update_color(self):
-        """Update neopixel."""
-        self.color(self._color)
-        self.dirty = False
+        self.neoCard.frame.set_value(self.offset + index, brightness)
 
     def color(self, color):
         """Instantly set this LED to the color passed.
@@ -4,7 +4,10 @@ import asyncio
 import logging
 import platform
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from typing import Any, List, Union, Callable, Tuple
 
 from mpf.platforms.p_roc_devices import PROCSwitch, PROCMatrixLight
@@ -51,6 +54,162 @@ except ImportError:     # pragma: no cover
         pinproc = None
 
 
+class PROCCommandQueue(object):
+
+    """Proxy for the pinproc handle which is owned by a PROCEventPump thread.
+
+    Commands which do not return a result are queued and sent in one batch
+    by the pump thread. All other calls block until the pump thread executed
+    them. Before the thread is started all calls go directly to the handle.
+    """
+
+    __slots__ = ["proc", "pump"]
+
+    QUEUED_COMMANDS = frozenset(["driver_disable", "driver_patter", "driver_pulse", "driver_pulsed_patter",
+                                 "driver_schedule", "driver_update_state", "driver_update_group_config",
+                                 "driver_update_global_config", "switch_update_rule", "led_color", "led_fade",
+                                 "write_data", "aux_send_commands", "dmd_draw", "dmd_update_config",
+                                 "watchdog_tickle", "flush"])
+
+    def __init__(self, proc, pump: "PROCEventPump") -> None:
+        """Initialise proxy."""
+        self.proc = proc
+        self.pump = pump
+
+    def __getattr__(self, item):
+        """Return a callable which sends the command through the pump."""
+        if not self.pump.running:
+            return getattr(self.proc, item)
+        if item in self.QUEUED_COMMANDS:
+            return lambda *args, **kwargs: self.pump.commands.append((item, args, kwargs, None))
+        return lambda *args, **kwargs: self.pump.call(item, args, kwargs)
+
+
+class PROCEventPump(object):
+
+    """Poll the P-ROC/P3-ROC in a separate thread.
+
+    The thread owns the libpinproc handle. It polls for events at a high rate
+    and hands them to the asyncio loop through a deque. Outgoing commands are
+    queued by ``PROCCommandQueue`` and flushed in one batch per poll.
+    Appending to and popping from a deque is atomic in CPython so no locks are
+    needed.
+
+    The thread does not tickle the watchdog on its own. Tickles are queued by
+    the loop so the hardware disables all drivers when the loop hangs. If the
+    thread crashes, pending calls fail and the error is raised in the loop.
+    """
+
+    __slots__ = ["proc", "loop", "callback", "poll_interval", "commands", "events", "running", "_thread",
+                 "_stop", "_drain_scheduled", "log", "call_timeout"]
+
+    def __init__(self, proc, loop, callback, poll_interval: float) -> None:
+        """Initialise event pump.
+
+        Args:
+            proc: The pinproc.PinPROC handle.
+            loop: asyncio loop which processes events.
+            callback: Called in the loop with a list of events.
+            poll_interval: Seconds to wait between two polls.
+        """
+        self.proc = proc
+        self.loop = loop
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.commands = deque()
+        self.events = deque()
+        self.running = False
+        self._thread = None     # type: threading.Thread
+        self._stop = threading.Event()
+        self._drain_scheduled = False
+        self.log = logging.getLogger('PROCEventPump')
+        # seconds to wait for the result of a command before giving up
+        self.call_timeout = 1.0
+
+    def start(self):
+        """Start the pump thread."""
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="PROCEventPump")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the pump thread and send all remaining commands."""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self.running = False
+
+    def call(self, name, args, kwargs):
+        """Execute a command in the pump thread and wait for the result.
+
+        Raises concurrent.futures.TimeoutError if the thread does not answer within call_timeout.
+        """
+        future = Future()
+        self.commands.append((name, args, kwargs, future))
+        return future.result(self.call_timeout)
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                self.run_once()
+                time.sleep(self.poll_interval)
+            self._send_commands()
+            self.proc.flush()
+        except Exception as e:  # pylint: disable-msg=broad-except
+            self._crashed(e)
+
+    def _crashed(self, exception):
+        """Fail all pending commands and raise exception in the loop."""
+        self.running = False
+        self.log.exception("P-ROC event pump crashed")
+        while self.commands:
+            future = self.commands.popleft()[3]
+            if future:
+                future.set_exception(exception)
+        self.loop.call_soon_threadsafe(self._raise, exception)
+
+    @staticmethod
+    def _raise(exception):
+        raise exception
+
+    def _send_commands(self):
+        while self.commands:
+            name, args, kwargs, future = self.commands.popleft()
+            try:
+                result = getattr(self.proc, name)(*args, **kwargs)
+            except Exception as e:  # pylint: disable-msg=broad-except
+                if future:
+                    future.set_exception(e)
+                else:
+                    self.log.exception("Failed to send command %s to P-ROC", name)
+            else:
+                if future:
+                    future.set_result(result)
+
+    def run_once(self):
+        """Send queued commands (including watchdog tickles from the loop) and read events."""
+        self._send_commands()
+
+        events = self.proc.get_events()
+        if events:
+            self.events.extend(events)
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.loop.call_soon_threadsafe(self._drain)
+
+        self.proc.flush()
+
+    def _drain(self):
+        """Process all received events in the loop."""
+        self._drain_scheduled = False
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        self.callback(events)
+
+
 # pylint does not understand that this class is abstract
 # pylint: disable-msg=abstract-method
 class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass=abc.ABCMeta):
@@ -66,7 +225,7 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
     """
 
     __slots__ = ["pdbconfig", "pinproc", "proc", "log", "hw_switch_rules", "version", "revision", "hardware_version",
-                 "dipswitches", "machine_type"]
+                 "dipswitches", "machine_type", "event_pump", "_watchdog_task"]
 
     def __init__(self, machine):
         """Make sure pinproc was loaded."""
@@ -87,6 +246,8 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
         self.revision = None
         self.hardware_version = None
         self.dipswitches = None
+        self.event_pump = None  # type: PROCEventPump
+        self._watchdog_task = None
 
         self.machine_type = pinproc.normalize_machine_type(
             self.machine.config['hardware']['driverboards'])
@@ -108,10 +269,43 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
         that's attached to MPF.
         '''
 
+    @asyncio.coroutine
+    def start(self):
+        """Start the event pump thread if enabled."""
+        if self.event_pump:
+            self.event_pump.start()
+            # tickle the watchdog from the loop. it expires when the loop hangs
+            self._watchdog_task = self.machine.clock.schedule_interval(
+                self._tickle_watchdog, 1 / self.machine.config['mpf']['default_platform_hz'])
+
+    def _tickle_watchdog(self):
+        """Queue a watchdog tickle which is sent by the pump thread."""
+        self.proc.watchdog_tickle()
+
     def stop(self):
         """Stop proc."""
+        if self._watchdog_task:
+            self.machine.clock.unschedule(self._watchdog_task)
+            self._watchdog_task = None
+        if self.event_pump:
+            self.event_pump.stop()
         self.proc.reset(1)
 
+    def tick(self):
+        """Check the P-ROC for any events (switch state changes or notification that a DMD frame was updated).
+
+        Also tickles the watchdog and flushes any queued commands to the P-ROC.
+        """
+        self.process_events(self.proc.get_events())
+
+        self.proc.watchdog_tickle()
+        self.proc.flush()
+
+    @abc.abstractmethod
+    def process_events(self, events):
+        """Process events from the P-Roc."""
+        raise NotImplementedError()
+
     def connect(self):
         """Connect to the P-ROC.
 
@@ -139,6 +333,13 @@ class PROCBasePlatform(LightsPlatform, SwitchPlatform, DriverPlatform, metaclass
                       "Hardware Board ID: %s",
                       self.version, self.revision, self.hardware_version)
 
+        if self.config['use_separate_thread']:
+            # the pump thread polls the hardware. no need to tick in the loop
+            self.features['tickless'] = True
+            self.event_pump = PROCEventPump(self.proc, self.machine.clock.loop, self.process_events,
+                                            self.config['thread_poll_interval'] / 1000)
+            self.proc = PROCCommandQueue(self.proc, self.event_pump)
+
     @classmethod
     def _get_event_type(cls, sw_activity, debounced):
         if sw_activity == 0 and debounced:
@@ -14,6 +14,7 @@ from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInt
 
 from mpf.core.platform import SwitchPlatform, DriverPlatform, ServoPlatform, SwitchSettings, \
     DriverSettings, DriverConfig, SwitchConfig, I2cPlatform
+from mpf.platforms.software_rules import SoftwareRuleEngine
 
 # apiogpio is not a requirement for MPF so we fail with a nice error when loading
 try:
@@ -174,6 +175,9 @@ class RaspberryPiHardwarePlatform(SwitchPlatform, DriverPlatform, ServoPlatform,
         self._cmd_queue = None  # type: asyncio.Queue
         self._cmd_task = None   # type: asyncio.Task
 
+        # the Pi has no hardware rules. run them in software
+        self.software_rules = SoftwareRuleEngine(self.machine.clock)
+
     @asyncio.coroutine
     def initialize(self):
         """Initialise platform."""
@@ -260,28 +264,32 @@ class RaspberryPiHardwarePlatform(SwitchPlatform, DriverPlatform, ServoPlatform,
     def _switch_changed(self, gpio, level, tick):
         """Process switch change."""
         del tick
-        self.machine.switch_controller.process_switch_by_num(str(gpio), level, self)
+        number = str(gpio)
+        # run rules before anything else to keep latency low
+        self.software_rules.switch_changed(number, level)
+        self.machine.switch_controller.process_switch_by_num(number, level, self)
 
     def set_pulse_on_hit_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        """Set pulse on hit and release rule in software."""
+        self.software_rules.set_pulse_on_hit_and_release_rule(enable_switch, coil)
 
     def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        """Set pulse on hit and enable and release rule in software."""
+        self.software_rules.set_pulse_on_hit_and_enable_and_release_rule(enable_switch, coil)
 
     def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch: SwitchSettings,
                                                                  disable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        """Set pulse on hit and enable and release and disable rule in software."""
+        self.software_rules.set_pulse_on_hit_and_enable_and_release_and_disable_rule(enable_switch, disable_switch,
+                                                                                     coil)
 
     def set_pulse_on_hit_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        """Set pulse on hit rule in software."""
+        self.software_rules.set_pulse_on_hit_rule(enable_switch, coil)
 
     def clear_hw_rule(self, switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        """Clear software rule."""
+        self.software_rules.clear_hw_rule(switch, coil)
 
     def configure_driver(self, config: DriverConfig, number: str, platform_settings: dict) -> "DriverPlatformInterface":
         """Configure an output on the Raspberry Pi."""
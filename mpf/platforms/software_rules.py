@@ -0,0 +1,143 @@
+"""Software implementation of hardware rules for platforms without native rules.
+
+Platforms which cannot run rules on their hardware (e.g. the Raspberry Pi)
+pass every switch edge to a ``SoftwareRuleEngine`` before they hand it to the
+``SwitchController``. The engine triggers the driver in the same call so the
+latency is only the time until the platform sees the edge plus one call into
+the driver. It does not wait for any events or the switch controller.
+"""
+import time
+from typing import Dict, List, Any
+
+from mpf.core.platform import SwitchSettings, DriverSettings
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.clock import ClockBase
+
+
+class SoftwareRule(object):
+
+    """A rule between one or two switches and a driver."""
+
+    __slots__ = ["enable_switch", "disable_switch", "coil", "hold", "release", "next_pulse_time"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, enable_switch: SwitchSettings, disable_switch: SwitchSettings, coil: DriverSettings,
+                 hold: bool, release: bool) -> None:
+        """Initialise rule."""
+        self.enable_switch = enable_switch
+        self.disable_switch = disable_switch
+        self.coil = coil
+        self.hold = hold
+        self.release = release
+        self.next_pulse_time = 0
+
+    def __repr__(self):
+        """Return string representation."""
+        return "<SoftwareRule {}->{} hold={} release={}>".format(
+            self.enable_switch.hw_switch.number, self.coil.hw_driver.number, self.hold, self.release)
+
+
+class SoftwareRuleEngine(object):
+
+    """Run hardware rules in software.
+
+    Platforms call ``switch_changed`` with the physical state of a switch for
+    every edge they see. Drivers with recycle enabled cannot be triggered again
+    within twice their pulse time (same as the default on FAST).
+    """
+
+    __slots__ = ["clock", "_rules", "activations", "latency_total", "latency_max"]
+
+    def __init__(self, clock: "ClockBase") -> None:
+        """Initialise rule engine."""
+        self.clock = clock
+        self._rules = {}            # type: Dict[Any, List[SoftwareRule]]
+        self.activations = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def _add_rule(self, rule: SoftwareRule):
+        """Add a rule for its switches."""
+        self._rules.setdefault(rule.enable_switch.hw_switch.number, []).append(rule)
+        if rule.disable_switch:
+            self._rules.setdefault(rule.disable_switch.hw_switch.number, []).append(rule)
+
+    def set_pulse_on_hit_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse coil when the switch becomes active."""
+        self._add_rule(SoftwareRule(enable_switch, None, coil, False, False))
+
+    def set_pulse_on_hit_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse coil when the switch becomes active and disable it when it is released."""
+        self._add_rule(SoftwareRule(enable_switch, None, coil, False, True))
+
+    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse and hold coil when the switch becomes active and disable it when it is released."""
+        self._add_rule(SoftwareRule(enable_switch, None, coil, True, True))
+
+    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch: SwitchSettings,
+                                                                 disable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse and hold coil on enable_switch. Disable it on release or when disable_switch becomes active."""
+        self._add_rule(SoftwareRule(enable_switch, disable_switch, coil, True, True))
+
+    def clear_hw_rule(self, switch: SwitchSettings, coil: DriverSettings):
+        """Remove all rules between switch and coil."""
+        number = switch.hw_switch.number
+        for rule in list(self._rules.get(number, [])):
+            if rule.coil.hw_driver != coil.hw_driver:
+                continue
+            for rule_switch in (rule.enable_switch, rule.disable_switch):
+                if not rule_switch:
+                    continue
+                rules = self._rules[rule_switch.hw_switch.number]
+                rules.remove(rule)
+                if not rules:
+                    del self._rules[rule_switch.hw_switch.number]
+
+    def has_rules(self, number) -> bool:
+        """Return true if there are rules for this switch number."""
+        return number in self._rules
+
+    def switch_changed(self, number, state: int):
+        """Run all rules for a physical switch edge."""
+        rules = self._rules.get(number)
+        if not rules:
+            return
+
+        start_time = time.perf_counter()
+        for rule in rules:
+            if rule.enable_switch.hw_switch.number == number:
+                if bool(state) != rule.enable_switch.invert:
+                    self._trigger(rule)
+                elif rule.release:
+                    rule.coil.hw_driver.disable()
+            elif bool(state) != rule.disable_switch.invert:
+                rule.coil.hw_driver.disable()
+
+        latency = time.perf_counter() - start_time
+        self.activations += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def _trigger(self, rule: SoftwareRule):
+        """Pulse or enable the driver of a rule."""
+        coil = rule.coil
+        if coil.recycle:
+            now = self.clock.get_time()
+            if now < rule.next_pulse_time:
+                return
+            rule.next_pulse_time = now + coil.pulse_settings.duration * 2 / 1000.0
+
+        if rule.hold:
+            coil.hw_driver.enable(coil.pulse_settings, coil.hold_settings)
+        else:
+            coil.hw_driver.pulse(coil.pulse_settings)
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Return number of processed edges with rules and their average/max latency in ms."""
+        return {
+            "activations": self.activations,
+            "latency_avg_ms": self.latency_total * 1000 / self.activations if self.activations else 0.0,
+            "latency_max_ms": self.latency_max * 1000,
+        }
@@ -19,6 +19,7 @@ from mpf.core.platform import ServoPlatform, SwitchPlatform, DriverPlatform, Acc
     HardwareSoundPlatform
 from mpf.core.utility_functions import Util
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface, PulseSettings, HoldSettings
+from mpf.platforms.software_rules import SoftwareRuleEngine
 
 
 class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform, LightsPlatform, SwitchPlatform,
@@ -27,7 +28,8 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
 
     """Base class for the virtual hardware platform."""
 
-    __slots__ = ["hw_switches", "initial_states_sent", "_next_driver", "_next_switch", "_next_light", "__dict__"]
+    __slots__ = ["hw_switches", "initial_states_sent", "_next_driver", "_next_switch", "_next_light", "software_rules",
+                 "__dict__"]
 
     def __init__(self, machine) -> None:
         """Initialise virtual platform."""
@@ -45,6 +47,11 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
         self._next_switch = 1000
         self._next_light = 1000
 
+        # rules are ignored unless virtual_platform_software_rules is set
+        self.software_rules = None      # type: SoftwareRuleEngine
+        if self.machine.config.get('virtual_platform_software_rules', False):
+            self.software_rules = SoftwareRuleEngine(self.machine.clock)
+
     def __repr__(self):
         """Return string representation."""
         return '<Platform.Virtual>'
@@ -56,7 +63,9 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
     @asyncio.coroutine
     def initialize(self) -> None:
         """Initialise platform."""
-        pass
+        if self.software_rules:
+            # switch changes on this platform only pass the switch controller
+            self.machine.switch_controller.add_platform_edge_handler(self, self.software_rules.switch_changed)
 
     def stop(self):
         """Stop platform."""
@@ -181,25 +190,39 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
         else:
             raise AssertionError("Unknown subtype {}".format(subtype))
 
+    def process_switch_change(self, number, state):
+        """Process a physical switch edge the same way a hardware platform would.
+
+        Software rules (if enabled) run in the switch controller before any
+        switch handlers.
+        """
+        self.machine.switch_controller.process_switch_by_num(number, state, self)
+
     def clear_hw_rule(self, switch, coil):
         """Clear hw rule."""
-        pass
+        if self.software_rules:
+            self.software_rules.clear_hw_rule(switch, coil)
 
     def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch, coil):
         """Set rule."""
-        pass
+        if self.software_rules:
+            self.software_rules.set_pulse_on_hit_and_enable_and_release_rule(enable_switch, coil)
 
     def set_pulse_on_hit_and_release_rule(self, enable_switch, coil):
         """Set rule."""
-        pass
+        if self.software_rules:
+            self.software_rules.set_pulse_on_hit_and_release_rule(enable_switch, coil)
 
     def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch, disable_switch, coil):
         """Set rule."""
-        pass
+        if self.software_rules:
+            self.software_rules.set_pulse_on_hit_and_enable_and_release_and_disable_rule(enable_switch,
+                                                                                         disable_switch, coil)
 
     def set_pulse_on_hit_rule(self, enable_switch, coil):
         """Set rule."""
-        pass
+        if self.software_rules:
+            self.software_rules.set_pulse_on_hit_rule(enable_switch, coil)
 
     def configure_dmd(self):
         """Configure DMD."""
@@ -448,6 +471,16 @@ class VirtualStepper(StepperPlatformInterface):
         """Stop motor."""
         self.velocity = 0
 
+    def is_move_complete(self) -> bool:
+        """Return true because virtual moves complete instantly."""
+        return True
+
+    @asyncio.coroutine
+    def wait_for_move_completed(self, loop):
+        """Return immediately because virtual moves complete instantly."""
+        del loop
+        return
+
 
 class VirtualDriver(DriverPlatformInterface):
 
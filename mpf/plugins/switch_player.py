@@ -1,7 +1,28 @@
-"""MPF plugin which automatically plays back switch events from the config file."""
-
+"""MPF plugin which automatically plays back switch events from the config file.
+
+Besides the hand written ``steps`` the switch player can be used as load
+generator to stress test a machine config on the virtual or smart_virtual
+platform:
+
+* ``replay_file`` replays a recorded switch stream. Streams are written by
+  ``record_file`` and contain one ``<secs> <switch> <state>`` line per switch
+  change.
+* ``random_switches`` toggles randomly picked switches at ``rate`` edges per
+  second for ``duration``.
+
+Edges are played in batches every ``tick_interval`` so thousands of edges per
+second do not need one timer each. When the run is done, loop lag, event queue
+depth, time spent per switch edge and the slowest event handlers are logged
+and stored in ``report``.
+"""
 import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
 from mpf.core.delays import DelayManager
+from mpf.core.switch_controller import MonitoredSwitchChange
 from mpf.core.utility_functions import Util
 
 
@@ -23,13 +44,26 @@ class SwitchPlayer(object):
         self.delay = DelayManager(self.machine.delayRegistry)
         self.current_step = 0
 
-        self.config = self.machine.config['switch_player']
-        self.machine.config_validator.validate_config("switch_player", self.config)
+        self.config = self.machine.config_validator.validate_config("switch_player",
+                                                                    self.machine.config['switch_player'])
 
         self.machine.events.add_handler(self.config['start_event'],
                                         self._start_event_callback)
 
-        self.step_list = self.config['steps']
+        self.step_list = self.config.get('steps', [])
+        self.report = None              # type: Dict[str, Any]
+
+        self._edges = []                # type: List[Tuple[float, str, int]]
+        self._edge_index = 0
+        self._random = None             # type: random.Random
+        self._start_time = None
+        self._next_tick = None
+        self._stats = {}                # type: Dict[str, Any]
+        self._recording = []            # type: List[Tuple[float, str, int]]
+
+        if self.config['record_file']:
+            self.machine.switch_controller.add_monitor(self._record_switch)
+            self.machine.events.add_handler("shutdown", self._write_recording)
 
     def __repr__(self):
         """Return string representation."""
@@ -37,9 +71,16 @@ class SwitchPlayer(object):
 
     def _start_event_callback(self, **kwargs):
         del kwargs
-        self.delay.add(name='switch_player_next_step',
-                       ms=Util.string_to_ms(self.step_list[self.current_step]['time']),
-                       callback=self._do_step)
+        if self.config['replay_file']:
+            self._edges = self._load_recording(self._get_path(self.config['replay_file']))
+            self._start_load()
+        elif self.config['random_switches']:
+            self._random = random.Random(self.config['random_seed'])
+            self._start_load()
+        else:
+            self.delay.add(name='switch_player_next_step',
+                           ms=Util.string_to_ms(self.step_list[self.current_step]['time']),
+                           callback=self._do_step)
 
     def _do_step(self):
 
@@ -81,5 +122,133 @@ class SwitchPlayer(object):
             state=0,
             logical=True)
 
+    def _get_path(self, filename):
+        return os.path.join(self.machine.machine_path, filename)
+
+    @staticmethod
+    def _load_recording(filename) -> List[Tuple[float, str, int]]:
+        """Return (secs, switch, state) for every line in a recorded switch stream."""
+        edges = []
+        with open(filename) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                secs, switch, state = line.split()
+                edges.append((float(secs), switch, int(state)))
+
+        return edges
+
+    def _record_switch(self, change: MonitoredSwitchChange):
+        self._recording.append((self.machine.clock.get_time(), change.name, change.state))
+
+    def _write_recording(self, **kwargs):
+        del kwargs
+        if not self._recording:
+            return
+        start = self._recording[0][0]
+        with open(self._get_path(self.config['record_file']), "w") as f:
+            for timestamp, switch, state in self._recording:
+                f.write("{:.4f} {} {}\n".format(timestamp - start, switch, state))
+
+    def _start_load(self):
+        """Start to play edges in batches."""
+        self.log.info("Starting load test")
+        self._edge_index = 0
+        self._stats = {
+            "edges": 0,
+            "edge_time": 0.0,
+            "ticks": 0,
+            "lag_total": 0.0,
+            "lag_max": 0.0,
+            "queue_max": 0,
+            "started": time.perf_counter(),
+        }
+        self.machine.events.handler_timings = {}
+        self._start_time = self.machine.clock.get_time()
+        self._next_tick = self._start_time
+        self._tick()
+
+    def _tick(self):
+        current_time = self.machine.clock.get_time()
+        lag = max(0.0, current_time - self._next_tick)
+        self._stats["ticks"] += 1
+        self._stats["lag_total"] += lag
+        self._stats["lag_max"] = max(self._stats["lag_max"], lag)
+
+        elapsed = current_time - self._start_time
+        if self._random:
+            done = self._play_random(elapsed)
+        else:
+            done = self._play_recorded(elapsed)
+
+        # events posted by this batch are processed after this callback
+        self._stats["queue_max"] = max(self._stats["queue_max"], len(self.machine.events.event_queue))
+
+        if done:
+            # wait for the events of the last batch
+            self.machine.clock.loop.call_soon(self._finish_load)
+            return
+
+        self._next_tick += self.config['tick_interval'] / 1000.0
+        self.machine.clock.schedule_at(self._tick, self._next_tick)
+
+    def _process_edge(self, switch: str, state: int):
+        start = time.perf_counter()
+        self.machine.switch_controller.process_switch(switch, state=state, logical=True)
+        self._stats["edge_time"] += time.perf_counter() - start
+        self._stats["edges"] += 1
+
+    def _play_recorded(self, elapsed) -> bool:
+        speed = self.config['replay_speed']
+        while self._edge_index < len(self._edges) and self._edges[self._edge_index][0] <= elapsed * speed:
+            _, switch, state = self._edges[self._edge_index]
+            self._edge_index += 1
+            self._process_edge(switch, state)
+
+        return self._edge_index >= len(self._edges)
+
+    def _play_random(self, elapsed) -> bool:
+        duration = self.config['duration'] / 1000.0
+        total = int(min(elapsed, duration) * self.config['rate'])
+        switches = self.config['random_switches']
+        while self._stats["edges"] < total:
+            switch = self._random.choice(switches)
+            self._process_edge(switch.name, 0 if switch.state else 1)
+
+        return elapsed >= duration
+
+    def _finish_load(self):
+        timings = self.machine.events.handler_timings
+        self.machine.events.handler_timings = None
+        stats = self._stats
+        duration = self.machine.clock.get_time() - self._start_time
+        self.report = {
+            "edges": stats["edges"],
+            "duration": duration,
+            "edges_per_second": stats["edges"] / duration if duration else 0.0,
+            "wall_time": time.perf_counter() - stats["started"],
+            "edge_time_avg": stats["edge_time"] / stats["edges"] if stats["edges"] else 0.0,
+            "loop_lag_avg": stats["lag_total"] / stats["ticks"],
+            "loop_lag_max": stats["lag_max"],
+            "event_queue_max": stats["queue_max"],
+            "handler_timings": timings,
+        }
+
+        self.log.info("Load test done. Played %s switch edges in %.2fs (%.0f/s) taking %.1fs wall time. "
+                      "%.1fus per edge. Loop lag avg %.2fms max %.2fms. Max event queue depth: %s",
+                      stats["edges"], duration, self.report["edges_per_second"], self.report["wall_time"],
+                      self.report["edge_time_avg"] * 1000000, self.report["loop_lag_avg"] * 1000,
+                      self.report["loop_lag_max"] * 1000, stats["queue_max"])
+        for event, timing in sorted(timings.items(), key=lambda x: x[1][1], reverse=True)[:10]:
+            self.log.info("Handlers of %s: %s calls, %.1fus avg, %.1fus max", event, timing[0],
+                          timing[1] * 1000000 / timing[0], timing[2] * 1000000)
+
+        self.machine.events.post("switch_player_load_test_done")
+        '''event: switch_player_load_test_done
+        desc: The switch player finished replaying or generating switch
+        edges. The report was logged.
+        '''
+
 
 plugin_class = SwitchPlayer
@@ -16,6 +16,7 @@ from typing import Any
 from mpf.core.logging import LogMixin
 from mpf.core.rgb_color import RGBColor
 
+from mpf.tests import machine_snapshot
 from mpf.tests.TestDataManager import TestDataManager
 from mpf.tests.loop import TimeTravelLoop, TestClock
 
@@ -82,6 +83,16 @@ class MpfTestCase(unittest.TestCase):
 
     """Primary TestCase class used for all MPF unit tests."""
 
+    boot_snapshot = False
+    """Boot the machine once per class and run every test in a fork of the booted process.
+
+    Only works if setUp does not depend on the test method. Ignored on systems
+    without fork.
+    """
+
+    _boot_snapshot = None       # type: machine_snapshot.BootSnapshot
+    _boot_snapshot_class = None
+
     def __init__(self, methodName='runTest'):
         self._get_event_loop = None
         self._get_event_loop2 = None
@@ -469,6 +480,66 @@ class MpfTestCase(unittest.TestCase):
                 raise Exception(self._exception, e)
             raise e
 
+        self.test_boot_duration = time.time() - self.test_start_time
+
+    def run(self, result=None):
+        """Run test. Start from the booted snapshot if boot_snapshot is set."""
+        if not self.boot_snapshot or not machine_snapshot.is_supported():
+            return super().run(result)
+
+        if result is None:
+            result = self.defaultTestResult()
+
+        result.startTest(self)
+        try:
+            self._get_boot_snapshot().run("_run_test_in_snapshot", self._testMethodName)
+        except machine_snapshot.SnapshotError as e:
+            if e.skipped:
+                result.addSkip(self, e.message)
+            elif e.failure:
+                result.addFailure(self, (AssertionError, AssertionError(e.message), None))
+            else:
+                result.addError(self, (machine_snapshot.SnapshotError, e, None))
+        else:
+            result.addSuccess(self)
+        finally:
+            result.stopTest(self)
+
+        return result
+
+    def _get_boot_snapshot(self) -> machine_snapshot.BootSnapshot:
+        """Return the snapshot for this class. Boot it if needed."""
+        if MpfTestCase._boot_snapshot_class is not self.__class__:
+            # only keep the booted process of one class around
+            self.close_boot_snapshot()
+            MpfTestCase._boot_snapshot = machine_snapshot.BootSnapshot(self, "setUp")
+            MpfTestCase._boot_snapshot_class = self.__class__
+
+        return MpfTestCase._boot_snapshot
+
+    @staticmethod
+    def close_boot_snapshot():
+        """Stop the booted process of the last class."""
+        if MpfTestCase._boot_snapshot:
+            MpfTestCase._boot_snapshot.close()
+        MpfTestCase._boot_snapshot = None
+        MpfTestCase._boot_snapshot_class = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the booted process of this class."""
+        if MpfTestCase._boot_snapshot_class is cls:
+            cls.close_boot_snapshot()
+        super().tearDownClass()
+
+    def _run_test_in_snapshot(self, method_name):
+        """Run a test method in the forked copy of the booted test case."""
+        self._testMethodName = method_name
+        try:
+            getattr(self, method_name)()
+        finally:
+            self.tearDown()
+
     def _initialise_machine(self):
         init = Util.ensure_future(self.machine.initialise(), loop=self.loop)
         self._wait_for_start(init, 20)
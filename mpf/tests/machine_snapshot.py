@@ -0,0 +1,195 @@
+"""Start tests and simulations from a booted machine by forking.
+
+A booted ``MachineController`` cannot be serialised (it owns the event loop,
+futures, callbacks and hardware connections). Instead, the process which
+booted the machine is the snapshot: every run happens in a forked copy of it
+and starts with the exact state after boot (devices, handlers, modes, vars and
+switches). Fork is copy-on-write so a run starts within a few milliseconds.
+
+This only works on systems with ``os.fork`` (Linux and Mac).
+"""
+import os
+import pickle   # nosec
+import struct
+import sys
+import traceback
+import unittest
+from typing import Any, Callable, Tuple
+
+
+class SnapshotError(Exception):
+
+    """A function failed in a forked copy of the snapshot."""
+
+    def __init__(self, message: str, failure=False, skipped=False) -> None:
+        """Initialise error."""
+        super().__init__(message)
+        self.message = message
+        self.failure = failure
+        self.skipped = skipped
+
+
+def is_supported() -> bool:
+    """Return true if snapshots can be used on this system."""
+    return hasattr(os, "fork")
+
+
+def _write_frame(fd: int, data: bytes):
+    data = struct.pack(">I", len(data)) + data
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _read_exactly(fd: int, length: int) -> bytes:
+    data = b""
+    while len(data) < length:
+        chunk = os.read(fd, length - len(data))
+        if not chunk:
+            raise EOFError()
+        data += chunk
+    return data
+
+
+def _read_frame(fd: int) -> Any:
+    length = struct.unpack(">I", _read_exactly(fd, 4))[0]
+    return pickle.loads(_read_exactly(fd, length))    # nosec
+
+
+def _call(function: Callable, args) -> bytes:
+    """Call function and return its pickled result or error."""
+    try:
+        return pickle.dumps(("ok", function(*args)), protocol=4)
+    except unittest.SkipTest as e:
+        return pickle.dumps(("skip", str(e)), protocol=4)
+    # report all errors to the parent
+    # pylint: disable-msg=broad-except
+    except Exception as e:
+        return pickle.dumps(("failure" if isinstance(e, AssertionError) else "error", traceback.format_exc()),
+                            protocol=4)
+
+
+def _unpack(response: Tuple[str, Any]) -> Any:
+    """Return result or raise SnapshotError."""
+    kind, value = response
+    if kind == "ok":
+        return value
+    raise SnapshotError(value, failure=kind == "failure", skipped=kind == "skip")
+
+
+def _fork() -> int:
+    # do not print buffered output twice
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return os.fork()
+
+
+def _exit():
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)     # NOQA
+
+
+def run_in_fork(function: Callable, *args) -> Any:
+    """Run function in a fork of this process and return its result.
+
+    The state of this process is not changed by function. Results have to be
+    picklable. Raises SnapshotError if function raised.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = _fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            _write_frame(write_fd, _call(function, args))
+        finally:
+            _exit()
+
+    os.close(write_fd)
+    try:
+        response = _read_frame(read_fd)
+    except EOFError:
+        response = ("error", "Forked process exited without result.")
+    finally:
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+    return _unpack(response)
+
+
+class BootSnapshot(object):
+
+    """A process which booted once and runs methods of target in forked copies of itself.
+
+    The process is forked from the current process and calls ``boot_method``
+    of (its copy of) target. Afterwards, every ``run`` forks the booted
+    process again and calls a method of the booted target in there.
+    """
+
+    __slots__ = ["_pid", "_request_fd", "_response_fd"]
+
+    def __init__(self, target: Any, boot_method: str) -> None:
+        """Fork and boot. Raises SnapshotError if boot failed."""
+        request_read, self._request_fd = os.pipe()
+        self._response_fd, response_write = os.pipe()
+        self._pid = _fork()
+        if self._pid == 0:
+            os.close(self._request_fd)
+            os.close(self._response_fd)
+            self._serve(target, boot_method, request_read, response_write)
+
+        os.close(request_read)
+        os.close(response_write)
+        try:
+            _unpack(self._read_response())
+        except SnapshotError:
+            self.close()
+            raise
+
+    @staticmethod
+    def _serve(target, boot_method, request_fd, response_fd):
+        """Boot and handle requests until the parent closes the snapshot."""
+        try:
+            response = _call(getattr(target, boot_method), ())
+            _write_frame(response_fd, response)
+            if pickle.loads(response)[0] != "ok":   # nosec
+                return
+
+            while True:
+                request = _read_frame(request_fd)
+                if request is None:
+                    return
+                method, args = request
+                try:
+                    # the fork returns the pickled response of method
+                    response = run_in_fork(_call, getattr(target, method), args)
+                except SnapshotError as e:
+                    response = pickle.dumps(("error", e.message), protocol=4)
+                _write_frame(response_fd, response)
+        except EOFError:
+            pass
+        finally:
+            _exit()
+
+    def _read_response(self):
+        try:
+            return _read_frame(self._response_fd)
+        except EOFError:
+            return "error", "Snapshot process exited."
+
+    def run(self, method: str, *args) -> Any:
+        """Call method of target in a fresh fork of the booted process and return its result."""
+        _write_frame(self._request_fd, pickle.dumps((method, args), protocol=4))
+        return _unpack(self._read_response())
+
+    def close(self):
+        """Stop the booted process."""
+        if self._pid is None:
+            return
+        try:
+            _write_frame(self._request_fd, pickle.dumps(None, protocol=4))
+        except OSError:
+            pass
+        os.close(self._request_fd)
+        os.close(self._response_fd)
+        os.waitpid(self._pid, 0)
+        self._pid = None
@@ -0,0 +1,215 @@
+"""Run unit tests in parallel.
+
+Tests are grouped by test class and the classes are distributed over a pool
+of worker processes (one class at a time so slow classes do not block a whole
+shard). The config spec and mpfconfig.yaml are parsed once in the parent and
+passed to every worker. Combined machine configs are shared through the
+on-disk config cache.
+
+For every test the time spent to boot the machine (``setUp`` of
+``MpfTestCase``) and to run the test itself is recorded so slow fixtures can
+be found.
+"""
+import multiprocessing
+import os
+import sys
+import time
+import unittest
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import mpf.core
+from mpf.core.config_validator import ConfigValidator
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+class TimingTestResult(unittest.TestResult):
+
+    """Test result which records boot and run time per test and only keeps strings."""
+
+    def __init__(self, stream=None, descriptions=None, verbosity=0):
+        """Initialise result."""
+        super().__init__(stream, descriptions, verbosity)
+        self.buffer = True
+        self.timings = []       # type: List[Tuple[str, float, float]]
+        self._start_time = 0
+
+    def startTest(self, test):
+        """Remember start time."""
+        self._start_time = time.time()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        """Record boot and run time."""
+        super().stopTest(test)
+        duration = time.time() - self._start_time
+        boot_duration = getattr(test, "test_boot_duration", 0.0)
+        self.timings.append((test.id(), boot_duration, duration - boot_duration))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return picklable summary of this result."""
+        return {
+            "tests_run": self.testsRun,
+            "failures": [(test.id(), error) for test, error in self.failures],
+            "errors": [(test.id(), error) for test, error in self.errors],
+            "skipped": len(self.skipped),
+            "expected_failures": len(self.expectedFailures),
+            "unexpected_successes": [test.id() for test in self.unexpectedSuccesses],
+            "timings": self.timings,
+        }
+
+
+def warm_config_cache():
+    """Parse the config spec and mpfconfig.yaml once in this process."""
+    YamlInterface.cache = True
+    ConfigValidator(None).load_config_spec()
+    mpfconfig = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir, 'mpfconfig.yaml'))
+    YamlInterface().load(mpfconfig)
+
+
+def _init_worker(sys_path, file_cache, config_spec):
+    """Use the caches of the parent process in a worker."""
+    sys.path[:] = sys_path
+    YamlInterface.cache = True
+    YamlInterface.file_cache.update(file_cache)
+    ConfigValidator.class_cache = config_spec
+
+
+def _run_test_class(test_ids: List[str]) -> Dict[str, Any]:
+    """Run all tests of one class and return the result summary."""
+    result = TimingTestResult()
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    # report import errors in the worker like any other error
+    # pylint: disable-msg=broad-except
+    except Exception as e:
+        summary = result.to_dict()
+        summary["tests_run"] = 1
+        summary["errors"] = [(test_ids[0], "Could not load tests: {}".format(e))]
+        return summary
+
+    suite.run(result)
+    return result.to_dict()
+
+
+def _run_test_class_local(tests: List[unittest.TestCase]) -> Dict[str, Any]:
+    """Run tests in this process."""
+    result = TimingTestResult()
+    unittest.TestSuite(tests).run(result)
+    return result.to_dict()
+
+
+def _iterate_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iterate_tests(test)
+        else:
+            yield test
+
+
+def group_tests_by_class(suite: unittest.TestSuite) -> Tuple["OrderedDict[str, List[str]]", List[unittest.TestCase]]:
+    """Return test ids per class and tests which cannot be loaded by name (e.g. import errors)."""
+    classes = OrderedDict()     # type: OrderedDict[str, List[str]]
+    local_tests = []
+    for test in _iterate_tests(suite):
+        cls = test.__class__
+        if cls.__module__.startswith("unittest"):
+            local_tests.append(test)
+            continue
+        classes.setdefault("{}.{}".format(cls.__module__, cls.__qualname__), []).append(test.id())
+
+    return classes, local_tests
+
+
+class ParallelTestRunner(object):
+
+    """Shard test classes across a process pool."""
+
+    def __init__(self, jobs: int = None, stream=None) -> None:
+        """Initialise runner."""
+        self.jobs = jobs or os.cpu_count() or 1
+        self.stream = stream or sys.stderr
+        self.results = []       # type: List[Dict[str, Any]]
+
+    def run(self, suite: unittest.TestSuite) -> bool:
+        """Run suite and return true if all tests passed."""
+        start_time = time.time()
+        classes, local_tests = group_tests_by_class(suite)
+        # start the classes with most tests first to keep all workers busy until the end
+        shards = sorted(classes.values(), key=len, reverse=True)
+
+        if local_tests:
+            self._add_result(_run_test_class_local(local_tests))
+
+        if self.jobs == 1:
+            for shard in shards:
+                self._add_result(_run_test_class(shard))
+        else:
+            warm_config_cache()
+            pool = multiprocessing.Pool(
+                self.jobs, _init_worker, (list(sys.path), YamlInterface.file_cache, ConfigValidator.class_cache))
+            try:
+                for result in pool.imap_unordered(_run_test_class, shards):
+                    self._add_result(result)
+            finally:
+                pool.terminate()
+                pool.join()
+
+        self.stream.write("\n")
+        self._print_errors()
+        self._print_summary(time.time() - start_time)
+        return self.was_successful()
+
+    def _add_result(self, result: Dict[str, Any]):
+        self.results.append(result)
+        if result["errors"] or result["failures"]:
+            self.stream.write("F")
+        else:
+            self.stream.write(".")
+        self.stream.flush()
+
+    def _sum(self, key: str) -> int:
+        return sum(len(result[key]) if isinstance(result[key], list) else result[key] for result in self.results)
+
+    def was_successful(self) -> bool:
+        """Return true if there were no failures or errors."""
+        return not self._sum("failures") and not self._sum("errors") and not self._sum("unexpected_successes")
+
+    def get_timings(self) -> List[Tuple[str, float, float]]:
+        """Return test id, boot time and run time for all tests."""
+        return [timing for result in self.results for timing in result["timings"]]
+
+    def _print_errors(self):
+        for result in self.results:
+            for kind in ("errors", "failures"):
+                for test_id, error in result[kind]:
+                    self.stream.write("=" * 70 + "\n")
+                    self.stream.write("{}: {}\n".format("ERROR" if kind == "errors" else "FAIL", test_id))
+                    self.stream.write("-" * 70 + "\n")
+                    self.stream.write(error + "\n")
+
+    def _print_summary(self, duration: float):
+        self.stream.write("-" * 70 + "\n")
+        self.stream.write("Ran {} tests in {:.3f}s using {} processes\n\n".format(
+            self._sum("tests_run"), duration, self.jobs))
+        if self.was_successful():
+            self.stream.write("OK")
+        else:
+            self.stream.write("FAILED (failures={}, errors={})".format(self._sum("failures"), self._sum("errors")))
+        if self._sum("skipped"):
+            self.stream.write(" (skipped={})".format(self._sum("skipped")))
+        self.stream.write("\n")
+
+    def print_report(self, slowest: int = 10):
+        """Print total boot vs run time and the tests with the slowest boot and run times."""
+        timings = self.get_timings()
+        boot_total = sum(boot for _, boot, _ in timings)
+        run_total = sum(run for _, _, run in timings)
+        total = boot_total + run_total or 1.0
+        self.stream.write("\nBoot: {:.2f}s ({:.0f}%) Run: {:.2f}s ({:.0f}%)\n".format(
+            boot_total, boot_total * 100 / total, run_total, run_total * 100 / total))
+
+        for title, index in (("boot", 1), ("run", 2)):
+            self.stream.write("\nSlowest {} tests by {} time:\n".format(slowest, title))
+            for timing in sorted(timings, key=lambda x: x[index], reverse=True)[:slowest]:
+                self.stream.write("{:8.3f}s boot {:8.3f}s run  {}\n".format(timing[1], timing[2], timing[0]))
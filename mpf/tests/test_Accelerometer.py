@@ -1,6 +1,7 @@
 """Test accelerometer device."""
 import math
 
+from mpf.devices.accelerometer import AccelerometerSampleBuffer
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -165,3 +166,40 @@ class TestAccelerometer(MpfTestCase):
         self.machine_run()
         self.assertTrue(self._hit1)
         self.assertTrue(self._hit2)
+
+    def test_hits_in_window(self):
+        accelerometer = self.machine.accelerometers.test_accelerometer
+        accelerometer.update_acceleration(0.0, 0.0, 1.0)
+        self.machine_run()
+        self.mock_event("event_hit1")
+        self.mock_event("event_hit2")
+
+        # two hits in one window post the event once
+        accelerometer.update_acceleration_batch([0.01, 0.05, 0.99,
+                                                 0.4, 0.4, 1.0,
+                                                 0.01, 0.05, 0.99,
+                                                 0.4, 0.4, 1.0])
+        self.machine_run()
+        self.assertEventCalled("event_hit1", 1)
+        self.assertEventNotCalled("event_hit2")
+        self.assertEqual((0.4, 0.4, 1.0), accelerometer.value)
+        self.assertEqual([(0.01, 0.05, 0.99), (0.4, 0.4, 1.0)], accelerometer.samples.get_window(2))
+        self.assertEqual(5, accelerometer.samples.count)
+
+    def test_batch_larger_than_buffer(self):
+        accelerometer = self.machine.accelerometers.test_accelerometer
+        accelerometer.samples = AccelerometerSampleBuffer(2)
+        accelerometer.update_acceleration(0.0, 0.0, 1.0)
+        self.machine_run()
+        self.mock_event("event_hit1")
+
+        # the hit is in the first window of the buffer
+        accelerometer.update_acceleration_batch([0.4, 0.4, 1.0,
+                                                 0.0, 0.0, 1.0,
+                                                 0.0, 0.0, 1.0,
+                                                 0.0, 0.0, 1.0,
+                                                 0.0, 0.0, 1.0])
+        self.machine_run()
+        self.assertEventCalled("event_hit1", 1)
+        self.assertEqual(2, accelerometer.samples.count)
+        self.assertEqual([(0.0, 0.0, 1.0), (0.0, 0.0, 1.0)], accelerometer.samples.get_window(2))
@@ -5,6 +5,8 @@ import unittest
 import asyncio
 
 from mpf.core.clock import ClockBase
+from mpf.core.timeout_queue import TimeoutQueue
+from mpf.tests.loop import TimeTravelLoop
 from functools import partial
 
 counter = 0
@@ -64,3 +66,106 @@ class ClockTestCase(unittest.TestCase):
         self.clock.unschedule(cb1)
         self.advance_time_and_run(0.001)
         self.assertEqual(counter, 1)
+
+
+class TimerWheelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        global counter
+        counter = 0
+
+        self.loop = TimeTravelLoop()
+        self.clock = ClockBase(loop=self.loop)
+        self.callback_order = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def advance_time_and_run(self, delta=1.0):
+        self.loop.run_until_complete(asyncio.sleep(delay=delta, loop=self.loop))
+
+    def callback1(self, number):
+        self.callback_order.append(number)
+
+    def test_timer_wheel_slots(self):
+        wheel = self.clock.timer_wheel
+        wheel.resolution = .01
+        now = self.loop.time()
+        # all three fall into the same slot and share one loop callback
+        self.clock.schedule_once(partial(self.callback1, 1), .0501)
+        timer = self.clock.schedule_once(partial(self.callback1, 2), .0502)
+        self.clock.schedule_once(partial(self.callback1, 3), .0503)
+        self.clock.schedule_once(partial(self.callback1, 4), .5)
+        self.assertEqual(4, wheel.active_timers)
+        self.assertEqual(2, wheel.pending_slots)
+
+        timer.cancel()
+        timer.cancel()
+        self.assertTrue(timer.cancelled())
+        self.assertEqual(3, wheel.active_timers)
+
+        self.advance_time_and_run(.1)
+        self.assertEqual([1, 3], self.callback_order)
+        self.assertEqual(2, wheel.last_tick_callbacks)
+        self.assertEqual(1, wheel.active_timers)
+        self.assertLess(self.loop.time() - now, .5)
+
+        self.advance_time_and_run(.5)
+        self.assertEqual([1, 3, 4], self.callback_order)
+        self.assertEqual(0, wheel.active_timers)
+        self.assertEqual(0, wheel.pending_slots)
+        self.assertEqual(2, wheel.max_tick_callbacks)
+        self.assertEqual(3, wheel.get_stats()["callbacks_run"])
+
+    def test_timer_wheel_cancel_last_timer_in_slot(self):
+        wheel = self.clock.timer_wheel
+        timer = self.clock.schedule_once(callback, .01)
+        self.assertEqual(1, wheel.pending_slots)
+        self.clock.unschedule(timer)
+        self.assertEqual(0, wheel.pending_slots)
+        self.assertEqual(0, wheel.active_timers)
+        self.advance_time_and_run(.02)
+        self.assertEqual(0, counter)
+        self.assertEqual(0, wheel.ticks)
+
+    def test_timeout_queue(self):
+        wheel = self.clock.timer_wheel
+        queue = TimeoutQueue(self.clock, self.callback1)
+        queue.add_ms("a", 300)
+        queue.add_ms("b", 100)
+        queue.add_ms("c", 200)
+        queue.add_ms("d", 200)
+        # only the earliest deadline has a timer
+        self.assertEqual(1, wheel.active_timers)
+        self.assertEqual(4, len(queue))
+
+        # replace and remove
+        queue.add_ms("b", 250)
+        self.assertTrue(queue.remove("d"))
+        self.assertFalse(queue.remove("d"))
+        self.assertNotIn("d", queue)
+
+        self.advance_time_and_run(.21)
+        self.assertEqual(["c"], self.callback_order)
+        self.advance_time_and_run(.1)
+        self.assertEqual(["c", "b", "a"], self.callback_order)
+        self.assertEqual(0, len(queue))
+        self.assertEqual(0, wheel.active_timers)
+
+        queue.add_ms("e", 100)
+        queue.clear()
+        self.assertEqual(0, wheel.active_timers)
+        self.advance_time_and_run(.2)
+        self.assertEqual(["c", "b", "a"], self.callback_order)
+
+    def test_periodic_tasks_share_slots(self):
+        wheel = self.clock.timer_wheel
+        task1 = self.clock.schedule_interval(partial(self.callback1, 1), .1)
+        task2 = self.clock.schedule_interval(partial(self.callback1, 2), .1)
+        self.assertEqual(1, wheel.pending_slots)
+        self.advance_time_and_run(.15)
+        self.assertEqual([1, 2], self.callback_order)
+        self.assertEqual(2, wheel.last_tick_callbacks)
+        task1.cancel()
+        task2.cancel()
+        self.assertEqual(0, wheel.active_timers)
@@ -144,6 +144,20 @@ class TestCreditsMode(MpfTestCase):
         self.machine_run()
         self.assertEqual("CREDITS 3", self.machine.get_machine_var('credits_string'))
 
+    def testCreditsSurviveRunningMachine(self):
+        self.hit_and_release_switch("s_right_coin")
+        self.machine_run()
+        self.assertEqual("CREDITS 2", self.machine.get_machine_var('credits_string'))
+        credit_units = self.machine.get_machine_var('credit_units')
+
+        # persist_credits_while_off_time only counts while the machine is off
+        self.advance_time_and_run(3700)
+        self.assertEqual(credit_units, self.machine.get_machine_var('credit_units'))
+        self.assertEqual("CREDITS 2", self.machine.get_machine_var('credits_string'))
+        self.assertEqual(credit_units, self.machine.machine_var_data_manager.data["credit_units"]["value"])
+
+        self.start_game(True)
+
     def testReplay(self):
         # add coins
         self.hit_and_release_switch("s_left_coin")
@@ -171,6 +185,34 @@ class TestCreditsMode(MpfTestCase):
         self.stop_game()
         self.assertEqual("CREDITS 1", self.machine.get_machine_var('credits_string'))
 
+    def testReplayScoreSetting(self):
+        settings = self.machine.settings
+        changes = []
+        settings.add_change_handler("replay_score", changes.append)
+        future = settings.wait_for_change("replay_score")
+        self.assertEqual(500000, settings.get_setting_value("replay_score"))
+        self.assertEqual(500000, settings.replay_score)
+
+        settings.set_setting_value("replay_score", 1000000)
+        self.assertEqual(1000000, settings.get_setting_value("replay_score"))
+        self.assertTrue(changes)
+        self.assertTrue(future.done())
+        self.assertEqual("1000000", settings.get_setting_value_label("replay_score"))
+
+        # changing the machine var directly also changes the setting
+        changes.clear()
+        self.machine.set_machine_var("replay_score", 1500000)
+        self.assertEqual(["replay_score"], changes)
+        self.assertEqual(1500000, settings.get_setting_value("replay_score"))
+
+        self.machine.remove_machine_var("replay_score")
+        self.assertEqual(500000, settings.get_setting_value("replay_score"))
+
+        settings.remove_change_handler("replay_score", changes.append)
+        changes.clear()
+        settings.set_setting_value("replay_score", 1000000)
+        self.assertEqual([], changes)
+
     def testMorePlayers(self):
         self.assertTrue(self.machine.mode_controller.is_active('credits'))
         self.assertEqual("CREDITS 0", self.machine.get_machine_var('credits_string'))
@@ -1,11 +1,15 @@
 """Test the bonus mode."""
 import os
+import tempfile
 import time
+import unittest
 from unittest.mock import mock_open, patch
 
+from mpf.core.file_manager import FileManager
 from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpf.core.data_manager import DataManager
 from mpf.tests.MpfTestCase import MpfTestCase
+from mpf.tests.machine_snapshot import SnapshotError, is_supported, run_in_fork
 
 
 class TestDataManager(MpfTestCase):
@@ -37,12 +41,17 @@ class TestDataManager(MpfTestCase):
 
         open_mock = mock_open(read_data="")
         with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
-            with patch('mpf.core.data_manager.os.replace') as move_mock:
+            with patch('mpf.core.data_manager.os.replace') as move_mock, \
+                    patch('mpf.file_interfaces.yaml_interface.os.fsync') as fsync_mock:
                 manager.save_all({"hallo": "world"})
+                # data is copied in the loop and written by the thread
+                self.advance_time_and_run(.1)
                 while not move_mock.called:
                     time.sleep(.00001)
                 open_mock().write.assert_called_once_with('hallo: world\n')
                 self.assertTrue(move_mock.called)
+                # temp file is flushed to disk before it replaces the old file
+                self.assertTrue(fsync_mock.called)
 
         open_mock = mock_open(read_data='hallo: world\n')
         with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
@@ -103,3 +112,61 @@ class TestDataManager(MpfTestCase):
 
         self.assertEqual({}, manager.get_data("hallo"))
         self.assertEqual({}, manager.get_data("invalid"))
+
+    def _wait_for_file(self, filename, data):
+        for _ in range(1000):
+            if os.path.isfile(filename) and FileManager.load(filename, halt_on_error=False) == data:
+                return
+            time.sleep(.005)
+        self.fail("{} was not written".format(filename))
+
+    def test_coalesce_saves(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "audits.yaml")
+            self.machine.config['mpf']['paths']['coalesce_test'] = filename
+            manager = DataManager(self.machine, "coalesce_test", min_wait_secs=0)
+
+            audits = {"events": {}}
+            with patch.object(manager, "_take_snapshot", wraps=manager._take_snapshot) as snapshot_mock:
+                # a burst of saves in one loop iteration is copied once
+                for player in range(4):
+                    audits["events"]["player_{}".format(player)] = player
+                    manager.save_all(audits)
+                self.advance_time_and_run(.1)
+                self.assertEqual(1, snapshot_mock.call_count)
+
+            # later changes of the caller do not leak into the pending write
+            audits["events"]["player_4"] = 4
+            self._wait_for_file(filename, {"events": {"player_0": 0, "player_1": 1, "player_2": 2, "player_3": 3}})
+
+    @staticmethod
+    def _crash_while_writing(manager):
+        # the process dies after the new data was written but before it is on disk and replaced the file
+        with patch('mpf.file_interfaces.yaml_interface.os.fsync', side_effect=lambda fd: os._exit(1)):
+            manager.save_all({"score": 2})
+            manager._take_snapshot()
+            manager._write()
+
+    @unittest.skipIf(not is_supported(), "Needs os.fork")
+    def test_crash_during_write(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "high_scores.yaml")
+            self.machine.config['mpf']['paths']['crash_test'] = filename
+            manager = DataManager(self.machine, "crash_test", min_wait_secs=0)
+            manager.save_all({"score": 1})
+            self.advance_time_and_run(.1)
+            self._wait_for_file(filename, {"score": 1})
+
+            with self.assertRaises(SnapshotError):
+                run_in_fork(self._crash_while_writing, manager)
+
+            # the temp file is left behind but the old data is complete
+            self.assertTrue(os.path.isfile(os.path.join(path, "_high_scores.yaml")))
+            manager2 = DataManager(self.machine, "crash_test", min_wait_secs=0)
+            self.assertEqual({"score": 1}, manager2.get_data())
+
+            # the next write replaces the temp file
+            manager2.save_all({"score": 3})
+            self.advance_time_and_run(.1)
+            self._wait_for_file(filename, {"score": 3})
+            self.assertFalse(os.path.isfile(os.path.join(path, "_high_scores.yaml")))
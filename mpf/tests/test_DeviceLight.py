@@ -1,4 +1,6 @@
 """Test the LED device."""
+import random
+
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -217,6 +219,33 @@ class TestDeviceLight(MpfTestCase):
         self.assertEqual(RGBColor('green'), led1.stack[2].dest_color)
         self.assertEqual(RGBColor('orange'), led1.stack[3].dest_color)
 
+    def test_stack_order_matches_sort(self):
+        led1 = self.machine.lights.led1
+        rand = random.Random(42)
+        colors = [RGBColor('red'), RGBColor('blue'), RGBColor('green')]
+
+        for _ in range(500):
+            key = "key{}".format(rand.randint(0, 20))
+            action = rand.randint(0, 3)
+            if action == 0:
+                led1.remove_from_stack_by_key(key)
+            elif action == 1:
+                led1.remove_from_stack_by_key(key, fade_ms=rand.choice([0, 100]))
+            else:
+                led1.color(rand.choice(colors), fade_ms=rand.choice([0, 100]), priority=rand.randint(0, 5), key=key)
+            if rand.randint(0, 10) == 0:
+                self.advance_time_and_run(.05)
+
+            # stack has to be in the same order as a full sort using LightStackEntry.__gt__
+            self.assertEqual(sorted(led1.stack, reverse=True), led1.stack)
+            self.assertEqual(len(set(entry.key for entry in led1.stack)), len(led1.stack))
+            for entry in led1.stack:
+                self.assertEqual(entry.priority, led1._get_priority_from_key(entry.key))
+
+        led1.clear_stack()
+        self.assertFalse(led1.stack)
+        self.assertEqual(0, led1._get_priority_from_key("key1"))
+
     def test_named_colors(self):
         led1 = self.machine.lights.led1
         led1.color('jans_red')
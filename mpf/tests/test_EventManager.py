@@ -349,6 +349,24 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(False,
                          self.machine.events.does_event_exist('test_event1'))
 
+    def test_has_handlers_for_family(self):
+        events = self.machine.events
+        self.assertFalse(events.has_handlers_for_family("test_shot_", "_hit"))
+
+        key = events.add_handler('test_shot_default_lit_hit', self.event_handler1)
+        self.assertTrue(events.has_handlers_for_family("test_shot_", "_hit"))
+        self.assertFalse(events.has_handlers_for_family("test_shot_", "_complete"))
+        self.assertFalse(events.has_handlers_for_family("other_shot_", "_hit"))
+
+        events.remove_handler_by_key(key)
+        self.assertFalse(events.has_handlers_for_family("test_shot_", "_hit"))
+
+        # everything is handled while events are monitored
+        events.monitor_events = True
+        self.assertTrue(events.has_handlers_for_family("other_shot_", "_hit"))
+        events.monitor_events = False
+        self.assertFalse(events.has_handlers_for_family("other_shot_", "_hit"))
+
     def test_regular_event_with_false_return(self):
         # tests that regular events process all handlers even if one returns
         # False
@@ -0,0 +1,67 @@
+"""Test frame buffers of the LED output stage."""
+import unittest
+
+from mpf.platforms.led_output_stage import LedFrameBuffer
+
+
+class TestLedFrameBuffer(unittest.TestCase):
+
+    def test_dirty_range(self):
+        frame = LedFrameBuffer(30)
+        self.assertEqual(None, frame.get_dirty_range())
+
+        frame.set_value(5, 23)
+        frame.set_value(17, 42)
+        self.assertEqual((5, 18), frame.get_dirty_range())
+        frame.commit(5, 18)
+        self.assertEqual(None, frame.get_dirty_range())
+        self.assertEqual(42, frame.front[17])
+
+        # same value again is not dirty
+        frame.set_value(17, 42)
+        self.assertEqual(None, frame.get_dirty_range())
+
+        frame.set_value(0, 1)
+        frame.set_value(29, 1)
+        self.assertEqual((0, 30), frame.get_dirty_range())
+        frame.commit(0, 30)
+
+        frame.invalidate()
+        self.assertTrue(frame.full_refresh)
+        self.assertEqual((0, 30), frame.get_dirty_range())
+        frame.commit(0, 30)
+        self.assertFalse(frame.full_refresh)
+
+    def test_fade_callbacks(self):
+        frame = LedFrameBuffer(3, hardware_fade_ms=10)
+        fades = [(0.5, 30), (1.0, 5)]
+        frame.set_fade(1, lambda max_fade_ms: fades.pop(0))
+
+        frame.render()
+        self.assertEqual(127, frame.back[1])
+        self.assertEqual((1, 2), frame.get_dirty_range())
+        frame.commit(1, 2)
+
+        # fade continues
+        frame.render()
+        self.assertEqual(255, frame.back[1])
+        self.assertEqual((1, 2), frame.get_dirty_range())
+        frame.commit(1, 2)
+
+        # fade done
+        self.assertFalse(frame.fade_callbacks)
+        frame.render()
+        self.assertEqual(None, frame.get_dirty_range())
+
+    def test_resize_and_clear(self):
+        frame = LedFrameBuffer()
+        self.assertEqual(0, len(frame))
+        frame.resize(6)
+        self.assertEqual(6, len(frame))
+        frame.resize(3)
+        self.assertEqual(6, len(frame))
+
+        frame.set_value(4, 255)
+        frame.clear()
+        self.assertEqual(bytearray(6), frame.back)
+        self.assertEqual(None, frame.get_dirty_range())
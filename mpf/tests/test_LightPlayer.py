@@ -329,3 +329,29 @@ class TestLedPlayer(MpfFakeGameTestCase):
         self.assertLightColor("led3", 'red')
         self.assertEqual(0, self.machine.lights.led3.stack[0].priority)
         self.assertEqual(1, len(self.machine.lights.led3.stack))
+
+    def test_plan_cache(self):
+        light_player = self.machine.show_controller.show_players["lights"]
+        led1 = self.machine.lights.led1
+        settings = self.machine.config['light_player']['event1']
+
+        self.machine.events.post('event1')
+        self.advance_time_and_run()
+        self.assertLightColor("led1", 'red')
+        self.assertEqual(200, led1.stack[0].priority)
+        # settings are not changed by play
+        self.assertEqual(200, settings[led1]['priority'])
+
+        plan = light_player._plans["_global"][id(settings)]
+        self.assertIs(settings, plan.settings)
+        self.assertIn((led1, RGBColor("red"), 0, 200), plan.entries)
+
+        # the plan is reused on the next play
+        self.machine.events.post('event1')
+        self.advance_time_and_run()
+        self.assertIs(plan, light_player._plans["_global"][id(settings)])
+
+        # and dropped when the context is cleared
+        light_player.clear_context("_global")
+        self.assertNotIn("_global", light_player._plans)
+        self.assertFalse(led1.stack)
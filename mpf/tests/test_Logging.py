@@ -0,0 +1,79 @@
+import io
+import logging
+from unittest import TestCase
+
+from mpf.core.logging import AsyncLogHandler, LogMixin
+
+
+class TestAsyncLogHandler(TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        target = logging.StreamHandler(self.stream)
+        target.setFormatter(logging.Formatter("%(levelname)s : %(name)s : %(message)s"))
+        target.setLevel(logging.INFO)
+        self.handler = AsyncLogHandler([target], ring_size=3, interval=.01)
+        self.logger = logging.getLogger("test_async_log_handler")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.addCleanup(self.handler.close)
+
+    def test_enqueue_unformatted(self):
+        args = {"a": 1}
+        self.logger.info("Event: %s Args=%s", "test", args)
+        self.handler.enqueue(self.logger.name, logging.INFO, "Raw %s", (args, ))
+        args["b"] = 2
+
+        record = self.handler.ring[0]
+        self.assertEqual("Event: %s Args=%s", record.msg)
+        self.assertFalse(hasattr(record, "message"))
+        self.assertEqual("", self.stream.getvalue())
+
+        # containers are copied when the entry is enqueued
+        self.handler.start()
+        self.handler.stop()
+        self.assertEqual("INFO : test_async_log_handler : Event: test Args={'a': 1}\n"
+                         "INFO : test_async_log_handler : Raw {'a': 1}\n", self.stream.getvalue())
+
+    def test_handler_level(self):
+        self.handler.start()
+        self.logger.debug("Hidden %s", 1)
+        self.logger.info("Shown %s", 2)
+        self.handler.stop()
+
+        self.assertEqual("INFO : test_async_log_handler : Shown 2\n", self.stream.getvalue())
+
+    def test_log_mixin(self):
+        log = LogMixin()
+        log.configure_logging("test_async_log_handler", "full", "full")
+        LogMixin.async_log_handler = self.handler
+        self.addCleanup(setattr, LogMixin, "async_log_handler", None)
+
+        log.info_log("Info %s", 1)
+        log.debug_log("Debug %s", 2)
+        self.logger.setLevel(logging.WARNING)
+        log.info_log("Disabled %s", 3)
+        self.assertEqual([("test_async_log_handler", 22, "Info %s", (1, )),
+                          ("test_async_log_handler", 12, "Debug %s", (2, ))],
+                         [entry[:4] for entry in self.handler.ring])
+
+        self.handler.start()
+        self.handler.stop()
+        self.assertEqual("INFO : test_async_log_handler : Info 1\n", self.stream.getvalue())
+
+    def test_ring(self):
+        for i in range(5):
+            self.logger.info("Record %s", i)
+
+        stream = io.StringIO()
+        self.handler.dump_ring(stream, logging.Formatter("%(message)s"))
+        self.assertEqual("Record 2\nRecord 3\nRecord 4\n", stream.getvalue())
+
+    def test_dump_broken_record(self):
+        self.handler.enqueue(self.logger.name, logging.INFO, "Record %s %s", (1, ))
+
+        stream = io.StringIO()
+        self.handler.dump_ring(stream, logging.Formatter("%(message)s"))
+        self.assertTrue(stream.getvalue().startswith("Could not format record: ('test_async_log_handler', 20,"))
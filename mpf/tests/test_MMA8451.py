@@ -61,3 +61,88 @@ class TestMMA8451(MpfTestCase):
                     self.advance_time_and_run(.1)
 
                     self.assertEqual((0, 0, 9.199), self.machine.accelerometers.test_accelerometer.value)
+
+
+class TestMMA8451Fifo(MpfTestCase):
+
+    def get_platform(self):
+        return False
+
+    def getConfigFile(self):
+        return 'fifo.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/mma8451/'
+
+    @asyncio.coroutine
+    def i2c_read8(self, register):
+        if register == 0x00:
+            # FIFO status with sample count
+            return len(self.fifo)
+        return self.i2c_layout[register]
+
+    @asyncio.coroutine
+    def i2c_read_block(self, register, count):
+        assert register == 0x01
+        assert count % 6 == 0
+        # SMBus limit
+        assert count <= 32
+        self.block_reads += 1
+        result = bytearray()
+        for _ in range(count // 6):
+            result.extend(self.fifo.pop(0))
+        return result
+
+    def i2c_write8(self, register, value):
+        """Write to I2C."""
+        key = (register, value)
+        if key not in self.i2c_expect:
+            raise AssertionError("Did not expect write to register {:02X} with value {:02X} ({})".
+                                 format(register, value, key))
+        del self.i2c_expect[key]
+
+    def setUp(self):
+        self.fifo = []
+        self.block_reads = 0
+        self.i2c_layout = {0x0D: 0x1A,      # ID of the device
+                           0x2B: 00,        # reset success
+                           }
+        self.i2c_expect = {(0x2B, 0x40): True,  # reset
+                           (0x2B, 0x02): True,  # resolution
+                           (0x2D, 0x01): True,  # ready true
+                           (0x2E, 0x01): True,  # ready true
+                           (0x11, 0x40): True,  # orientation mode on
+                           (0x09, 0x40): True,  # FIFO in circular mode
+                           (0x2A, 0x0D): True,  # 400Hz, low noise and activate
+                           }
+        self.patches = [patch("mpf.platforms.virtual.VirtualI2cDevice.i2c_read8", new=self.i2c_read8),
+                        patch("mpf.platforms.virtual.VirtualI2cDevice.i2c_read_block", new=self.i2c_read_block),
+                        patch("mpf.platforms.virtual.VirtualI2cDevice.i2c_write8", new=self.i2c_write8)]
+        for p in self.patches:
+            p.start()
+        super().setUp()
+
+        self.assertFalse(self.i2c_expect)
+
+    def tearDown(self):
+        super().tearDown()
+        for p in self.patches:
+            p.stop()
+
+    def test_burst_read(self):
+        accelerometer = self.machine.accelerometers.test_accelerometer
+        # 12 samples are read in 3 block reads
+        self.fifo = [bytearray([0, 0, 0, 0, 60, 10])] * 11 + [bytearray([0, 0, 0, 0, 64, 0])]
+        self.advance_time_and_run(.05)
+        self.assertFalse(self.fifo)
+        self.assertEqual(3, self.block_reads)
+        self.assertEqual((0, 0, 9.807), accelerometer.value)
+
+        # only the last 8 samples are kept
+        self.assertEqual(8, accelerometer.samples.count)
+        window = accelerometer.samples.get_window(2)
+        self.assertEqual([(0, 0, 9.199), (0, 0, 9.807)], window)
+
+        # empty FIFO does not read
+        self.advance_time_and_run(.1)
+        self.assertEqual(3, self.block_reads)
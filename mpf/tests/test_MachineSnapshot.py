@@ -0,0 +1,83 @@
+"""Test starting tests from a booted machine snapshot."""
+import os
+import unittest
+
+from mpf.tests import machine_snapshot
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+@unittest.skipUnless(machine_snapshot.is_supported(), "Requires fork")
+class TestRunInFork(unittest.TestCase):
+
+    def test_result_and_isolation(self):
+        state = {"value": 1}
+
+        def change_state():
+            state["value"] = 2
+            return os.getpid(), state["value"]
+
+        pid, value = machine_snapshot.run_in_fork(change_state)
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual(2, value)
+        # the parent is unchanged
+        self.assertEqual(1, state["value"])
+
+    def test_errors(self):
+        def fail():
+            raise AssertionError("broken")
+
+        with self.assertRaises(machine_snapshot.SnapshotError) as e:
+            machine_snapshot.run_in_fork(fail)
+        self.assertTrue(e.exception.failure)
+        self.assertIn("AssertionError: broken", e.exception.message)
+
+        with self.assertRaises(machine_snapshot.SnapshotError) as e:
+            machine_snapshot.run_in_fork(int, "a")
+        self.assertFalse(e.exception.failure)
+        self.assertIn("ValueError", e.exception.message)
+
+
+@unittest.skipUnless(machine_snapshot.is_supported(), "Requires fork")
+class TestMachineSnapshot(unittest.TestCase):
+
+    class SnapshotSwitchTest(MpfTestCase):
+
+        boot_snapshot = True
+
+        def getConfigFile(self):
+            return 'config.yaml'
+
+        def getMachinePath(self):
+            return 'tests/machine_files/switch_controller/'
+
+        def test_change_state(self):
+            self.machine.set_machine_var("snapshot_test", 1)
+            self.hit_switch_and_run("s_test", 1)
+            self.assertSwitchState("s_test", 1)
+
+        def test_state_after_boot(self):
+            self.assertFalse(self.machine.is_machine_var("snapshot_test"))
+            self.assertSwitchState("s_test", 0)
+            self.hit_switch_and_run("s_test", 1)
+            self.assertSwitchState("s_test", 1)
+
+        def test_fail(self):
+            self.assertSwitchState("s_test", 1)
+
+    def test_tests_start_from_booted_machine(self):
+        suite = unittest.defaultTestLoader.loadTestsFromNames([
+            "mpf.tests.test_MachineSnapshot.TestMachineSnapshot.SnapshotSwitchTest.test_change_state",
+            "mpf.tests.test_MachineSnapshot.TestMachineSnapshot.SnapshotSwitchTest.test_state_after_boot",
+            "mpf.tests.test_MachineSnapshot.TestMachineSnapshot.SnapshotSwitchTest.test_fail",
+            "mpf.tests.test_MachineSnapshot.TestMachineSnapshot.SnapshotSwitchTest.test_state_after_boot",
+        ])
+        result = unittest.TestResult()
+        suite.run(result)
+
+        self.assertEqual(4, result.testsRun)
+        self.assertEqual([], result.errors)
+        self.assertEqual(1, len(result.failures))
+        self.assertEqual("test_fail", result.failures[0][0]._testMethodName)
+        self.assertIn("AssertionError", result.failures[0][1])
+        # the booted process is stopped after the class
+        self.assertIsNone(MpfTestCase._boot_snapshot)
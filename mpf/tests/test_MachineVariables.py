@@ -1,5 +1,6 @@
 """Test the bonus mode."""
-from unittest.mock import MagicMock
+import time
+from unittest.mock import MagicMock, patch
 
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf._version import version, extended_version
@@ -18,8 +19,8 @@ class TestMachineVariables(MpfTestCase):
                                  "player3_score": {"value": 17789290},
                                  "player4_score": {"value": 3006600},
                                  "another_score": {"value": 123},
-                                 "expired_value": {"value": 23, "expire": self.clock.get_time() - 100},
-                                 "not_expired_value": {"value": 24, "expire": self.clock.get_time() + 100},
+                                 "expired_value": {"value": 23, "expire": time.time() - 100},
+                                 "not_expired_value": {"value": 24, "expire": time.time() + 100},
                                  "test1": {"value": 42}},
                 }
 
@@ -68,6 +69,69 @@ class TestMachineVariables(MpfTestCase):
         self.assertEqual({'test1': {'value': 42, 'expire': None}, 'test2': {'value': '5', 'expire': None}},
                          self.machine.machine_var_data_manager.data)
 
+    def testBatchedWrites(self):
+        self.advance_time_and_run(10)
+        data_manager = self.machine.machine_var_data_manager
+        data_manager._trigger_save = MagicMock()
+        data_manager.save_keys = MagicMock(wraps=data_manager.save_keys)
+
+        self.machine.configure_machine_var("counter", persist=True)
+        for i in range(10):
+            self.machine.set_machine_var("counter", i + 1)
+        self.machine.set_machine_var("another_score", 200)
+
+        # nothing is written before the write interval passed
+        data_manager._trigger_save.assert_not_called()
+        self.advance_time_and_run(.2)
+
+        # only the dirty persisted var is written
+        data_manager.save_keys.assert_called_once_with({"counter": {"value": 10, "expire": None}}, [])
+        self.assertEqual(1, data_manager._trigger_save.call_count)
+        self.assertEqual({"value": 10, "expire": None}, data_manager.data["counter"])
+        self.assertEqual(42, data_manager.data["test1"]["value"])
+
+        self.machine.remove_machine_var("counter")
+        self.advance_time_and_run(.2)
+        self.assertNotIn("counter", data_manager.data)
+        self.assertEqual(2, data_manager._trigger_save.call_count)
+
+    def testExpire(self):
+        self.advance_time_and_run(10)
+        data_manager = self.machine.machine_var_data_manager
+        self.mock_event("machine_var_credits")
+
+        self.machine.configure_machine_var("credits", persist=True, expire_secs=100)
+        self.machine.set_machine_var("credits", 3)
+        self.advance_time_and_run(1)
+        self.assertEventCalled("machine_var_credits")
+        self.assertEqual(3, data_manager.data["credits"]["value"])
+        # expire is stored as wall clock time
+        self.assertAlmostEqual(time.time() + 100, data_manager.data["credits"]["expire"], delta=1)
+
+        # vars do not expire while the machine is running
+        handler = MagicMock()
+        self.machine.add_machine_var_change_handler("credits", handler)
+        self.mock_event("machine_var_credits")
+        self.advance_time_and_run(300)
+        self.assertEqual(3, self.machine.get_machine_var("credits"))
+        self.assertTrue(self.machine.is_machine_var("credits"))
+        self.assertEventNotCalled("machine_var_credits")
+        handler.assert_not_called()
+        self.assertEqual(3, data_manager.data["credits"]["value"])
+
+        # the expire time on disk moves forward while the machine is running
+        with patch("mpf.core.machine.time.time", return_value=time.time() + 1000):
+            self.advance_time_and_run(61)
+        self.assertAlmostEqual(time.time() + 1100, data_manager.data["credits"]["expire"], delta=1)
+
+        # vars without expire are not written again
+        self.machine.configure_machine_var("test1", persist=True)
+        self.machine.set_machine_var("test1", 43)
+        self.advance_time_and_run(1)
+        data_manager.save_keys = MagicMock()
+        self.machine.configure_machine_var("credits", persist=False)
+        self.advance_time_and_run(100)
+        data_manager.save_keys.assert_called_once_with({}, ["credits"])
 
 class TestMalformedMachineVariables(MpfTestCase):
 
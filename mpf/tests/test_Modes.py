@@ -124,6 +124,53 @@ class TestModes(MpfFakeGameTestCase):
         self.advance_time_and_run()
         self.mode_start_callback.assert_called_once_with()
 
+    def test_activation_plan_and_timings(self):
+        mode = self.machine.modes.mode1
+        self.assertNotIn("stop_mode1", self.machine.events.registered_handlers)
+
+        self.machine.events.post('start_mode1')
+        self.advance_time_and_run()
+        self.assertTrue(mode.active)
+        plan = mode._activation_plan
+        self.assertTrue(plan)
+        # stop handler is registered with the mode priority added
+        self.assertEqual(200 + mode.config['mode']['stop_priority'] + 1,
+                         self.machine.events.registered_handlers["stop_mode1"][0].priority)
+
+        self.machine.events.post('stop_mode1')
+        self.advance_time_and_run()
+        self.assertFalse(mode.active)
+        self.assertFalse(mode.event_handlers)
+        self.assertNotIn("stop_mode1", self.machine.events.registered_handlers)
+
+        # plan is reused on the next start
+        mode.start(mode_priority=300)
+        self.advance_time_and_run()
+        self.assertTrue(mode.active)
+        self.assertIs(plan, mode._activation_plan)
+        self.assertEqual(300 + mode.config['mode']['stop_priority'] + 1,
+                         self.machine.events.registered_handlers["stop_mode1"][0].priority)
+
+        # plan is recompiled when start methods change
+        start_method = MagicMock(return_value=None)
+        self.machine.mode_controller.register_start_method(start_method)
+        mode.stop()
+        self.advance_time_and_run()
+        mode.start()
+        self.advance_time_and_run()
+        self.assertIsNot(plan, mode._activation_plan)
+        start_method.assert_called_once_with(config=mode.config, priority=200, mode=mode)
+        mode.stop()
+        self.advance_time_and_run()
+
+        timing = self.machine.mode_controller.mode_timings["mode1"]
+        self.assertEqual(3, timing.starts)
+        self.assertEqual(3, timing.stops)
+        self.assertGreaterEqual(timing.start_max, 0)
+        report = self.machine.mode_controller.get_mode_timing_report()
+        self.assertIn("mode1", report)
+        self.assertNotIn("mode2", report)
+
     def test_use_wait_queue(self):
         self.callback = MagicMock()
         self.machine.events.post_queue('start_mode4',
@@ -281,6 +281,63 @@ class TestMultiBall(MpfGameTestCase):
         self.advance_time_and_run(1)
         self.assertEqual(None, self.machine.game)
 
+    def testBallSaveEnabledBeforeMultiball(self):
+        self.mock_event("ball_save_bs_mb_saving_ball")
+        self.mock_event("multiball_mb2_shoot_again")
+
+        # prepare game
+        self.fill_troughs()
+        self.start_game()
+        self.advance_time_and_run(4)
+        self.assertEqual(1, self.machine.playfield.balls)
+
+        # ball save is enabled before the multiball starts
+        self.post_event("bs_enable")
+        self.post_event("mb2_enable")
+        self.post_event("mb2_start")
+        self.advance_time_and_run(10)
+        self.assertEqual(3, self.machine.playfield.balls)
+
+        # the ball save handles the drain first
+        self.drain_ball()
+        self.advance_time_and_run(1)
+        self.assertEventCalled("ball_save_bs_mb_saving_ball", 1)
+        self.assertEventNotCalled("multiball_mb2_shoot_again")
+
+        # shoot again handles the next drain
+        self.drain_ball()
+        self.advance_time_and_run(1)
+        self.assertEventCalled("ball_save_bs_mb_saving_ball", 1)
+        self.assertEventCalled("multiball_mb2_shoot_again", 1)
+
+    def testBallSaveEnabledDuringMultiball(self):
+        self.mock_event("ball_save_bs_mb_saving_ball")
+        self.mock_event("multiball_mb2_shoot_again")
+
+        # prepare game
+        self.fill_troughs()
+        self.start_game()
+        self.advance_time_and_run(4)
+        self.assertEqual(1, self.machine.playfield.balls)
+
+        self.post_event("mb2_enable")
+        self.post_event("mb2_start")
+        self.advance_time_and_run(10)
+        self.assertEqual(3, self.machine.playfield.balls)
+
+        # ball saves come before shoot again also when they are enabled later
+        self.post_event("bs_enable")
+        self.advance_time_and_run()
+        self.drain_ball()
+        self.advance_time_and_run(1)
+        self.assertEventCalled("ball_save_bs_mb_saving_ball", 1)
+        self.assertEventNotCalled("multiball_mb2_shoot_again")
+
+        self.drain_ball()
+        self.advance_time_and_run(1)
+        self.assertEventCalled("ball_save_bs_mb_saving_ball", 1)
+        self.assertEventCalled("multiball_mb2_shoot_again", 1)
+
     def testSimultaneousMultiballs(self):
         self.mock_event("multiball_mb2_ended")
         self.mock_event("multiball_mb3_ended")
@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
 from mpf.tests.MpfTestCase import MpfTestCase
 from unittest.mock import MagicMock, call
 from mpf.platforms import p_roc_common, p_roc
@@ -83,6 +87,8 @@ class TestPRoc(MpfTestCase):
             return "snux.yaml"
         elif "wpc" in self._testMethodName:
             return "wpc.yaml"
+        elif "separate_thread" in self._testMethodName:
+            return "separate_thread.yaml"
         else:
             return 'config.yaml'
 
@@ -424,6 +430,79 @@ class TestPRoc(MpfTestCase):
         device.hw_drivers["white"][0].driver.hw_driver.proc.driver_disable.assert_has_calls([
             call(num)])
 
+    def _wait_for_pump(self, condition):
+        # the pump thread runs in real time
+        start = time.time()
+        while not condition() and time.time() < start + 5:
+            time.sleep(.001)
+            self.advance_time_and_run(.001)
+        self.assertTrue(condition())
+
+    def test_separate_thread(self):
+        platform = self.machine.default_platform
+        self.assertTrue(platform.features['tickless'])
+        self.assertTrue(platform.event_pump.running)
+
+        # switch events are handed over to the loop
+        events = [[{'type': 1, 'value': 23}]]
+        self.pinproc.get_events = MagicMock(side_effect=lambda: events.pop() if events else [])
+        self._wait_for_pump(lambda: self.machine.switch_controller.is_active("s_test"))
+
+        # commands are sent by the pump thread
+        self.machine.coils.c_test.pulse()
+        self._wait_for_pump(lambda: self.pinproc.driver_pulse.called)
+        self.pinproc.driver_pulse.assert_called_with(34, 23)
+        self.assertTrue(self.pinproc.watchdog_tickle.called)
+        self.assertTrue(self.pinproc.flush.called)
+
+        # calls with result go through the thread as well
+        self.pinproc.driver_get_state = MagicMock(return_value={"state": 1})
+        self.assertEqual({"state": 1}, self.machine.coils.c_test.hw_driver.state())
+
+        # the thread does not tickle the watchdog when the loop hangs
+        self.pinproc.watchdog_tickle = MagicMock()
+        time.sleep(.05)
+        self.assertFalse(self.pinproc.watchdog_tickle.called)
+        self._wait_for_pump(lambda: self.pinproc.watchdog_tickle.called)
+
+        platform.stop()
+        self.assertFalse(platform.event_pump.running)
+        self.pinproc.reset.assert_called_with(1)
+
+    def test_separate_thread_crash(self):
+        platform = self.machine.default_platform
+        pump = platform.event_pump
+        polling = threading.Event()
+        usb_failed = threading.Event()
+
+        def get_events():
+            polling.set()
+            usb_failed.wait()
+            raise IOError("USB disconnected")
+
+        self.pinproc.get_events = MagicMock(side_effect=get_events)
+        self.pinproc.driver_get_state = MagicMock(return_value={"state": 1})
+
+        # calls time out instead of blocking the loop forever
+        pump.call_timeout = .01
+        self.assertTrue(polling.wait(5))
+        try:
+            with self.assertRaises(TimeoutError):
+                self.machine.coils.c_test.hw_driver.state()
+        except AssertionError:
+            usb_failed.set()
+            raise
+
+        # pending calls fail and the error is raised in the loop
+        future = Future()
+        pump.commands.append(("driver_get_state", (), {}, future))
+        usb_failed.set()
+        self.assertIsInstance(future.exception(5), IOError)
+        self.assertFalse(pump.running)
+        self.assertFalse(pump.commands)
+        with self.assertRaises(IOError):
+            self.advance_time_and_run(.1)
+
     def test_load_wpc(self):
         # make sure p-roc properly initialises with WPC config
         pass
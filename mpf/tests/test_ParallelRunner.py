@@ -0,0 +1,53 @@
+"""Test the parallel test runner."""
+import io
+import unittest
+
+from mpf.tests.parallel_runner import ParallelTestRunner, group_tests_by_class
+
+
+class TestParallelRunner(unittest.TestCase):
+
+    class FailingTest(unittest.TestCase):
+
+        def test_pass(self):
+            pass
+
+        def test_fail(self):
+            self.fail("expected failure")
+
+    def _get_suite(self):
+        return unittest.defaultTestLoader.loadTestsFromNames([
+            "mpf.tests.test_DeviceGI",
+            "mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest"])
+
+    def test_group_tests_by_class(self):
+        classes, local_tests = group_tests_by_class(self._get_suite())
+        self.assertEqual(["mpf.tests.test_DeviceGI.TestDeviceGI",
+                          "mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest"], list(classes.keys()))
+        self.assertIn("mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest.test_fail",
+                      classes["mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest"])
+        self.assertEqual([], local_tests)
+
+    def _run(self, jobs):
+        stream = io.StringIO()
+        runner = ParallelTestRunner(jobs=jobs, stream=stream)
+        self.assertFalse(runner.run(self._get_suite()))
+        runner.print_report(3)
+        output = stream.getvalue()
+
+        self.assertIn("FAIL: mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest.test_fail", output)
+        self.assertIn("expected failure", output)
+        self.assertIn("FAILED (failures=1, errors=0)", output)
+        self.assertIn("Slowest 3 tests by boot time", output)
+
+        timings = {test_id: (boot, run) for test_id, boot, run in runner.get_timings()}
+        self.assertEqual(3, len(timings))
+        # machine tests report their boot time
+        self.assertGreater(timings["mpf.tests.test_DeviceGI.TestDeviceGI.testBasicOnAndOff"][0], 0)
+        self.assertEqual(0, timings["mpf.tests.test_ParallelRunner.TestParallelRunner.FailingTest.test_pass"][0])
+
+    def test_run_in_process(self):
+        self._run(1)
+
+    def test_run_in_pool(self):
+        self._run(2)
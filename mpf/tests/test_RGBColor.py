@@ -32,8 +32,7 @@ class TestRGBColor(unittest.TestCase):
 
     def test_off_color(self):
         # Tests the 'Off' color (nicely readable in LED show files)
-        color = RGBColor()
-        color.name = 'Off'
+        color = RGBColor('Off')
         self.assertEqual((0, 0, 0), color.rgb)
         self.assertIn(color.name, ['black', 'off'])
 
@@ -57,8 +56,7 @@ class TestRGBColor(unittest.TestCase):
         self.assertEqual((240, 248, 255), RGBColor((240, 248, 255)).rgb)
 
     def test_properties(self):
-        color1 = RGBColor()
-        color1.name = 'DarkSlateBlue'
+        color1 = RGBColor('DarkSlateBlue')
         self.assertEqual((72, 61, 139), color1.rgb)
         self.assertEqual(72, color1.red)
         self.assertEqual(61, color1.green)
@@ -66,8 +64,7 @@ class TestRGBColor(unittest.TestCase):
         self.assertEqual('darkslateblue', color1.name)
         self.assertEqual('483d8b', color1.hex)
 
-        color2 = RGBColor()
-        color2.rgb = (130, 130, 130)
+        color2 = RGBColor((130, 130, 130))
 
         color_sum = color1 + color2
         self.assertEqual((202, 191, 255), color_sum.rgb)
@@ -159,3 +156,36 @@ class TestRGBColor(unittest.TestCase):
         self.assertEqual((11, 12, 13), color3.rgb)
         self.assertEqual((0, 0, 0), color4.rgb)
         self.assertEqual((0, 0, 0), color5.rgb)
+
+    def test_interning_and_hash(self):
+        red = RGBColor("red")
+        self.assertIs(red, RGBColor("red"))
+        self.assertIs(red, RGBColor(red))
+        self.assertEqual(red, RGBColor((255, 0, 0)))
+        self.assertEqual(1, len({red, RGBColor((255, 0, 0)), RGBColor([255, 0, 0])}))
+        self.assertEqual(red, "ff0000")
+        self.assertEqual(red, (255, 0, 0))
+
+        # colors are immutable
+        with self.assertRaises(AttributeError):
+            red.red = 10
+        with self.assertRaises(AttributeError):
+            red.rgb = (1, 2, 3)
+
+        # changing a named color invalidates the cache
+        RGBColor.add_color("test_interning", (1, 2, 3))
+        self.assertEqual((1, 2, 3), RGBColor("test_interning").rgb)
+        RGBColor.add_color("test_interning", (4, 5, 6))
+        self.assertEqual((4, 5, 6), RGBColor("test_interning").rgb)
+
+        # rgba colors are not shared
+        self.assertIsNot(RGBAColor("red"), RGBAColor("red"))
+
+    def test_color_correction_cache(self):
+        profile = RGBColorCorrectionProfile()
+        color = RGBColor((169, 169, 169))
+        self.assertIs(profile.apply(color), profile.apply(color))
+        profile.generate_from_parameters()
+        self.assertEqual((91, 91, 91), profile.apply(color).rgb)
+        profile.assign_channel_lookup_table_values(0, [255] * 256)
+        self.assertEqual((255, 91, 91), profile.apply(color).rgb)
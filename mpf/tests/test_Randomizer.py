@@ -1,6 +1,9 @@
 """Test Randomizer class."""
 from mpf.tests.MpfTestCase import MpfTestCase
-from mpf.core.randomizer import Randomizer
+from mpf.core.randomizer import Randomizer, WeightTree
+
+# chi-square values which are exceeded with a probability of 0.1% by degrees of freedom
+CHI_SQUARE_CRITICAL = {1: 10.83, 2: 13.82, 3: 16.27, 4: 18.47}
 
 
 class TestRandomizer(MpfTestCase):
@@ -187,3 +190,93 @@ class TestRandomizer(MpfTestCase):
                 self.assertEqual(items[i][0], result)
 
             self.assertEqual(3, x)
+
+    def assertDistribution(self, counts, weights):
+        """Assert that counts match weights using a chi-square test."""
+        total_count = sum(counts.get(item, 0) for item in weights)
+        self.assertEqual(total_count, sum(counts.values()))
+        total_weight = sum(weights.values())
+        chi_square = 0
+        for item, weight in weights.items():
+            if not weight:
+                self.assertNotIn(item, counts)
+                continue
+            expected = total_count * weight / total_weight
+            chi_square += (counts.get(item, 0) - expected) ** 2 / expected
+        degrees_of_freedom = len([x for x in weights.values() if x]) - 1
+        self.assertLess(chi_square, CHI_SQUARE_CRITICAL[degrees_of_freedom])
+
+    @staticmethod
+    def _count(results):
+        counts = {}
+        for result in results:
+            counts[result] = counts.get(result, 0) + 1
+        return counts
+
+    def test_weight_tree(self):
+        tree = WeightTree([2, 0, 1, 3])
+        self.assertEqual(6, tree.total)
+        self.assertEqual([0, 0, 2, 3, 3, 3], [tree.find(value) for value in range(1, 7)])
+
+        tree.set(0, 0)
+        tree.set(1, 1)
+        self.assertEqual(5, tree.total)
+        self.assertEqual([1, 2, 3, 3, 3], [tree.find(value) for value in range(1, 6)])
+
+        tree.reset()
+        self.assertEqual(6, tree.total)
+        self.assertEqual(2, tree.get(0))
+
+    def test_seed(self):
+        items = [('1', 1), ('2', 6), ('3', 3), ('4', 2)]
+
+        r1 = Randomizer(items, seed=42)
+        r2 = Randomizer(items, seed=42)
+        r3 = Randomizer(items, seed=43)
+        for r in (r1, r2, r3):
+            r.force_all = True
+
+        results1 = [next(r1) for _ in range(100)]
+        self.assertEqual(results1, [next(r2) for _ in range(100)])
+        self.assertNotEqual(results1, [next(r3) for _ in range(100)])
+
+    def test_weights_distribution(self):
+        weights = {'1': 1, '2': 6, '3': 3, '4': 0, '5': 10}
+        r = Randomizer(weights, seed=1)
+        r.force_different = False
+
+        self.assertDistribution(self._count(next(r) for _ in range(50000)), weights)
+
+    def test_force_different_distribution(self):
+        weights = {'1': 1, '2': 2, '3': 3}
+        r = Randomizer(weights, seed=2)
+
+        # the next item is weighted among all but the previous one
+        counts = {item: {} for item in weights}
+        previous = next(r)
+        for _ in range(60000):
+            current = next(r)
+            counts[previous][current] = counts[previous].get(current, 0) + 1
+            previous = current
+
+        for item in weights:
+            self.assertDistribution(counts[item], {x: y for x, y in weights.items() if x != item})
+
+    def test_force_all_distribution(self):
+        weights = {'1': 1, '2': 2, '3': 3, '4': 4}
+        r = Randomizer(weights, seed=3)
+        r.force_all = True
+        r.force_different = False
+
+        # every round contains all items. they are picked weighted among the remaining ones
+        first_items = []
+        second_items = []
+        for _ in range(10000):
+            round_items = [next(r) for _ in range(4)]
+            self.assertEqual(set(weights), set(round_items))
+            first_items.append(round_items[0])
+            if round_items[0] == '4':
+                second_items.append(round_items[1])
+
+        self.assertDistribution(self._count(first_items), weights)
+        self.assertDistribution(self._count(second_items), {'1': 1, '2': 2, '3': 3})
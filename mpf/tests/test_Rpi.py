@@ -1,5 +1,7 @@
 import asyncio
 
+from mpf.core.platform import SwitchSettings, DriverSettings
+from mpf.platforms.interfaces.driver_platform_interface import PulseSettings
 from mpf.platforms.rpi import rpi
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -192,3 +194,26 @@ class TestRpi(MpfTestCase):
         self.pi.i2c_read.append(1337)
         result = self.loop.run_until_complete(device.i2c_read8(43))
         self.assertEqual(1337, result)
+
+    def test_software_rules(self):
+        # the Pi runs rules in software
+        switch = SwitchSettings(hw_switch=self.machine.switches["s_test"].hw_switch, invert=False, debounce=False)
+        coil = DriverSettings(hw_driver=self.machine.coils["c_test"].hw_driver,
+                              pulse_settings=PulseSettings(power=1.0, duration=23), hold_settings=None, recycle=False)
+        self.machine.default_platform.set_pulse_on_hit_rule(switch, coil)
+
+        self.pi.callbacks[1](gpio=1, level=1, tick=123)
+        self.machine_run()
+        self.assertSwitchState("s_test", True)
+        self.assertEqual(1, self.pi.outputs[23])
+        self.advance_time_and_run(.03)
+        self.assertEqual(0, self.pi.outputs[23])
+
+        self.pi.callbacks[1](gpio=1, level=0, tick=127)
+        self.machine_run()
+
+        self.machine.default_platform.clear_hw_rule(switch, coil)
+        self.pi.callbacks[1](gpio=1, level=1, tick=130)
+        self.machine_run()
+        self.assertSwitchState("s_test", True)
+        self.assertEqual(0, self.pi.outputs[23])
@@ -1,4 +1,5 @@
 """Test score reels."""
+import asyncio
 from unittest.mock import MagicMock
 
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
@@ -251,6 +252,94 @@ class TestScoreReels(MpfGameTestCase):
         self.assertEqual(3, player1_100.pulse.call_count)
         self.assertEqual(1, player1_10.pulse.call_count)
 
+    def testBatchedPulses(self):
+        player1_10k = self.machine.coils.player1_10k.hw_driver
+        player1_1k = self.machine.coils.player1_1k.hw_driver
+        player1_100 = self.machine.coils.player1_100.hw_driver
+        player1_10 = self.machine.coils.player1_10.hw_driver
+        player1_10k.pulse = MagicMock(return_value=10)
+        player1_1k.pulse = MagicMock(return_value=10)
+        player1_100.pulse = MagicMock(return_value=10)
+        player1_10.pulse = MagicMock(return_value=10)
+        self.start_game()
+        self.advance_time_and_run()
+
+        group = self.machine.score_reel_groups["player1"]
+        self.machine.game.player.score = 22220
+        self.advance_time_and_run(.001)
+        future = asyncio.ensure_future(group.wait_for_ready(), loop=self.machine.clock.loop)
+
+        # all reels are planned at once and spaced apart by the PSU (10ms pulse + 10ms release)
+        self.assertEqual(1, player1_10.pulse.call_count)
+        self.assertEqual(0, player1_100.pulse.call_count)
+        self.advance_time_and_run(.02)
+        self.assertEqual(1, player1_100.pulse.call_count)
+        self.assertEqual(0, player1_1k.pulse.call_count)
+        self.advance_time_and_run(.02)
+        self.assertEqual(1, player1_1k.pulse.call_count)
+        self.assertEqual(0, player1_10k.pulse.call_count)
+        self.advance_time_and_run(.02)
+        self.assertEqual(1, player1_10k.pulse.call_count)
+
+        self.release_switch_and_run("score_1p_10k_0", 0)
+        self.release_switch_and_run("score_1p_1k_0", 0)
+        self.release_switch_and_run("score_1p_100_0", 0)
+        self.release_switch_and_run("score_1p_10_0", 0)
+
+        # every reel pulses again after repeat_pulse_time in the same order
+        self.advance_time_and_run(.15)
+        self.assertEqual(2, player1_10.pulse.call_count)
+        self.assertEqual(1, player1_100.pulse.call_count)
+        self.advance_time_and_run(.02)
+        self.assertEqual(2, player1_100.pulse.call_count)
+        self.assertEqual(1, player1_1k.pulse.call_count)
+        self.advance_time_and_run(.04)
+        self.assertEqual(2, player1_1k.pulse.call_count)
+        self.assertEqual(2, player1_10k.pulse.call_count)
+
+        # the group is ready when the last reel counted its last pulse
+        self.advance_time_and_run(.1)
+        self.assertFalse(future.done())
+        self.advance_time_and_run(.1)
+        self.assertTrue(future.done())
+
+        self.advance_time_and_run(10)
+        self.assertEqual(2, player1_10k.pulse.call_count)
+        self.assertEqual(2, player1_1k.pulse.call_count)
+        self.assertEqual(2, player1_100.pulse.call_count)
+        self.assertEqual(2, player1_10.pulse.call_count)
+
+    def testPlanRespectsOtherPulses(self):
+        player1_100 = self.machine.coils.player1_100.hw_driver
+        player1_10 = self.machine.coils.player1_10.hw_driver
+        chime1 = self.machine.coils.chime1.hw_driver
+        player1_100.pulse = MagicMock(return_value=10)
+        player1_10.pulse = MagicMock(return_value=10)
+        chime1.pulse = MagicMock(return_value=10)
+        self.start_game()
+        self.advance_time_and_run()
+
+        self.machine.game.player.score = 110
+        self.advance_time_and_run(.001)
+        self.assertEqual(1, player1_10.pulse.call_count)
+        self.assertEqual(0, player1_100.pulse.call_count)
+
+        # another coil on the same PSU fires before the planned pulse of the 100 reel
+        self.advance_time_and_run(.015)
+        self.machine.coils.chime1.pulse()
+        self.advance_time_and_run(.01)
+        self.assertEqual(0, player1_100.pulse.call_count)
+
+        # the PSU delays it and the plan continues from there
+        self.advance_time_and_run(.01)
+        self.assertEqual(1, player1_100.pulse.call_count)
+
+        self.release_switch_and_run("score_1p_100_0", 0)
+        self.release_switch_and_run("score_1p_10_0", 0)
+        self.advance_time_and_run(10)
+        self.assertEqual(1, player1_100.pulse.call_count)
+        self.assertEqual(1, player1_10.pulse.call_count)
+
     def testThreePlayers(self):
         player1_10k = self.machine.coils.player1_10k.hw_driver
         player1_1k = self.machine.coils.player1_1k.hw_driver
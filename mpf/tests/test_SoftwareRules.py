@@ -0,0 +1,122 @@
+from mpf.core.platform import SwitchSettings, DriverSettings
+from mpf.platforms.interfaces.driver_platform_interface import PulseSettings, HoldSettings
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestSoftwareRules(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/software_rules/'
+
+    def test_flipper(self):
+        platform = self.machine.default_platform
+        coil = self.machine.coils.c_flipper.hw_driver
+        self.assertEqual("disabled", coil.state)
+
+        # no rule yet
+        platform.process_switch_change("1", 1)
+        self.assertEqual("disabled", coil.state)
+        platform.process_switch_change("1", 0)
+        self.advance_time_and_run()
+
+        self.machine.flippers.f_test.enable()
+        platform.process_switch_change("1", 1)
+        # the coil is enabled in the same call. no need to run the loop
+        self.assertEqual("enabled", coil.state)
+        self.advance_time_and_run()
+        self.assertSwitchState("s_flipper", 1)
+
+        platform.process_switch_change("1", 0)
+        self.assertEqual("disabled", coil.state)
+        self.advance_time_and_run()
+        self.assertSwitchState("s_flipper", 0)
+
+        self.machine.flippers.f_test.disable()
+        platform.process_switch_change("1", 1)
+        self.assertEqual("disabled", coil.state)
+        platform.process_switch_change("1", 0)
+
+        stats = platform.software_rules.get_latency_stats()
+        self.assertEqual(2, stats["activations"])
+        self.assertGreaterEqual(stats["latency_max_ms"], stats["latency_avg_ms"])
+
+    def test_switch_controller(self):
+        # switch changes from tests, the switch player and BCP go through the switch controller
+        coil = self.machine.coils.c_flipper.hw_driver
+        self.machine.flippers.f_test.enable()
+
+        self.machine.switch_controller.process_switch("s_flipper", 1)
+        # the coil is enabled in the same call. no need to run the loop
+        self.assertEqual("enabled", coil.state)
+        self.release_switch_and_run("s_flipper", .1)
+        self.assertEqual("disabled", coil.state)
+        self.hit_switch_and_run("s_flipper", .1)
+        self.assertEqual("enabled", coil.state)
+        self.release_switch_and_run("s_flipper", .1)
+        self.assertEqual("disabled", coil.state)
+
+        # duplicate switch changes are not passed to the rules
+        self.machine.switch_controller.process_switch("s_flipper", 0)
+        self.assertEqual(4, self.machine.default_platform.software_rules.get_latency_stats()["activations"])
+
+    def test_autofire_with_recycle(self):
+        platform = self.machine.default_platform
+        coil = self.machine.coils.c_pop.hw_driver
+        self.machine.autofires.ac_pop.enable()
+
+        platform.process_switch_change("3", 1)
+        self.assertEqual("pulsed_20", coil.state)
+        platform.process_switch_change("3", 0)
+        # release does not disable a pulse rule
+        self.assertEqual("pulsed_20", coil.state)
+
+        # recycle blocks the coil for 2x its pulse time
+        coil.state = "disabled"
+        self.advance_time_and_run(.01)
+        platform.process_switch_change("3", 1)
+        platform.process_switch_change("3", 0)
+        self.assertEqual("disabled", coil.state)
+
+        self.advance_time_and_run(.05)
+        platform.process_switch_change("3", 1)
+        self.assertEqual("pulsed_20", coil.state)
+
+    def test_inverted_switch(self):
+        platform = self.machine.default_platform
+        coil = self.machine.coils.c_sling.hw_driver
+        self.machine.autofires.ac_sling.enable()
+
+        # NC switch is active when it opens
+        platform.process_switch_change("4", 1)
+        self.assertEqual("disabled", coil.state)
+        platform.process_switch_change("4", 0)
+        self.assertEqual("pulsed_10", coil.state)
+
+    def test_disable_switch(self):
+        platform = self.machine.default_platform
+        coil = self.machine.coils.c_flipper.hw_driver
+        enable_switch = SwitchSettings(hw_switch=self.machine.switches.s_flipper.hw_switch, invert=False,
+                                       debounce=False)
+        disable_switch = SwitchSettings(hw_switch=self.machine.switches.s_flipper_eos.hw_switch, invert=False,
+                                        debounce=False)
+        driver = DriverSettings(hw_driver=coil, pulse_settings=PulseSettings(power=1.0, duration=30),
+                                hold_settings=HoldSettings(power=0.25), recycle=False)
+        platform.set_pulse_on_hit_and_enable_and_release_and_disable_rule(enable_switch, disable_switch, driver)
+
+        platform.process_switch_change("1", 1)
+        self.assertEqual("enabled", coil.state)
+        # eos disables the coil
+        platform.process_switch_change("2", 1)
+        self.assertEqual("disabled", coil.state)
+        platform.process_switch_change("2", 0)
+        platform.process_switch_change("1", 0)
+
+        platform.clear_hw_rule(enable_switch, driver)
+        self.assertFalse(platform.software_rules.has_rules("1"))
+        self.assertFalse(platform.software_rules.has_rules("2"))
+        platform.process_switch_change("1", 1)
+        self.assertEqual("disabled", coil.state)
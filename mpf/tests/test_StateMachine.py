@@ -45,3 +45,33 @@ class TestStateMachine(MpfFakeGameTestCase):
 
         self.post_event("state_machine_reset")
         self.assertEqual("start", self.machine.state_machines.my_state.state)
+
+    def test_state_machine_in_mode(self):
+        self.start_game()
+        self.start_mode("mode1")
+        state_machine = self.machine.state_machines.mode_state
+        self.assertEqual("start", state_machine.state)
+
+        # only transitions of the current state run
+        self.post_event("mode_proceed")
+        self.assertEqual("step1", state_machine.state)
+        self.post_event("mode_proceed")
+        self.assertEqual("step2", state_machine.state)
+        self.post_event("mode_reset")
+        self.assertEqual("start", state_machine.state)
+        self.post_event("mode_proceed")
+        self.assertEqual("step1", state_machine.state)
+
+        # events are ignored while the mode is stopped
+        self.stop_mode("mode1")
+        self.mock_event("mode_step1_start")
+        self.post_event("mode_reset")
+        self.post_event("mode_proceed")
+        self.assertEqual("step1", self.machine.game.player["state_machine_mode_state"])
+
+        # state is restored from the player
+        self.start_mode("mode1")
+        self.assertEqual("step1", state_machine.state)
+        self.assertEventNotCalled("mode_step1_start")
+        self.post_event("mode_proceed")
+        self.assertEqual("step2", state_machine.state)
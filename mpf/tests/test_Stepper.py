@@ -1,7 +1,45 @@
-from unittest.mock import MagicMock
+import asyncio
+
+from mpf.platforms.interfaces.stepper_platform_interface import StepperPlatformInterface
+from mpf.platforms.virtual import VirtualStepper
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
+class PollingStepper(StepperPlatformInterface):
+
+    """Stepper which can only be queried and completes every move after move_time."""
+
+    def __init__(self, clock, move_time):
+        self.clock = clock
+        self.move_time = move_time
+        self.position = 0
+        self.done_at = 0
+        self.checks = 0
+
+    def home(self):
+        self.move_abs_pos(0)
+
+    def move_abs_pos(self, position):
+        self.position = position
+        self.done_at = self.clock.get_time() + self.move_time
+
+    def move_rel_pos(self, position):
+        self.move_abs_pos(self.position + position)
+
+    def move_vel_mode(self, velocity):
+        pass
+
+    def current_position(self):
+        return self.position
+
+    def stop(self):
+        self.done_at = self.clock.get_time()
+
+    def is_move_complete(self):
+        self.checks += 1
+        return self.clock.get_time() >= self.done_at
+
+
 class TestStepper(MpfTestCase):
 
     def getConfigFile(self):
@@ -61,6 +99,42 @@ class TestStepper(MpfTestCase):
             commandPos = stepper.config['pos_max'] + 0.01
             stepper.move_rel_pos( commandPos )
 
+    def test_ready_event(self):
+        stepper = self.machine.steppers.linearAxis_stepper
+        self.advance_time_and_run()
+        self.mock_event("stepper_linearAxis_stepper_ready")
+
+        # virtual moves complete on the next loop iteration without polling
+        stepper.move_abs_pos(stepper.config['pos_max'])
+        stepper.move_abs_pos(stepper.config['pos_min'])
+        self.assertEventNotCalled("stepper_linearAxis_stepper_ready")
+        self.machine_run()
+        self.assertEventCalled("stepper_linearAxis_stepper_ready", 1)
+        self.assertEqual(stepper.config['pos_min'], stepper._cachedPosition)
+
+        # stopping cancels the wait
+        self.mock_event("stepper_linearAxis_stepper_ready")
+        stepper.home()
+        stepper.stop()
+        self.advance_time_and_run()
+        self.assertEventNotCalled("stepper_linearAxis_stepper_ready")
+
+    def test_ready_event_polling(self):
+        # controllers which can only be queried use the default which polls is_move_complete every 100ms
+        hw_stepper = PollingStepper(self.machine.clock, .35)
+        self.assertTrue(VirtualStepper(1).is_move_complete())
+
+        hw_stepper.move_abs_pos(10)
+        future = asyncio.ensure_future(hw_stepper.wait_for_move_completed(self.machine.clock.loop),
+                                       loop=self.machine.clock.loop)
+        self.advance_time_and_run(.3)
+        self.assertFalse(future.done())
+        self.assertEqual(4, hw_stepper.checks)
+
+        self.advance_time_and_run(.1)
+        self.assertTrue(future.done())
+        self.assertEqual(5, hw_stepper.checks)
+
     def test_rotary(self):
         stepper = self.machine.steppers.rotaryMotor_stepper
 
@@ -3,7 +3,12 @@ from mpf.tests.MpfTestCase import MpfTestCase
 class TestSwitchPlayer(MpfTestCase):
 
     def getConfigFile(self):
-        return 'config.yaml'
+        if self._testMethodName == "test_random_load":
+            return 'load_test_random.yaml'
+        elif self._testMethodName == "test_replay":
+            return 'load_test_replay.yaml'
+        else:
+            return 'config.yaml'
 
     def getMachinePath(self):
         return 'tests/machine_files/switch_player/'
@@ -57,3 +62,34 @@ class TestSwitchPlayer(MpfTestCase):
         self.assertEqual(False, self.machine.switch_controller.is_active("s_test2"))
         self.assertEqual(False, self.machine.switch_controller.is_active("s_test3"))
         self.assertEqual(3, self.hits)
+
+    def test_random_load(self):
+        self.hits = 0
+        self.machine.switch_controller.add_switch_handler("s_test3", self._sw_handler)
+        self.mock_event("switch_player_load_test_done")
+        self.machine.events.add_handler("s_test3_active", lambda **kwargs: None)
+        self.post_event("test_start")
+        self.advance_time_and_run(.5)
+        self.assertEventNotCalled("switch_player_load_test_done")
+        self.advance_time_and_run(.6)
+        self.assertEventCalled("switch_player_load_test_done")
+
+        report = self.machine.plugins[0].report
+        self.assertEqual(2000, report["edges"])
+        self.assertGreater(self.hits, 0)
+        self.assertIn("s_test3_active", report["handler_timings"])
+        self.assertIsNone(self.machine.events.handler_timings)
+
+    def test_replay(self):
+        self.hits = 0
+        self.machine.switch_controller.add_switch_handler("s_test3", self._sw_handler)
+        self.post_event("test_start")
+        self.advance_time_and_run(.1)
+        self.assertSwitchState("s_test1", 1)
+        self.assertSwitchState("s_test2", 1)
+        self.assertSwitchState("s_test3", 0)
+        self.assertEqual(1, self.hits)
+
+        self.advance_time_and_run(.5)
+        self.assertSwitchState("s_test1", 0)
+        self.assertEqual(5, self.machine.plugins[0].report["edges"])
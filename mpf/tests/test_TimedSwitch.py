@@ -19,6 +19,23 @@ class TestTimedSwitch(MpfTestCase):
         self.advance_time_and_run()
         self.assertEventCalled("mode_switch_active")
 
+        # no events when the mode is stopped
+        self.stop_mode("mode1")
+        self.release_switch_and_run("switch2", 1)
+        self.mock_event('mode_switch_active')
+        self.assertEventNotCalled("mode_switch_released")
+        self.hit_switch_and_run("switch2", 3)
+        self.assertEventNotCalled("mode_switch_active")
+
+        # switch became active before the mode started
+        self.release_switch_and_run("switch2", 1)
+        self.hit_switch_and_run("switch2", 1)
+        self.start_mode("mode1")
+        self.advance_time_and_run(.9)
+        self.assertEventNotCalled("mode_switch_active")
+        self.advance_time_and_run(.2)
+        self.assertEventCalled("mode_switch_active")
+
     def test_timed_switches(self):
 
         # test single switch
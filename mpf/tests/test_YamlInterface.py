@@ -1,8 +1,12 @@
+import fnmatch
+import os
 import unittest
 import ruamel.yaml as yaml
+from ruamel.yaml.error import MarkedYAMLError
+
 from mpf.file_interfaces.yaml_roundtrip import YamlRoundtrip
 
-from mpf.file_interfaces.yaml_interface import MpfLoader
+from mpf.file_interfaces.yaml_interface import MpfLoader, MpfCLoader, YamlInterface
 
 
 class TestYamlInterface(unittest.TestCase):
@@ -118,3 +122,45 @@ float_1: 1.0
             if not type(v) is eval(k.split('_')[0]):
                 raise AssertionError('YAML value "{}" is {}, not {}'.format(v,
                     type(v), eval(k.split('_')[0])))
+
+
+@unittest.skipIf(MpfCLoader is None, "ruamel.yaml without libyaml")
+class TestYamlCLoaderParity(unittest.TestCase):
+
+    def _load(self, data, loader):
+        try:
+            return yaml.load(data, Loader=loader)
+        except (KeyError, MarkedYAMLError) as e:
+            return type(e)
+
+    def test_default_loader(self):
+        self.assertIs(MpfCLoader, YamlInterface.loader)
+
+    def test_all_config_files(self):
+        mpf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+        files = [os.path.join(path, file_name) for path, _, file_names in os.walk(mpf_path)
+                 for file_name in fnmatch.filter(file_names, "*.yaml")]
+        self.assertTrue(files)
+        for file_name in files:
+            with open(file_name, encoding='utf8') as f:
+                data = f.read()
+            python_result = self._load(data, MpfLoader)
+            c_result = self._load(data, MpfCLoader)
+            self.assertEqual(python_result, c_result, file_name)
+            # also compare types (e.g. 1 == 1.0 == True)
+            self.assertEqual(repr(python_result), repr(c_result), file_name)
+
+    def test_implicit_types_and_errors(self):
+        documents = [
+            "str_1: +1\nstr_2: 032\nstr_3: on\nstr_4: off\nstr_5: 123e45\nstr_6: 1_000\n",
+            "bool_1: yes\nbool_2: no\nbool_3: True\nnull_1: ~\nnull_2:\n",
+            "int_1: 0x1f\nint_2: -12\nint_3: 0b101\nfloat_1: 1.5\nfloat_2: .5\ntime_1: 1:30\n",
+            "date_1: 2017-01-01\nlist_1: [a, 1, on]\n? [a, b]\n: c\n",
+            "&a x: 1\ny: *a\n<<: {z: 2}\n",
+            "a: 1\na: 2\n",
+            "a: [1\n",
+            "a: b: c\n",
+        ]
+        for document in documents:
+            self.assertEqual(repr(self._load(document, MpfLoader)), repr(self._load(document, MpfCLoader)),
+                             document)
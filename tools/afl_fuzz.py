@@ -10,6 +10,7 @@ import logging
 import mpf.core
 from mpf.core.logging import LogMixin
 from mpf.core.utility_functions import Util
+from mpf.tests import machine_snapshot
 from mpf.tests.MpfTestCase import TestMachineController
 from mpf.tests.loop import TimeTravelLoop, TestClock
 
@@ -60,6 +61,7 @@ class AflRunner(object):
 
         return {
             'force_platform': self.get_platform(),
+            'production': False,
             'mpfconfigfile': mpfconfig,
             'configfile': Util.string_to_list(self.get_config_file()),
             'debug': True,
@@ -255,6 +257,11 @@ parser.add_argument("-v",
                     action="store_true", dest="use_virtual",
                     help="Use virtual instead of smart_virtual for low-level fuzzing")
 
+parser.add_argument("-c",
+                    action="store", dest="corpus", default=None,
+                    help="Run all inputs in this folder without AFL. Every input starts in a fork of the booted "
+                         "machine")
+
 parser.add_argument("machine_path", help="Path of the machine folder",
                     default=None, nargs='?')
 
@@ -291,6 +298,19 @@ if int(args.wait) > 0:
 if args.start_game and not runner.machine.game:
     raise AssertionError("Failed to start a game.")
 
+if args.corpus:
+    failed = False
+    for input_file in sorted(os.listdir(args.corpus)):
+        with open(os.path.join(args.corpus, input_file), "rb") as f:
+            actions = f.read(-1)
+        try:
+            machine_snapshot.run_in_fork(runner.run, actions, args.find_logic_bugs)
+        except machine_snapshot.SnapshotError as e:
+            failed = True
+            print("Input {} failed:\n{}".format(input_file, e.message))
+    sys.stdout.flush()
+    os._exit(int(failed))   # NOQA
+
 # keep effort minimal after those two lines. everything before this will execute only once.
 # everything after this on every run
 